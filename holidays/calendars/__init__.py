@@ -10,19 +10,51 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from holidays.calendars.balinese_saka import _BalineseSakaLunar
-from holidays.calendars.buddhist import _BuddhistLunisolar, _CustomBuddhistHolidays
-from holidays.calendars.burmese import _BurmeseLunisolar
-from holidays.calendars.chinese import _ChineseLunisolar, _CustomChineseHolidays
-from holidays.calendars.custom import _CustomCalendar
-from holidays.calendars.gregorian import GREGORIAN_CALENDAR
-from holidays.calendars.hebrew import _HebrewLunisolar
-from holidays.calendars.hindu import _CustomHinduHolidays, _HinduLunisolar
-from holidays.calendars.islamic import _CustomIslamicHolidays, _IslamicLunar
-from holidays.calendars.julian import JULIAN_CALENDAR
-from holidays.calendars.julian_revised import JULIAN_REVISED_CALENDAR
-from holidays.calendars.mongolian import _CustomMongolianHolidays, _MongolianLunisolar
-from holidays.calendars.persian import _Persian
-from holidays.calendars.sinhala import _SinhalaLunar, _CustomSinhalaHolidays
-from holidays.calendars.thai import _ThaiLunisolar, KHMER_CALENDAR, THAI_CALENDAR
-from holidays.calendars.tibetan import _TibetanLunisolar, _CustomTibetanHolidays
+from typing import TYPE_CHECKING
+
+from holidays.helpers import _get_lazy_package_attributes
+
+# Submodules are imported on first access to their attributes at runtime.
+if TYPE_CHECKING:
+    from holidays.calendars.balinese_saka import _BalineseSakaLunar
+    from holidays.calendars.buddhist import _BuddhistLunisolar, _CustomBuddhistHolidays
+    from holidays.calendars.burmese import _BurmeseLunisolar
+    from holidays.calendars.chinese import _ChineseLunisolar, _CustomChineseHolidays
+    from holidays.calendars.custom import _CustomCalendar
+    from holidays.calendars.gregorian import GREGORIAN_CALENDAR
+    from holidays.calendars.hebrew import _HebrewLunisolar
+    from holidays.calendars.hindu import _CustomHinduHolidays, _HinduLunisolar
+    from holidays.calendars.islamic import _CustomIslamicHolidays, _IslamicLunar
+    from holidays.calendars.julian import JULIAN_CALENDAR
+    from holidays.calendars.julian_revised import JULIAN_REVISED_CALENDAR
+    from holidays.calendars.mongolian import _CustomMongolianHolidays, _MongolianLunisolar
+    from holidays.calendars.persian import _Persian
+    from holidays.calendars.sinhala import _SinhalaLunar, _CustomSinhalaHolidays
+    from holidays.calendars.thai import _ThaiLunisolar, KHMER_CALENDAR, THAI_CALENDAR
+    from holidays.calendars.tibetan import _TibetanLunisolar, _CustomTibetanHolidays
+else:
+    __getattr__, __dir__, __all__ = _get_lazy_package_attributes(
+        __name__,
+        {
+            "balinese_saka": ("_BalineseSakaLunar",),
+            "buddhist": ("_BuddhistLunisolar", "_CustomBuddhistHolidays"),
+            "burmese": ("_BurmeseLunisolar",),
+            "chinese": ("_ChineseLunisolar", "_CustomChineseHolidays"),
+            "custom": ("_CustomCalendar",),
+            # Submodules not re-exported by the package.
+            "ethiopian": (),
+            "germany_school": (),
+            "gregorian": ("GREGORIAN_CALENDAR",),
+            "hebrew": ("_HebrewLunisolar",),
+            "hindu": ("_CustomHinduHolidays", "_HinduLunisolar"),
+            "islamic": ("_CustomIslamicHolidays", "_IslamicLunar"),
+            "julian": ("JULIAN_CALENDAR",),
+            "julian_revised": ("JULIAN_REVISED_CALENDAR",),
+            "mandaean": (),
+            "mongolian": ("_CustomMongolianHolidays", "_MongolianLunisolar"),
+            "persian": ("_Persian",),
+            "sinhala": ("_SinhalaLunar", "_CustomSinhalaHolidays"),
+            "thai": ("_ThaiLunisolar", "KHMER_CALENDAR", "THAI_CALENDAR"),
+            "tibetan": ("_TibetanLunisolar", "_CustomTibetanHolidays"),
+        },
+    )
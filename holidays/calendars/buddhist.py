@@ -12,7 +12,7 @@
 
 from datetime import date
 
-from holidays.calendars.custom import _CustomCalendar
+from holidays.calendars.custom import _CustomCalendar, _get_holiday_dates
 from holidays.calendars.gregorian import MAY, JUN
 
 VESAK = "VESAK"
@@ -427,10 +427,7 @@ class _BuddhistLunisolar:
     }
 
     def _get_holiday(self, holiday: str, year: int) -> tuple[date | None, bool]:
-        estimated_dates = getattr(self, f"{holiday}_DATES", {})
-        exact_dates = getattr(self, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {})
-        dt = exact_dates.get(year, estimated_dates.get(year, ()))
-        return date(year, *dt) if dt else None, year not in exact_dates
+        return _get_holiday_dates(type(self), holiday).get_date(year)  # type: ignore[arg-type]
 
     def vesak_date(self, year: int) -> tuple[date | None, bool]:
         return self._get_holiday(VESAK, year)
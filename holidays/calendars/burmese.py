@@ -19,6 +19,34 @@ MO = 1954168.050623  # Beginning of 0 ME for MMT.
 SY = 1577917828.0 / 4320000.0  # Solar year (365.2587565 days).
 
 
+@cache
+def _get_start_dates(calendar_cls: type["_BurmeseLunisolar"]) -> tuple[date, ...]:
+    """Return the Burmese calendar years start dates.
+
+    The table is built once per calendar class by accumulating the year lengths:
+    354 days, plus 30 days for little watat and 31 days for big watat years.
+
+    Args:
+        calendar_cls:
+            The calendar class.
+
+    Returns:
+        The start dates of the `START_YEAR` - `END_YEAR` Burmese calendar years,
+        indexed by `year - START_YEAR`.
+    """
+    start_dates = []
+    delta_days = 0
+    for year in range(calendar_cls.START_YEAR, calendar_cls.END_YEAR + 1):
+        start_dates.append(_timedelta(calendar_cls.START_DATE, delta_days))
+        delta_days += 354
+        if year in calendar_cls.LITTLE_WATAT_YEARS_GREGORIAN:
+            delta_days += 30
+        elif year in calendar_cls.BIG_WATAT_YEARS_GREGORIAN:
+            delta_days += 31
+
+    return tuple(start_dates)
+
+
 class _BurmeseLunisolar:
     """Burmese Lunisolar calendar.
 
@@ -122,19 +150,11 @@ class _BurmeseLunisolar:
 
         return date(y, m, d)
 
-    @cache
     def _get_start_date(self, year: int) -> date | None:
         if year < self.START_YEAR or year > self.END_YEAR:
             return None
 
-        delta_days = 354 * (year - self.START_YEAR)
-        for iter_year in range(self.START_YEAR, year):
-            if iter_year in self.LITTLE_WATAT_YEARS_GREGORIAN:
-                delta_days += 30
-            elif iter_year in self.BIG_WATAT_YEARS_GREGORIAN:
-                delta_days += 31
-
-        return _timedelta(self.START_DATE, delta_days)
+        return _get_start_dates(type(self))[year - self.START_YEAR]  # type: ignore[arg-type]
 
     def thingyan_dates(self, year: int) -> tuple[date | None, date | None]:
         """Calculate key dates of Thingyan (Myanmar New Year festival) - Akya day
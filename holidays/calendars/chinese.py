@@ -12,7 +12,7 @@
 
 from datetime import date
 
-from holidays.calendars.custom import _CustomCalendar
+from holidays.calendars.custom import _CustomCalendar, _get_holiday_dates
 from holidays.calendars.gregorian import JAN, FEB, MAR, APR, MAY, JUN, SEP, OCT, NOV, DEC
 
 CHINESE_CALENDAR = "CHINESE_CALENDAR"
@@ -1360,21 +1360,11 @@ class _ChineseLunisolar:
     def _get_holiday(self, holiday: str, year: int, calendar=None) -> tuple[date | None, bool]:
         calendar = calendar or self.__calendar
         self.__verify_calendar(calendar)
-        confirmed_dates = getattr(
-            self, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {}
-        )
-        confirmed_years = getattr(
-            self, f"{holiday}_DATES_CONFIRMED_YEARS_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", (0, 0)
-        )
-        estimated_dates = getattr(self, f"{holiday}_DATES", {})
-        custom_calendar_dates = getattr(self, f"{calendar}_{holiday}_DATES", {})
-        dt = confirmed_dates.get(
-            year, custom_calendar_dates.get(year, estimated_dates.get(year, ()))
-        )
-        is_confirmed = year in confirmed_dates or (
-            confirmed_years[0] <= year <= confirmed_years[1]
-        )
-        return date(year, *dt) if dt else None, not is_confirmed
+        return _get_holiday_dates(
+            type(self),  # type: ignore[arg-type]
+            holiday,
+            calendar,
+        ).get_date(year)
 
     def buddha_birthday_date(self, year: int, calendar=None) -> tuple[date | None, bool]:
         return self._get_holiday(BUDDHA_BIRTHDAY, year, calendar)
@@ -10,6 +10,13 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+from array import array
+from collections.abc import Mapping
+from datetime import date
+from functools import cache
+from types import MappingProxyType
+from typing import NamedTuple
+
 
 class _CustomCalendarType(type):
     """Helper class for simple calendar customization.
@@ -32,3 +39,113 @@ class _CustomCalendarType(type):
 
 class _CustomCalendar(metaclass=_CustomCalendarType):
     pass
+
+
+# The `_HolidayDates.month_days` item for years with multiple holiday dates.
+_MULTIPLE_DATES = 0xFFFF
+
+
+class _HolidayDates(NamedTuple):
+    """Compiled dates of a calendar holiday (see `_get_holiday_dates()`)."""
+
+    start_year: int
+    """The first year of the table."""
+    month_days: array
+    """The holiday dates by `year - start_year` packed as `month << 5 | day`: `0` if
+    there is no date for the year, `_MULTIPLE_DATES` if there are more than one."""
+    confirmed_years: bytes
+    """The confirmed years flags by `year - start_year`."""
+    multiple_dates: Mapping[int, tuple[date, ...]]
+    """The holiday dates by year for years having more than one date."""
+
+    def get_date(self, year: int) -> tuple[date | None, bool]:
+        """Return the holiday date for a year along with its estimation flag."""
+        start_year, month_days, confirmed_years, _ = self
+        index = year - start_year
+        if not 0 <= index < len(month_days):
+            return None, True
+
+        month_day = month_days[index]
+        return (
+            date(year, month_day >> 5, month_day & 31)
+            if 0 < month_day < _MULTIPLE_DATES
+            else None,
+            not confirmed_years[index],
+        )
+
+    def get_dates(self, year: int) -> tuple[tuple[date, bool], ...]:
+        """Return all the holiday dates for a year along with their estimation flags."""
+        dt, is_estimated = self.get_date(year)
+        if dt is not None:
+            return ((dt, is_estimated),)
+        if year not in self.multiple_dates:
+            return ()
+
+        return tuple((dt, is_estimated) for dt in self.multiple_dates[year])
+
+
+@cache
+def _get_holiday_dates(
+    calendar_cls: type, holiday: str, calendar: str | None = None
+) -> _HolidayDates:
+    """Compile a calendar holiday dates into a compact per year table.
+
+    The dates are layered in the following order (the latter ones override the former):
+
+    * `<HOLIDAY>_DATES` - the estimated dates of the calendar;
+    * `<CALENDAR>_<HOLIDAY>_DATES` - the estimated dates of a calendar variant, if any;
+    * `<HOLIDAY>_DATES_CUSTOM_CALENDAR` - the confirmed dates of a customized calendar
+      (see `_CustomCalendar`).
+
+    The years within the `<HOLIDAY>_DATES_CONFIRMED_YEARS_CUSTOM_CALENDAR` range (if any)
+    are considered confirmed as well.
+
+    Args:
+        calendar_cls:
+            The calendar class.
+
+        holiday:
+            Holiday identifier.
+
+        calendar:
+            The calendar variant name.
+
+    Returns:
+        The compiled holiday dates.
+    """
+    postfix = _CustomCalendar.CUSTOM_ATTR_POSTFIX
+    confirmed_dates = getattr(calendar_cls, f"{holiday}_DATES_{postfix}", {})
+    year_dates = {
+        **getattr(calendar_cls, f"{holiday}_DATES", {}),
+        **(getattr(calendar_cls, f"{calendar}_{holiday}_DATES", {}) if calendar else {}),
+        **confirmed_dates,
+    }
+    confirmed_years_from, confirmed_years_to = getattr(
+        calendar_cls, f"{holiday}_DATES_CONFIRMED_YEARS_{postfix}", (0, 0)
+    )
+    confirmed_years = set(confirmed_dates)
+    if confirmed_years_to:
+        confirmed_years.update(range(confirmed_years_from, confirmed_years_to + 1))
+    if not (years := year_dates.keys() | confirmed_years):
+        return _HolidayDates(0, array("H"), b"", {})
+
+    start_year = min(years)
+    years_count = max(years) - start_year + 1
+    month_days = array("H", bytes(array("H").itemsize * years_count))
+    multiple_dates = {}
+    for year, dts in year_dates.items():
+        if not dts:
+            continue
+        if isinstance(dts[0], tuple):
+            month_days[year - start_year] = _MULTIPLE_DATES
+            multiple_dates[year] = tuple(date(year, *dt) for dt in dts)
+        else:
+            month, day = dts
+            month_days[year - start_year] = month << 5 | day
+
+    return _HolidayDates(
+        start_year,
+        month_days,
+        bytes(start_year + index in confirmed_years for index in range(years_count)),
+        MappingProxyType(multiple_dates),
+    )
@@ -13,9 +13,8 @@
 from collections.abc import Iterable
 from datetime import date
 
-from holidays.calendars.custom import _CustomCalendar
+from holidays.calendars.custom import _CustomCalendar, _get_holiday_dates
 from holidays.calendars.gregorian import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC
-from holidays.helpers import _normalize_tuple
 
 BATHUKAMMA = "BATHUKAMMA"
 BASANT_PANCHAMI = "BASANT_PANCHAMI"
@@ -1819,17 +1818,11 @@ class _HinduLunisolar:
     }
 
     def _get_holiday(self, holiday: str, year: int) -> tuple[date | None, bool]:
-        estimated_dates = getattr(self, f"{holiday}_DATES", {})
-        exact_dates = getattr(self, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {})
-        dt = exact_dates.get(year, estimated_dates.get(year, ()))
-        return date(year, *dt) if dt else None, year not in exact_dates
+        return _get_holiday_dates(type(self), holiday).get_date(year)  # type: ignore[arg-type]
 
     def _get_holiday_set(self, holiday: str, year: int) -> Iterable[tuple[date, bool]]:
-        estimated_dates = getattr(self, f"{holiday}_DATES", {})
-        exact_dates = getattr(self, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {})
-        for year in (year - 1, year):
-            for dt in _normalize_tuple(exact_dates.get(year, estimated_dates.get(year, ()))):
-                yield date(year, *dt), year not in exact_dates
+        holiday_dates = _get_holiday_dates(type(self), holiday)  # type: ignore[arg-type]
+        return holiday_dates.get_dates(year - 1) + holiday_dates.get_dates(year)
 
     def basant_panchami_date(self, year: int) -> tuple[date | None, bool]:
         return self._get_holiday(BASANT_PANCHAMI, year)
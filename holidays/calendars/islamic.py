@@ -10,8 +10,10 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from datetime import date
+from functools import cache
+from types import MappingProxyType
 
 from holidays.calendars.custom import _CustomCalendar
 from holidays.calendars.gregorian import (
@@ -58,6 +60,66 @@ SADIQ_BIRTHDAY = "SADIQ_BIRTHDAY"
 SADIQ_DEATH = "SADIQ_DEATH"
 TASUA = "TASUA"
 
+_IslamicHolidayDates = Mapping[int, tuple[tuple[date, bool], ...]]
+
+
+@cache
+def _get_holiday_dates(
+    calendar_cls: type["_IslamicLunar"], holiday: str, calendar_delta_days: int
+) -> _IslamicHolidayDates:
+    """Merge a holiday's calendar and confirmed dates into ready per year dates.
+
+    Args:
+        calendar_cls:
+            The Islamic calendar class (possibly customized).
+
+        holiday:
+            Holiday identifier.
+
+        calendar_delta_days:
+            Number of days to shift unconfirmed dates.
+
+    Returns:
+        An immutable mapping of Gregorian years to the holiday dates (from both the
+        previous and the given year) along with their estimation flags.
+    """
+    confirmed_dates = getattr(
+        calendar_cls, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {}
+    )
+    confirmed_years = _normalize_tuple(
+        getattr(
+            calendar_cls,
+            f"{holiday}_DATES_CONFIRMED_YEARS_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}",
+            (),
+        )
+    )
+    estimated_dates = getattr(calendar_cls, f"{holiday}_DATES", {})
+
+    year_dates: dict[int, tuple[tuple[date, bool], ...]] = {}
+    for year in confirmed_dates.keys() | estimated_dates.keys():
+        is_confirmed_year = year in confirmed_dates
+        is_confirmed = is_confirmed_year or any(
+            year_from <= year <= year_to for year_from, year_to in confirmed_years
+        )
+        year_dates[year] = tuple(
+            (
+                _timedelta(date(year, *dt), calendar_delta_days)
+                if calendar_delta_days and not is_confirmed_year
+                else date(year, *dt),
+                not is_confirmed,
+            )
+            for dt in _normalize_tuple(
+                confirmed_dates[year] if is_confirmed_year else estimated_dates[year]
+            )
+        )
+
+    return MappingProxyType(
+        {
+            year: year_dates.get(year - 1, ()) + year_dates.get(year, ())
+            for year in year_dates.keys() | {year + 1 for year in year_dates}
+        }
+    )
+
 
 class _IslamicLunar:
     ALI_AL_RIDA_DEATH_DATES = {
@@ -4140,7 +4202,7 @@ class _IslamicLunar:
     def _get_holiday(
         self, holiday: str, year: int, *, use_delta: bool = True
     ) -> Iterable[tuple[date, bool]]:
-        """Yield holiday dates for the specified Gregorian year.
+        """Return holiday dates for the specified Gregorian year.
 
         The method combines dates from the underlying calendar with
         country-specific confirmed dates.
@@ -4159,6 +4221,9 @@ class _IslamicLunar:
         Islamic holidays are observed on a different date than in the base
         calendar (Umm al-Qura), typically one day later.
 
+        The dates are merged once per calendar class and delta (see
+        `_get_holiday_dates()`).
+
         Args:
             holiday:
                 Holiday identifier.
@@ -4169,37 +4234,16 @@ class _IslamicLunar:
             use_delta:
                 Whether to apply the calendar delta to unconfirmed dates.
 
-        Yields:
+        Returns:
             Holiday dates together with a flag indicating whether the date is
             considered unconfirmed for the corresponding year.
         """
-        confirmed_dates = getattr(
-            self, f"{holiday}_DATES_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", {}
-        )
-        confirmed_years = _normalize_tuple(
-            getattr(
-                self, f"{holiday}_DATES_CONFIRMED_YEARS_{_CustomCalendar.CUSTOM_ATTR_POSTFIX}", ()
-            )
-        )
-        estimated_dates = getattr(self, f"{holiday}_DATES", {})
-        calendar_delta_days = self.__calendar_delta_days
-
-        for check_year in (year - 1, year):
-            is_confirmed_year = check_year in confirmed_dates
-            for dt in _normalize_tuple(
-                confirmed_dates.get(check_year, estimated_dates.get(check_year, ()))
-            ):
-                is_confirmed = is_confirmed_year or any(
-                    year_from <= check_year <= year_to for year_from, year_to in confirmed_years
-                )
-
-                holiday_date = date(check_year, *dt)
-                yield (
-                    _timedelta(holiday_date, calendar_delta_days)
-                    if calendar_delta_days and use_delta and not is_confirmed_year
-                    else holiday_date,
-                    not is_confirmed,
-                )
+        calendar_delta_days = self.__calendar_delta_days if use_delta else 0
+        return _get_holiday_dates(
+            type(self),  # type: ignore[arg-type]
+            holiday,
+            calendar_delta_days,
+        ).get(year, ())
 
     def _is_long_ramadan(self, eid_al_fitr: date) -> bool:
         """Check whether the Ramadan preceding the given Eid al-Fitr date lasted 30 days.
@@ -11,7 +11,7 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
-from functools import cache
+from functools import cache, lru_cache
 
 from holidays.calendars.gregorian import _timedelta
 
@@ -19,6 +19,80 @@ KHMER_CALENDAR = "KHMER_CALENDAR"
 THAI_CALENDAR = "THAI_CALENDAR"
 
 
+@cache
+def _get_start_dates(calendar_cls: type["_ThaiLunisolar"]) -> tuple[date, ...]:
+    """Return the Thai Lunar Calendar years start dates.
+
+    The table is built once per calendar class by accumulating the year lengths:
+    354 days, plus 30 days for Athikamat and 1 day for Athikawan years.
+
+    Args:
+        calendar_cls:
+            The calendar class.
+
+    Returns:
+        The start dates of the `START_YEAR` - `END_YEAR` Thai Lunar Calendar years,
+        indexed by `year - START_YEAR`.
+    """
+    start_dates = []
+    delta_days = 0
+    for year in range(calendar_cls.START_YEAR, calendar_cls.END_YEAR + 1):
+        start_dates.append(_timedelta(calendar_cls.START_DATE, delta_days))
+        delta_days += 354
+        if year in calendar_cls.ATHIKAMAT_YEARS_GREGORIAN:
+            delta_days += 30
+        elif year in calendar_cls.ATHIKAWAN_YEARS_GREGORIAN:
+            delta_days += 1
+
+    return tuple(start_dates)
+
+
+# The cache holds the whole supported years range of a calendar at most.
+@lru_cache(maxsize=256)
+def _get_buddhist_sabbath_dates(
+    calendar_cls: type["_ThaiLunisolar"], year: int
+) -> frozenset[date]:
+    """Return all Buddhist Sabbath (Uposatha) days in a supported Gregorian year.
+
+    Args:
+        calendar_cls:
+            The calendar class.
+
+        year:
+            The Gregorian year.
+
+    Returns:
+        A frozen set of Buddhist Sabbath dates.
+    """
+    start_date = _get_start_dates(calendar_cls)[year - calendar_cls.START_YEAR]  # type: ignore[arg-type]
+
+    # Initializes Thai lunar month lengths.
+    months = [29, 30] * 6
+    if year in calendar_cls.ATHIKAMAT_YEARS_GREGORIAN:
+        months.insert(7, 30)
+    elif year in calendar_cls.ATHIKAWAN_YEARS_GREGORIAN:
+        months[6] += 1
+    # Includes first two months of the next Thai lunar year to ensure all Buddhist Sabbaths
+    # in the Gregorian year are captured.
+    months.extend([29, 30])
+
+    buddhist_sabbaths: set[date] = set()
+    day_cursor = start_date
+    for month_days in months:
+        if day_cursor.year > year:
+            break
+        # Buddhist Sabbaths: 8 Waxing, 15 Waxing, 8 Waning, 14/15 Waning.
+        for offset in (7, 14, 22, month_days - 1):
+            buddhist_sabbath = _timedelta(day_cursor, offset)
+            if buddhist_sabbath.year == year:
+                buddhist_sabbaths.add(buddhist_sabbath)
+            elif buddhist_sabbath.year > year:
+                break
+        day_cursor = _timedelta(day_cursor, month_days)
+
+    return frozenset(buddhist_sabbaths)
+
+
 class _ThaiLunisolar:
     """Thai Lunar Calendar Holidays.
 
@@ -294,7 +368,6 @@ class _ThaiLunisolar:
                 f"Unknown calendar name: {calendar}. Use `KHMER_CALENDAR` or `THAI_CALENDAR`."
             )
 
-    @cache
     def _get_start_date(self, year: int) -> date | None:
         """Calculate the start date of that particular Thai Lunar Calendar Year.
 
@@ -312,17 +385,9 @@ class _ThaiLunisolar:
         if year < _ThaiLunisolar.START_YEAR or year > _ThaiLunisolar.END_YEAR:
             return None
 
-        delta_days = 354 * (year - _ThaiLunisolar.START_YEAR)
-        for iter_year in range(_ThaiLunisolar.START_YEAR, year):
-            if iter_year in _ThaiLunisolar.ATHIKAMAT_YEARS_GREGORIAN:
-                delta_days += 30
-            elif iter_year in _ThaiLunisolar.ATHIKAWAN_YEARS_GREGORIAN:
-                delta_days += 1
-
-        return _timedelta(_ThaiLunisolar.START_DATE, delta_days)
+        return _get_start_dates(_ThaiLunisolar)[year - _ThaiLunisolar.START_YEAR]
 
-    @cache
-    def buddhist_sabbath_dates(self, year: int) -> set[date]:
+    def buddhist_sabbath_dates(self, year: int) -> frozenset[date]:
         """Return all Buddhist Sabbath (Uposatha) days in a given Gregorian year.
 
         This function works independently of the calendar system in use,
@@ -333,38 +398,14 @@ class _ThaiLunisolar:
                 The Gregorian year.
 
         Returns:
-            A set of `date` objects representing all Buddhist Sabbath days in the specified
-            Gregorian year. Returns an empty set if the year is outside the supported range.
+            A frozen set of `date` objects representing all Buddhist Sabbath days in
+            the specified Gregorian year. Returns an empty set if the year is outside
+            the supported range.
         """
-        start_date = self._get_start_date(year)
-        if not start_date:
-            return set()
+        if year < _ThaiLunisolar.START_YEAR or year > _ThaiLunisolar.END_YEAR:
+            return frozenset()
 
-        # Initializes Thai lunar month lengths.
-        months = [29, 30] * 6
-        if year in _ThaiLunisolar.ATHIKAMAT_YEARS_GREGORIAN:
-            months.insert(7, 30)
-        elif year in _ThaiLunisolar.ATHIKAWAN_YEARS_GREGORIAN:
-            months[6] += 1
-        # Includes first two months of the next Thai lunar year to ensure all Buddhist Sabbaths
-        # in the Gregorian year are captured.
-        months.extend([29, 30])
-
-        buddhist_sabbaths: set[date] = set()
-        day_cursor = start_date
-        for month_days in months:
-            if day_cursor.year > year:
-                break
-            # Buddhist Sabbaths: 8 Waxing, 15 Waxing, 8 Waning, 14/15 Waning.
-            for offset in (7, 14, 22, month_days - 1):
-                buddhist_sabbath = _timedelta(day_cursor, offset)
-                if buddhist_sabbath.year == year:
-                    buddhist_sabbaths.add(buddhist_sabbath)
-                elif buddhist_sabbath.year > year:
-                    break
-            day_cursor = _timedelta(day_cursor, month_days)
-
-        return buddhist_sabbaths
+        return _get_buddhist_sabbath_dates(_ThaiLunisolar, year)
 
     def makha_bucha_date(self, year: int, calendar=None) -> date | None:
         """Calculate the estimated Gregorian date of Makha Bucha.
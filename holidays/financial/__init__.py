@@ -10,24 +10,34 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from holidays.financial.bolsa_mexicana_de_valores import BolsaMexicanaDeValores, XMEX, BMV
-from holidays.financial.bolsas_y_mercados_espanoles import BolsasYMercadosEspanoles, XMAD, BME
-from holidays.financial.bombay_stock_exchange import BombayStockExchange, XBOM, BSE
-from holidays.financial.brasil_bolsa_balcao import BrasilBolsaBalcao, BVMF, B3
-from holidays.financial.chicago_mercantile_exchange import ChicagoMercantileExchange, XCME, CME
-from holidays.financial.european_central_bank import EuropeanCentralBank, XECB, ECB, TAR
-from holidays.financial.germany_exchange import GermanyStockExchange, XETR, XFRA
-from holidays.financial.hong_kong_stock_exchange import HongKongStockExchange, XHKG, HKEX, SEHK
-from holidays.financial.ice_futures_europe import IceFuturesEurope, ICEFuturesEurope, IFEU
-from holidays.financial.japan_exchange import JapanExchange, XJPX, JPX, TSE, OSE
-from holidays.financial.nasdaq import NASDAQ, XNAS
-from holidays.financial.national_stock_exchange_of_india import (
-    NationalStockExchangeOfIndia,
-    XNSE,
-    NSE,
-)
-from holidays.financial.ny_stock_exchange import NewYorkStockExchange, XNYS, NYSE
-from holidays.financial.shanghai_stock_exchange import ShanghaiStockExchange, XSHG, SSE
-from holidays.financial.shenzhen_stock_exchange import ShenzhenStockExchange, XSHE, SZSE
-from holidays.financial.six_swiss_exchange import SIXSwissExchange, XSWX, SIX
-from holidays.financial.toronto_stock_exchange import TorontoStockExchange, XTSE, TSX
+from typing import TYPE_CHECKING
+
+from holidays.helpers import _get_lazy_package_attributes
+
+# Submodules are imported on first access to their attributes at runtime.
+if TYPE_CHECKING:
+    from holidays.financial.bolsa_mexicana_de_valores import BolsaMexicanaDeValores, XMEX, BMV
+    from holidays.financial.bolsas_y_mercados_espanoles import BolsasYMercadosEspanoles, XMAD, BME
+    from holidays.financial.bombay_stock_exchange import BombayStockExchange, XBOM, BSE
+    from holidays.financial.brasil_bolsa_balcao import BrasilBolsaBalcao, BVMF, B3
+    from holidays.financial.chicago_mercantile_exchange import ChicagoMercantileExchange, XCME, CME
+    from holidays.financial.european_central_bank import EuropeanCentralBank, XECB, ECB, TAR
+    from holidays.financial.germany_exchange import GermanyStockExchange, XETR, XFRA
+    from holidays.financial.hong_kong_stock_exchange import HongKongStockExchange, XHKG, HKEX, SEHK
+    from holidays.financial.ice_futures_europe import IceFuturesEurope, ICEFuturesEurope, IFEU
+    from holidays.financial.japan_exchange import JapanExchange, XJPX, JPX, TSE, OSE
+    from holidays.financial.nasdaq import NASDAQ, XNAS
+    from holidays.financial.national_stock_exchange_of_india import (
+        NationalStockExchangeOfIndia,
+        XNSE,
+        NSE,
+    )
+    from holidays.financial.ny_stock_exchange import NewYorkStockExchange, XNYS, NYSE
+    from holidays.financial.shanghai_stock_exchange import ShanghaiStockExchange, XSHG, SSE
+    from holidays.financial.shenzhen_stock_exchange import ShenzhenStockExchange, XSHE, SZSE
+    from holidays.financial.six_swiss_exchange import SIXSwissExchange, XSWX, SIX
+    from holidays.financial.toronto_stock_exchange import TorontoStockExchange, XTSE, TSX
+else:
+    from holidays.registry import FINANCIAL
+
+    __getattr__, __dir__, __all__ = _get_lazy_package_attributes(__name__, FINANCIAL)
@@ -11,6 +11,8 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from functools import cache
+from typing import Literal
 
 from dateutil.easter import EASTER_ORTHODOX, EASTER_WESTERN, easter
 
@@ -20,6 +22,32 @@ from holidays.calendars.julian import JULIAN_CALENDAR, julian_calendar_drift
 from holidays.calendars.julian_revised import JULIAN_REVISED_CALENDAR
 
 
+@cache
+def _get_easter_date(year: int, method: Literal[1, 2, 3], days: int = 0) -> date:
+    """Get a date `days` days after (before if negative) Easter Sunday.
+
+    The dates are memoized process-wide as Easter based holidays are populated
+    for the same years by many entities.
+
+    Args:
+        year:
+            The Easter Sunday year.
+
+        method:
+            The `dateutil.easter` method: `EASTER_WESTERN` or `EASTER_ORTHODOX`.
+
+        days:
+            The number of days to add to Easter Sunday date.
+
+    Returns:
+        The Easter Sunday based date.
+    """
+    if days:
+        return _timedelta(_get_easter_date(year, method), days)
+
+    return easter(year, method=method)
+
+
 class ChristianHolidays:
     """
     Christian holidays.
@@ -28,13 +56,23 @@ class ChristianHolidays:
     def __init__(self, calendar=GREGORIAN_CALENDAR) -> None:
         self.__verify_calendar(calendar)
         self.__calendar = calendar
+        self.__easter_method = self.__get_easter_method(calendar)
+
+    def __get_calendar(self, calendar=None):
+        """
+        Get verified `calendar` or the default calendar if not specified.
+        """
+        if not calendar:
+            return self.__calendar
+
+        self.__verify_calendar(calendar)
+        return calendar
 
     def __get_christmas_day(self, calendar=None):
         """
         Get Christmas Day date.
         """
-        calendar = calendar or self.__calendar
-        self.__verify_calendar(calendar)
+        calendar = self.__get_calendar(calendar)
 
         return (
             _timedelta(date(self._year, JAN, 7), julian_calendar_drift(self._year - 1))
@@ -42,18 +80,24 @@ class ChristianHolidays:
             else date(self._year, DEC, 25)
         )
 
-    def __get_easter_sunday(self, calendar=None):
+    def __get_easter_date(self, days=0, calendar=None):
         """
-        Get Easter Sunday date.
+        Get a date `days` days after (before if negative) Easter Sunday.
         """
-        calendar = calendar or self.__calendar
-        self.__verify_calendar(calendar)
-
-        return easter(
+        return _get_easter_date(
             self._year,
-            method=EASTER_WESTERN if self.__is_gregorian_calendar(calendar) else EASTER_ORTHODOX,
+            self.__get_easter_method(self.__get_calendar(calendar))
+            if calendar
+            else self.__easter_method,
+            days,
         )
 
+    def __get_easter_method(self, calendar):
+        """
+        Get Easter Sunday calculation method for `calendar`.
+        """
+        return EASTER_WESTERN if self.__is_gregorian_calendar(calendar) else EASTER_ORTHODOX
+
     @staticmethod
     def __is_ethiopian_calendar(calendar):
         """
@@ -106,7 +150,7 @@ class ChristianHolidays:
         """
         Return Easter Sunday date.
         """
-        return self.__get_easter_sunday()
+        return _get_easter_date(self._year, self.__easter_method)
 
     def _add_all_saints_day(self, name) -> date:
         """
@@ -138,7 +182,7 @@ class ChristianHolidays:
         Day, or sometimes Holy Thursday.
         https://en.wikipedia.org/wiki/Feast_of_the_Ascension
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), +39))
+        return self._add_holiday(name, self.__get_easter_date(+39, calendar))
 
     def _add_ash_monday(self, name) -> date:
         """
@@ -148,7 +192,7 @@ class ChristianHolidays:
         or Green Monday. The first day of Great Lent.
         https://en.wikipedia.org/wiki/Clean_Monday
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, -48))
+        return self._add_holiday(name, self.__get_easter_date(-48))
 
     def _add_ash_wednesday(self, name) -> date:
         """
@@ -157,7 +201,7 @@ class ChristianHolidays:
         A holy day of prayer and fasting. It marks the beginning of Lent.
         https://en.wikipedia.org/wiki/Ash_Wednesday
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, -46))
+        return self._add_holiday(name, self.__get_easter_date(-46))
 
     def _add_assumption_of_mary_day(self, name, calendar=None) -> date:
         """
@@ -168,8 +212,7 @@ class ChristianHolidays:
         her life.
         https://en.wikipedia.org/wiki/Assumption_of_Mary
         """
-        calendar = calendar or self.__calendar
-        self.__verify_calendar(calendar)
+        calendar = self.__get_calendar(calendar)
 
         return (
             self._add_holiday(
@@ -199,7 +242,7 @@ class ChristianHolidays:
         the liturgical season of Lent.
         https://en.wikipedia.org/wiki/Carnival
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, -49))
+        return self._add_holiday(name, self.__get_easter_date(-49))
 
     def _add_carnival_monday(self, name) -> date:
         """
@@ -209,7 +252,7 @@ class ChristianHolidays:
         the liturgical season of Lent.
         https://en.wikipedia.org/wiki/Carnival
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, -48))
+        return self._add_holiday(name, self.__get_easter_date(-48))
 
     def _add_carnival_tuesday(self, name) -> date:
         """
@@ -219,7 +262,7 @@ class ChristianHolidays:
         the liturgical season of Lent.
         https://en.wikipedia.org/wiki/Carnival
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, -47))
+        return self._add_holiday(name, self.__get_easter_date(-47))
 
     def _add_christmas_day(self, name, calendar=None) -> date:
         """
@@ -270,7 +313,7 @@ class ChristianHolidays:
         of Jesus Christ in the elements of the Eucharist.
         https://en.wikipedia.org/wiki/Feast_of_Corpus_Christi
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, +60))
+        return self._add_holiday(name, self.__get_easter_date(+60))
 
     def _add_easter_monday(self, name, calendar=None) -> date:
         """
@@ -281,7 +324,7 @@ class ChristianHolidays:
         some countries.
         https://en.wikipedia.org/wiki/Easter_Monday
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), +1))
+        return self._add_holiday(name, self.__get_easter_date(+1, calendar))
 
     def _add_easter_sunday(self, name, calendar=None) -> date:
         """
@@ -292,7 +335,7 @@ class ChristianHolidays:
         from the dead.
         https://en.wikipedia.org/wiki/Easter
         """
-        return self._add_holiday(name, self.__get_easter_sunday(calendar))
+        return self._add_holiday(name, self.__get_easter_date(calendar=calendar))
 
     def _add_easter_tuesday(self, name, calendar=None) -> date:
         """
@@ -301,7 +344,7 @@ class ChristianHolidays:
         Easter Tuesday is the third day of Eastertide and is a holiday in some areas.
         https://en.wikipedia.org/wiki/Easter_Tuesday
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), +2))
+        return self._add_holiday(name, self.__get_easter_date(+2, calendar))
 
     def _add_epiphany_day(self, name, calendar=None) -> date:
         """
@@ -312,8 +355,7 @@ class ChristianHolidays:
         incarnate as Jesus Christ.
         https://en.wikipedia.org/wiki/Epiphany_(holiday)
         """
-        calendar = calendar or self.__calendar
-        self.__verify_calendar(calendar)
+        calendar = self.__get_calendar(calendar)
 
         if self.__is_julian_calendar(calendar) or self.__is_ethiopian_calendar(calendar):
             dt = _timedelta(date(self._year, JAN, 19), julian_calendar_drift(self._year - 1))
@@ -350,7 +392,7 @@ class ChristianHolidays:
         Great Friday, Great and Holy Friday.
         https://en.wikipedia.org/wiki/Good_Friday
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), -2))
+        return self._add_holiday(name, self.__get_easter_date(-2, calendar))
 
     def _add_holy_saturday(self, name, calendar=None) -> date:
         """
@@ -359,7 +401,7 @@ class ChristianHolidays:
         Great and Holy Saturday is a day between Good Friday and Easter Sunday.
         https://en.wikipedia.org/wiki/Holy_Saturday
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), -1))
+        return self._add_holiday(name, self.__get_easter_date(-1, calendar))
 
     def _add_holy_thursday(self, name, calendar=None) -> date:
         """
@@ -370,7 +412,7 @@ class ChristianHolidays:
         Jesus Christ with the Apostles, as described in the canonical gospels.
         https://en.wikipedia.org/wiki/Maundy_Thursday
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), -3))
+        return self._add_holiday(name, self.__get_easter_date(-3, calendar))
 
     def _add_immaculate_conception_day(self, name) -> date:
         """
@@ -401,7 +443,7 @@ class ChristianHolidays:
         Palm Sunday marks the first day of Holy Week.
         https://en.wikipedia.org/wiki/Palm_Sunday
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), -7))
+        return self._add_holiday(name, self.__get_easter_date(-7, calendar))
 
     def _add_rejoicing_day(self, name) -> date:
         """
@@ -412,7 +454,7 @@ class ChristianHolidays:
         Pascha (Easter). In Ukrainian tradition it is called Provody.
         https://en.wikipedia.org/wiki/Radonitsa
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, +9))
+        return self._add_holiday(name, self.__get_easter_date(+9))
 
     def _add_saint_anthonys_day(self, name) -> date:
         """
@@ -503,7 +545,7 @@ class ChristianHolidays:
         Holy Spirit, is the holiday celebrated the day after Pentecost.
         https://en.wikipedia.org/wiki/Whit_Monday
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, +50))
+        return self._add_holiday(name, self.__get_easter_date(+50))
 
     def _add_pentecost(self, name, calendar=None) -> date:
         """
@@ -515,7 +557,7 @@ class ChristianHolidays:
         Feast of Weeks.
         https://en.wikipedia.org/wiki/Pentecost
         """
-        return self._add_holiday(name, _timedelta(self.__get_easter_sunday(calendar), +49))
+        return self._add_holiday(name, self.__get_easter_date(+49, calendar))
 
     def _add_trinity_sunday(self, name) -> date:
         """
@@ -525,4 +567,4 @@ class ChristianHolidays:
         after Pentecost in the Western Christian liturgical calendar, and the Sunday
         of Pentecost in Eastern Christianity.
         """
-        return self._add_holiday(name, _timedelta(self._easter_sunday, +56))
+        return self._add_holiday(name, self.__get_easter_date(+56))
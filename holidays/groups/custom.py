@@ -11,43 +11,84 @@
 #  License: MIT (see LICENSE file)
 
 from datetime import date
+from functools import cache
+from typing import Any, NamedTuple
 
-from holidays.helpers import _normalize_tuple
+from holidays.helpers import _compile_special_holidays, _normalize_tuple, _SpecialHolidaysIndex
+
+
+class _StaticHolidaysData(NamedTuple):
+    """Precompiled special and substituted holidays related data of a class."""
+
+    attributes: tuple[tuple[str, Any], ...]
+    special_holidays: dict[str, tuple[Any, _SpecialHolidaysIndex]]
+    weekend_workdays: frozenset[date]
+    has_special_holidays: bool
+    has_substituted_holidays: bool
+
+
+@cache
+def _get_static_holidays_data(cls) -> _StaticHolidaysData:
+    """Precompile special and substituted holidays related data of a class."""
+    attributes = []
+    has_special_holidays = False
+    special_holidays = {}
+    for attribute_name in cls.__dict__.keys():
+        # Special holidays.
+        if attribute_name.startswith("special_") and (value := getattr(cls, attribute_name, None)):
+            attributes.append((attribute_name, value))
+            has_special_holidays = True
+            if isinstance(value, dict):
+                special_holidays[attribute_name] = (value, _compile_special_holidays(value))
+
+        # "Substituted" labels.
+        elif attribute_name.startswith("substituted_") and (
+            value := getattr(cls, attribute_name, None)
+        ):
+            attributes.append((attribute_name, value))
+
+    # Populate substituted holidays from adjacent years.
+    has_substituted_holidays = False
+    weekend_workdays = set()
+    for special_public_holidays in getattr(cls, "special_public_holidays", {}).values():
+        for special_public_holiday in _normalize_tuple(special_public_holidays):
+            # Normally, special holiday is a 3 item tuple: (month, day, name).
+            if len(special_public_holiday) < 4:  # Skip non-substituted holidays.
+                continue
+
+            # Handle cross-year substituted holidays.
+            if len(special_public_holiday) == 5:  # The fifth element is the year.
+                _, _, from_month, from_day, from_year = special_public_holiday
+                weekend_workdays.add(date(from_year, from_month, from_day))
+
+            has_substituted_holidays = True
+
+    return _StaticHolidaysData(
+        attributes=tuple(attributes),
+        special_holidays=special_holidays,
+        weekend_workdays=frozenset(weekend_workdays),
+        has_special_holidays=has_special_holidays,
+        has_substituted_holidays=has_substituted_holidays,
+    )
 
 
 class StaticHolidays:
     """Helper class for special and substituted holidays support.
 
     Populates special and substituted holidays related data from
-    an external class.
+    an external class. The data is precompiled once per class.
     """
 
     def __init__(self, cls) -> None:
-        for attribute_name in cls.__dict__.keys():
-            # Special holidays.
-            if attribute_name.startswith("special_") and (
-                value := getattr(cls, attribute_name, None)
-            ):
-                setattr(self, attribute_name, value)
-                self.has_special_holidays = True
-
-            # "Substituted" labels.
-            elif attribute_name.startswith("substituted_") and (
-                value := getattr(cls, attribute_name, None)
-            ):
-                setattr(self, attribute_name, value)
-
-        # Populate substituted holidays from adjacent years.
-        self.weekend_workdays = set()
-        for special_public_holidays in getattr(self, "special_public_holidays", {}).values():
-            for special_public_holiday in _normalize_tuple(special_public_holidays):
-                # Normally, special holiday is a 3 item tuple: (month, day, name).
-                if len(special_public_holiday) < 4:  # Skip non-substituted holidays.
-                    continue
-
-                # Handle cross-year substituted holidays.
-                if len(special_public_holiday) == 5:  # The fifth element is the year.
-                    _, _, from_month, from_day, from_year = special_public_holiday
-                    self.weekend_workdays.add(date(from_year, from_month, from_day))
-
-                self.has_substituted_holidays = True
+        static_holidays_data = _get_static_holidays_data(cls)
+        for attribute_name, value in static_holidays_data.attributes:
+            setattr(self, attribute_name, value)
+
+        if static_holidays_data.has_special_holidays:
+            self.has_special_holidays = True
+            # Special holidays mappings along with their per-year indexes.
+            self._special_holidays = static_holidays_data.special_holidays
+
+        self.weekend_workdays = set(static_holidays_data.weekend_workdays)
+        if static_holidays_data.has_substituted_holidays:
+            self.has_substituted_holidays = True
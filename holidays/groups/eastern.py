@@ -38,15 +38,13 @@ class EasternCalendarHolidays:
         if days_delta and dt:
             dt = _timedelta(dt, days_delta)
 
+        if not dt:
+            return None
+
         return (
-            self._add_holiday(
-                self.tr(self.estimated_label) % self.tr(name)
-                if is_estimated and show_estimated
-                else name,
-                dt,
-            )
-            if dt
-            else None
+            self._add_estimated_holiday(name, dt)
+            if is_estimated and show_estimated
+            else self._add_holiday(name, dt)
         )
 
     def _add_eastern_calendar_holiday_set(
@@ -63,7 +63,7 @@ class HebrewCalendarHolidays:
         """
         return self._add_hebrew_calendar_holiday(
             name,
-            self._hebrew_calendar.lag_baomer_date(self._year),  # type: ignore[arg-type]
+            self._hebrew_calendar.lag_baomer_date(self._year),
             days_delta,
         )
 
@@ -77,7 +77,7 @@ class HebrewCalendarHolidays:
         """
         return self._add_hebrew_calendar_holiday(
             name,
-            self._hebrew_calendar.passover_date(self._year),  # type: ignore[arg-type]
+            self._hebrew_calendar.passover_date(self._year),
             days_delta,
         )
 
@@ -92,7 +92,7 @@ class HebrewCalendarHolidays:
         """
         return self._add_hebrew_calendar_holiday(
             name,
-            self._hebrew_calendar.purim_date(self._year),  # type: ignore[arg-type]
+            self._hebrew_calendar.purim_date(self._year),
         )
 
     def _add_rosh_hashanah(self, name: str, days_delta: int | Iterable[int] = 0) -> set[date]:
@@ -104,7 +104,7 @@ class HebrewCalendarHolidays:
         """
         return self._add_hebrew_calendar_holiday(
             name,
-            self._hebrew_calendar.rosh_hashanah_date(self._year),  # type: ignore[arg-type]
+            self._hebrew_calendar.rosh_hashanah_date(self._year),
             days_delta,
         )
 
@@ -118,7 +118,7 @@ class HebrewCalendarHolidays:
         """
         return self._add_hebrew_calendar_holiday(
             name,
-            self._hebrew_calendar.shavuot_date(self._year),  # type: ignore[arg-type]
+            self._hebrew_calendar.shavuot_date(self._year),
         )
 
     def _add_sukkot(self, name: str, days_delta: int | Iterable[int] = 0) -> set[date]:
@@ -131,7 +131,7 @@ class HebrewCalendarHolidays:
         """
         return self._add_hebrew_calendar_holiday(
             name,
-            self._hebrew_calendar.sukkot_date(self._year),  # type: ignore[arg-type]
+            self._hebrew_calendar.sukkot_date(self._year),
             days_delta,
         )
 
@@ -145,6 +145,6 @@ class HebrewCalendarHolidays:
         """
         return self._add_hebrew_calendar_holiday(
             name,
-            self._hebrew_calendar.yom_kippur_date(self._year),  # type: ignore[arg-type]
+            self._hebrew_calendar.yom_kippur_date(self._year),
             days_delta,
         )
@@ -10,6 +10,105 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from datetime import date
+from importlib import import_module
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+
+class _SpecialHoliday(NamedTuple):
+    """Special (one-off) holiday record."""
+
+    dt: date
+    name: str | tuple[str, str]  # Either a name or a composite label (fmt, inner).
+
+
+class _SubstitutedHoliday(NamedTuple):
+    """Substituted holiday record: a day off moved from `from_date` (a working day)."""
+
+    dt: date
+    from_date: date
+
+
+_SpecialHolidaysIndex = Mapping[int, tuple[_SpecialHoliday | _SubstitutedHoliday, ...]]
+
+
+def _compile_special_holidays(mapping: Mapping[int, Any]) -> _SpecialHolidaysIndex:
+    """Compile special holidays mapping.
+
+    :param mapping:
+        Special holidays mapping of years to (month, day, name) special holidays
+        and (to_month, to_day, from_month, from_day[, from_year]) substituted holidays.
+
+    :return:
+        A read-only mapping of years to tuples of special and substituted holiday records.
+    """
+    index: dict[int, tuple[_SpecialHoliday | _SubstitutedHoliday, ...]] = {}
+    for year, holidays_data in mapping.items():
+        records: list[_SpecialHoliday | _SubstitutedHoliday] = []
+        for data in _normalize_tuple(holidays_data):
+            if len(data) == 3:  # Special holidays.
+                month, day, name = data
+                records.append(_SpecialHoliday(date(year, month, day), name))
+            else:  # Substituted holidays.
+                to_month, to_day, from_month, from_day, *optional = data
+                records.append(
+                    _SubstitutedHoliday(
+                        date(year, to_month, to_day),
+                        date(optional[0] if optional else year, from_month, from_day),
+                    )
+                )
+        if records:
+            index[year] = tuple(records)
+
+    return MappingProxyType(index)
+
+
+def _get_lazy_package_attributes(
+    package: str, modules: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], tuple[str, ...]]:
+    """Set up on demand loading of a package submodules.
+
+    Submodules are imported on first access to one of their attributes, so that
+    importing a single country does not load all the other countries, holiday
+    groups and calendars data.
+
+    :param package:
+        The package name, e.g. `holidays.countries`.
+
+    :param modules:
+        The package submodule names mapped to the attribute names they export.
+
+    :return:
+        The package `__getattr__` and `__dir__` functions (see PEP 562) and its
+        `__all__` public attribute names.
+    """
+    attribute_modules = {name: module for module, names in modules.items() for name in names}
+
+    def getattr_(name: str) -> Any:
+        if name in attribute_modules:
+            value = getattr(import_module(f"{package}.{attribute_modules[name]}"), name)
+        elif name in modules:
+            value = import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_() -> list[str]:
+        return sorted(
+            vars(sys.modules[package]).keys() | attribute_modules.keys() | modules.keys()
+        )
+
+    return (
+        getattr_,
+        dir_,
+        tuple(name for name in attribute_modules if not name.startswith("_")),
+    )
+
 
 def _normalize_arguments(cls, value):
     """Normalize arguments.
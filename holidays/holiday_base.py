@@ -10,20 +10,33 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-__all__ = ("DateLike", "HolidayBase", "HolidaySum")
+__all__ = (
+    "CombinedWorkingDays",
+    "CompactHolidays",
+    "DateLike",
+    "FrozenHolidaysError",
+    "HolidayBase",
+    "HolidayFlags",
+    "HolidaySum",
+)
 
 import copy
+import re
+import sys
 import warnings
-from bisect import bisect_left, bisect_right
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from calendar import isleap
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from datetime import date, datetime, timedelta, timezone
-from functools import cached_property
+from functools import cache, cached_property, lru_cache, reduce
 from gettext import gettext, translation
+from heapq import merge
+from itertools import accumulate, groupby
+from operator import and_, is_, itemgetter, or_
 from pathlib import Path
-from typing import Any, Literal, Union, cast
-
-from dateutil.parser import parse
+from threading import RLock
+from typing import Any, Literal, NamedTuple, Union, cast
 
 from holidays.calendars.gregorian import (
     MON,
@@ -41,7 +54,12 @@ from holidays.calendars.gregorian import (
     WEEKDAYS,
 )
 from holidays.constants import HOLIDAY_NAME_DELIMITER, PUBLIC, DEFAULT_START_YEAR, DEFAULT_END_YEAR
-from holidays.helpers import _normalize_arguments, _normalize_tuple
+from holidays.helpers import (
+    _compile_special_holidays,
+    _normalize_arguments,
+    _SpecialHoliday,
+    _SpecialHolidaysIndex,
+)
 
 CategoryArg = str | Iterable[str]
 DateArg = date | tuple[int, int] | tuple[int, int, int]
@@ -55,6 +73,491 @@ SubstitutedHoliday = (
 )
 YearArg = int | Iterable[int]
 
+_WEEKS_REPEATER = sum(1 << (7 * week) for week in range(53))
+
+
+class HolidayFlags(NamedTuple):
+    """Flags of a holiday added by an entity (see
+    [get_flags()][holidays.holiday_base.HolidayBase.get_flags])."""
+
+    category: str
+    """The holiday category."""
+    estimated: bool = False
+    """Whether the holiday date is estimated."""
+    observed: bool = False
+    """Whether the holiday is an observed one (moved from its actual date)."""
+    substituted: bool = False
+    """Whether the holiday is a day off substituted for a working day."""
+
+
+@cache
+def _get_holiday_flags(
+    category: str, estimated: bool = False, observed: bool = False, substituted: bool = False
+) -> HolidayFlags:
+    """Return a shared `HolidayFlags` instance for the given flags."""
+    return HolidayFlags(category, estimated, observed, substituted)
+
+
+@cache
+def _merge_holiday_flags(flags_1: HolidayFlags, flags_2: HolidayFlags) -> HolidayFlags:
+    """Merge flags of the same holiday added by multiple entities.
+
+    The holiday is public if any of the entities has it as a public one (otherwise its
+    category is the alphabetically first one). It's estimated, observed or substituted
+    only if all of the entities have it as such.
+    """
+    if flags_1 == flags_2:
+        return flags_1
+
+    categories = {flags_1.category, flags_2.category}
+    return _get_holiday_flags(
+        PUBLIC if PUBLIC in categories else min(categories),
+        estimated=flags_1.estimated and flags_2.estimated,
+        observed=flags_1.observed and flags_2.observed,
+        substituted=flags_1.substituted and flags_2.substituted,
+    )
+
+
+@lru_cache
+def _compile_date_format(date_format: str) -> re.Pattern:
+    """Compile a `%Y`, `%m` and `%d` based date format into a regular expression."""
+    pattern = re.escape(date_format)
+    for directive, group in (
+        # Unlike `\d`, `[0-9]` doesn't match non-ASCII (e.g. Arabic-Indic) digits.
+        ("%Y", r"(?P<year>[0-9]{4})"),
+        ("%m", r"(?P<month>[0-9]{1,2})"),
+        ("%d", r"(?P<day>[0-9]{1,2})"),
+    ):
+        pattern = pattern.replace(directive, group)
+
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(key: str, date_formats: tuple[str, ...] = (), strict: bool = False) -> date:
+    """Parse a date string using the fast date formats first, then `dateutil`.
+
+    Args:
+        key:
+            The date string to parse.
+
+        date_formats:
+            The date formats to try before falling back to `dateutil.parser.parse()`.
+
+        strict:
+            Whether to skip the `dateutil.parser.parse()` fallback.
+
+    Returns:
+        The parsed date.
+
+    Raises:
+        ValueError:
+            If the date string cannot be parsed.
+    """
+    for date_format in date_formats:
+        if match := _compile_date_format(date_format).fullmatch(key):
+            try:
+                return date(int(match["year"]), int(match["month"]), int(match["day"]))
+            except ValueError:
+                continue
+
+    if not strict:
+        from dateutil.parser import parse
+
+        try:
+            return parse(key).date()
+        except (OverflowError, ValueError):
+            pass
+
+    raise ValueError(f"Cannot parse date from string '{key}'")
+
+
+def _get_nth_working_day(get_index: Callable[[int], array], dt: date, n: int) -> date:
+    """Find the n-th working day from a given date using cumulative working days indexes.
+
+    Args:
+        get_index:
+            The function returning the cumulative working days count index for a year.
+
+        dt:
+            The starting date.
+
+        n:
+            The number of working days to move.
+
+    Returns:
+        The calculated working day after shifting by n working days.
+    """
+    year = dt.year
+    index = get_index(year)
+    day = dt.toordinal() - date(year, 1, 1).toordinal()
+
+    if n >= 0:
+        # The working day rank (1-based) to find, counting from the year start.
+        rank = index[day + 1] + n if n else index[day] + 1
+        while rank > index[-1]:
+            rank -= index[-1]
+            year += 1
+            index = get_index(year)
+    else:
+        rank = index[day] + n + 1
+        while rank < 1:
+            year -= 1
+            index = get_index(year)
+            rank += index[-1]
+
+    return _timedelta(date(year, 1, 1), bisect_left(index, rank) - 1)
+
+
+def _get_working_days_count(get_index: Callable[[int], array], dt1: date, dt2: date) -> int:
+    """Calculate the number of working days between two dates (both included).
+
+    Args:
+        get_index:
+            The function returning the cumulative working days count index for a year.
+
+        dt1:
+            The range start date.
+
+        dt2:
+            The range end date.
+
+    Returns:
+        The total count of working days between the given dates.
+    """
+    if dt1 > dt2:
+        dt1, dt2 = dt2, dt1
+
+    year1 = dt1.year
+    year2 = dt2.year
+    index1 = get_index(year1)
+    index2 = get_index(year2)
+    day1 = dt1.toordinal() - date(year1, 1, 1).toordinal()
+    day2 = dt2.toordinal() - date(year2, 1, 1).toordinal() + 1
+    if year1 == year2:
+        return index2[day2] - index1[day1]
+
+    return (
+        index1[-1]
+        - index1[day1]
+        + sum(get_index(year)[-1] for year in range(year1 + 1, year2))
+        + index2[day2]
+    )
+
+
+def _get_working_days_bitmap(index: array) -> int:
+    """Convert a cumulative working days count index into a bitmap of working days.
+
+    The N-th bit of the bitmap is set if the N-th day (zero-based) of the year is
+    a working day.
+    """
+    bits = (
+        "1" if index[day + 1] != index[day] else "0" for day in reversed(range(len(index) - 1))
+    )
+    return int("".join(bits), 2)
+
+
+def _get_year_workweek_bitmap(year: int, weekend: Iterable[int]) -> int:
+    """Return a bitmap of the year days which don't fall on the given weekend days.
+
+    The N-th bit of the bitmap is set if the N-th day (zero-based) of the year is not
+    a weekend day.
+    """
+    first_weekday = date(year, 1, 1).weekday()
+    week = sum(
+        1 << ((weekday - first_weekday) % 7) for weekday in range(7) if weekday not in weekend
+    )
+    # Repeat the week pattern 53 times (no carries as it's 7 bits wide), then trim to the year.
+    return (week * _WEEKS_REPEATER) & ((1 << (366 if isleap(year) else 365)) - 1)
+
+
+def _get_name_matcher(holiday_name: str, lookup: NameLookup) -> Callable[[str], bool]:
+    """Return a function checking whether a name matches a given holiday name.
+
+    Args:
+        holiday_name:
+            The holiday's name to try to match.
+
+        lookup:
+            The holiday name lookup type (see `HolidayBase.get_named()`).
+
+    Returns:
+        A function returning `True` for the matching names.
+    """
+    if lookup == "icontains":
+        holiday_name_lower = holiday_name.lower()
+        return lambda name: holiday_name_lower in name.lower()
+    elif lookup == "exact":
+        return lambda name: holiday_name == name
+    elif lookup == "contains":
+        return lambda name: holiday_name in name
+    elif lookup == "startswith":
+        return lambda name: holiday_name == name[: len(holiday_name)]
+    elif lookup == "iexact":
+        holiday_name_lower = holiday_name.lower()
+        return lambda name: holiday_name_lower == name.lower()
+    elif lookup == "istartswith":
+        holiday_name_lower = holiday_name.lower()
+        return lambda name: holiday_name_lower == name[: len(holiday_name)].lower()
+
+    raise AttributeError(f"Unknown lookup type: {lookup}")
+
+
+def _get_add_holiday_method(name: str) -> Callable[["HolidayBase", str], date | None] | None:
+    """Compile an `_add_holiday_*` syntactic sugar method name into a method.
+
+    Args:
+        name:
+            The method name, e.g. `_add_holiday_jun_15` or `_add_holiday_last_mon_of_may`.
+
+    Returns:
+        A function adding a holiday of a given name for the current year (to be set
+        as the entity class method), `None` if the name doesn't match any pattern.
+    """
+    add_holiday_prefix = "_add_holiday_"
+    # Return early if prefix doesn't match to avoid patterns checks.
+    if name[: len(add_holiday_prefix)] != add_holiday_prefix:
+        return None
+
+    tokens = name.split("_")
+
+    # Handle <month> <day> patterns (e.g., _add_holiday_jun_15()).
+    if len(tokens) == 5:
+        *_, month, day = tokens
+        if month in MONTHS and day in DAYS:
+            month_number, day_number = MONTHS[month], int(day)
+            return lambda self, name: self._add_holiday(
+                name, date(self._year, month_number, day_number)
+            )
+
+    elif len(tokens) == 7:
+        # Handle <last/nth> <weekday> of <month> patterns (e.g.,
+        # _add_holiday_last_mon_of_aug() or _add_holiday_3rd_fri_of_aug()).
+        *_, number, weekday, of, month = tokens
+        if (
+            of == "of"
+            and (number == "last" or number[0].isdigit())
+            and month in MONTHS
+            and weekday in WEEKDAYS
+        ):
+            nth = -1 if number == "last" else int(number[0])
+            weekday_number, month_number = WEEKDAYS[weekday], MONTHS[month]
+            return lambda self, name: self._add_holiday(
+                name, _get_nth_weekday_of_month(nth, weekday_number, month_number, self._year)
+            )
+
+        # Handle <n> days <past/prior> easter patterns (e.g.,
+        # _add_holiday_8_days_past_easter() or
+        # _add_holiday_5_days_prior_easter()).
+        *_, days, unit, delta_direction, easter = tokens
+        if (
+            unit in {"day", "days"}
+            and delta_direction in {"past", "prior"}
+            and easter == "easter"
+            and len(days) < 3
+            and days.isdigit()
+        ):
+            delta = +int(days) if delta_direction == "past" else -int(days)
+            return lambda self, name: self._add_holiday(
+                name, _timedelta(self._easter_sunday, delta)
+            )
+
+    # Handle <n> day(s) <past/prior> <last/<nth> <weekday> of <month> patterns (e.g.,
+    # _add_holiday_1_day_past_1st_fri_of_aug() or
+    # _add_holiday_5_days_prior_last_fri_of_aug()).
+    elif len(tokens) == 10:
+        *_, days, unit, delta_direction, number, weekday, of, month = tokens
+        if (
+            unit in {"day", "days"}
+            and delta_direction in {"past", "prior"}
+            and of == "of"
+            and len(days) < 3
+            and days.isdigit()
+            and (number == "last" or number[0].isdigit())
+            and month in MONTHS
+            and weekday in WEEKDAYS
+        ):
+            delta = +int(days) if delta_direction == "past" else -int(days)
+            nth = -1 if number == "last" else int(number[0])
+            weekday_number, month_number = WEEKDAYS[weekday], MONTHS[month]
+            return lambda self, name: self._add_holiday(
+                name,
+                _timedelta(
+                    _get_nth_weekday_of_month(nth, weekday_number, month_number, self._year),
+                    delta,
+                ),
+            )
+
+    # Handle <nth> <weekday> <before/from> <month> <day> patterns (e.g.,
+    # _add_holiday_1st_mon_before_jun_15() or _add_holiday_1st_mon_from_jun_15()).
+    elif len(tokens) == 8:
+        *_, number, weekday, date_direction, month, day = tokens
+        if (
+            date_direction in {"before", "from"}
+            and number[0].isdigit()
+            and month in MONTHS
+            and weekday in WEEKDAYS
+            and day in DAYS
+        ):
+            nth = -int(number[0]) if date_direction == "before" else +int(number[0])
+            weekday_number, month_number, day_number = WEEKDAYS[weekday], MONTHS[month], int(day)
+            return lambda self, name: self._add_holiday(
+                name,
+                _get_nth_weekday_from(
+                    nth, weekday_number, date(self._year, month_number, day_number)
+                ),
+            )
+
+    return None  # No match.
+
+
+@lru_cache(maxsize=1024)
+def _get_populate_names(
+    cls: type["HolidayBase"], subdiv: str | None, categories: tuple[str, ...], observed: bool
+) -> tuple[tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]]:
+    """Get populate method and special holidays mapping names of an entity class.
+
+    Args:
+        cls:
+            The entity class.
+
+        subdiv:
+            The normalized subdivision code for subdivision holidays, `None` otherwise.
+
+        categories:
+            The requested categories in population order.
+
+        observed:
+            Whether to get observed special holidays mapping names (no methods).
+
+    Returns:
+        A tuple of the class populate method names and special holidays mapping names,
+        each paired with its category.
+    """
+    if subdiv is None:
+        method_names = (
+            (category, f"_populate_{category.lower()}_holidays") for category in categories
+        )
+        mapping_names = [(category, f"special_{category}_holidays") for category in categories]
+    else:
+        method_names = (
+            (category, f"_populate_subdiv_{subdiv}_{category.lower()}_holidays")
+            for category in categories
+        )
+        mapping_names = [
+            (category, f"special_{subdiv}_{category.lower()}_holidays") for category in categories
+        ]
+
+    if observed:
+        return (), tuple(
+            (category, f"{mapping_name}_observed") for category, mapping_name in mapping_names
+        )
+
+    return (
+        tuple(
+            (category, name)
+            for category, name in method_names
+            if callable(getattr(cls, name, None))
+        ),
+        tuple(mapping_names),
+    )
+
+
+def _to_date(key: DateLike, date_formats: tuple[str, ...] = (), strict: bool = False) -> date:
+    """Convert various date-like formats to `datetime.date`.
+
+    Args:
+        key:
+            The date-like object to convert.
+
+        date_formats:
+            The date formats to try for `str` keys (see `_parse_date_string()`).
+
+        strict:
+            Whether to skip the `dateutil.parser.parse()` fallback for `str` keys.
+
+    Returns:
+        The corresponding `datetime.date` representation.
+    """
+    # Key is `str` instance.
+    if isinstance(key, str):
+        # key possibly contains a date in YYYY-MM-DD or YYYYMMDD format.
+        if len(key) in {8, 10}:
+            try:
+                return date.fromisoformat(key)
+            except ValueError:
+                pass
+        return _parse_date_string(key, date_formats, strict)
+
+    # Key is `datetime` instance.
+    if isinstance(key, datetime):
+        return key.date()
+
+    # Must go after the `isinstance(key, datetime)` check as datetime is `date` subclass.
+    if isinstance(key, date):
+        return key
+
+    # Key is `float` or `int` instance.
+    if isinstance(key, (float, int)):
+        return datetime.fromtimestamp(key, timezone.utc).date()
+
+    # Key is not supported.
+    raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+
+class FrozenHolidaysError(TypeError, AttributeError):
+    """Raised on an attempt to modify a frozen holidays object (see
+    [freeze()][holidays.holiday_base.HolidayBase.freeze]).
+
+    It's both a `TypeError` (as raised by read-only containers) and an `AttributeError`
+    (as raised on read-only attributes assignment), so it can be caught either way.
+    """
+
+
+class _WeekendWorkdays(set[date]):
+    """Working days moved to weekends.
+
+    The `version` is incremented on each in-place modification, so the working days
+    indexes built from the set contents can be invalidated. Frozen sets (of frozen
+    objects) can't be modified.
+    """
+
+    frozen = False
+    version = 0
+
+
+def _track_changes(method_name: str) -> Callable:
+    """Return a `set` method wrapper incrementing the `_WeekendWorkdays` version."""
+    method = getattr(set, method_name)
+
+    def wrapper(self: _WeekendWorkdays, *args):
+        if self.frozen:
+            raise FrozenHolidaysError("Cannot modify `weekend_workdays` of frozen object.")
+        self.version += 1
+        return method(self, *args)
+
+    wrapper.__name__ = method_name
+    return wrapper
+
+
+for _method_name in (
+    "__iand__",
+    "__ior__",
+    "__isub__",
+    "__ixor__",
+    "add",
+    "clear",
+    "difference_update",
+    "discard",
+    "intersection_update",
+    "pop",
+    "remove",
+    "symmetric_difference_update",
+    "update",
+):
+    setattr(_WeekendWorkdays, _method_name, _track_changes(_method_name))
+del _method_name
+
 
 class HolidayBase(dict[date, str]):
     """Represent a dictionary-like collection of holidays for a specific country or region.
@@ -229,6 +732,49 @@ class HolidayBase(dict[date, str]):
     """End year of holidays presence for this entity."""
     parent_entity: type["HolidayBase"] | None = None
     """Optional parent entity to reference as a base."""
+    date_formats: tuple[str, ...] = ("%m/%d/%Y", "%m-%d-%Y", "%m.%d.%Y", "%Y/%m/%d", "%Y.%m.%d")
+    """Date string formats (using `%Y`, `%m` and `%d` directives only) tried before
+    `dateutil.parser.parse()`. Must match the `dateutil` interpretation of such strings."""
+    strict_date_parsing: bool = False
+    """Whether to accept ISO 8601 and `date_formats` date strings only, without falling
+    back to `dateutil.parser.parse()`."""
+    frozen: bool = False
+    """Whether the object is read-only (see `freeze()`)."""
+    _years_cache: Any = None
+    """Optional shared cache of computed years (see `holidays.utils.HolidaysCache`)."""
+    _hash: int | None
+    """Cached hash value of a frozen object."""
+    _populate_dispatch: dict[
+        tuple[bool, bool],
+        tuple[tuple[tuple[str, Callable], ...], tuple[tuple[str, _SpecialHolidaysIndex], ...]],
+    ]
+    """Populate methods and non-empty special holidays indexes of the requested categories
+    paired with their categories by subdivision and observed flags (see
+    `_get_populate_dispatch()`)."""
+    _special_holidays: dict[str, tuple[Any, _SpecialHolidaysIndex]] = {}
+    """Special holidays mappings along with their precompiled per-year indexes by mapping
+    attribute names (see `holidays.groups.custom.StaticHolidays`)."""
+    _category_flags: HolidayFlags
+    """Flags of the holidays being populated (their category only)."""
+    _estimated_names: dict[str, str]
+    """Base holiday names by their estimated holiday names, so that estimated holidays
+    can be recognized without parsing their names (see `_add_estimated_holiday()`)."""
+    _holiday_flags: dict[tuple[date, str], HolidayFlags]
+    """Flags of the populated holidays by their dates and names (see `get_flags()`)."""
+    _names_index: dict[str, list[tuple[int, date]]] | None
+    """Holiday dates along with their positions in the object by holiday names."""
+    _names_index_size: int
+    """The number of holidays the names index is built for."""
+    _names_lookups: dict[tuple[bool, bool], dict[str, list[str]]]
+    """Holiday names by single (split) or full names, either lowercased or not."""
+    _sorted_dates: list[date] | None
+    """Holiday dates in ascending order."""
+    _working_days_index: dict[int, array]
+    """Cumulative working days count per year: the N-th item is the number of
+    working days in the year before its N-th day (zero-based)."""
+    _workweek_bitmaps: dict[int, tuple[int, int]]
+    """The year start date ordinal along with the bitmap of the year's non-weekend days
+    per year (see `_get_workweek_bitmap()`)."""
 
     def __init__(
         self,
@@ -301,6 +847,7 @@ class HolidayBase(dict[date, str]):
                 Requested holiday categories.
         """
         super().__init__()
+        self._init_indexes()
 
         # Categories validation.
         if self.default_category and self.default_category not in self.supported_categories:
@@ -372,13 +919,15 @@ class HolidayBase(dict[date, str]):
         self.subdiv = subdiv
         self.weekend_workdays = getattr(self, "weekend_workdays", set())
         self.years = _normalize_arguments(int, years)
+        self._category_flags = _get_holiday_flags(self.default_category)
+        self._holiday_flags = {}
 
         # Configure l10n related attributes.
         self._init_translation()
 
         # Populate holidays.
         for year in self.years:
-            self._populate(year)
+            self._populate_year(year)
 
     def __add__(
         self, other: Union[int, "HolidayBase", "HolidaySum"]
@@ -435,6 +984,9 @@ class HolidayBase(dict[date, str]):
 
         return dict.__contains__(cast("dict[Any, Any]", self), self.__keytransform__(key))
 
+    def __delitem__(self, key: DateLike) -> None:
+        self.pop(key)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, HolidayBase):
             return False
@@ -450,109 +1002,12 @@ class HolidayBase(dict[date, str]):
             return self.__getattribute__(name)
         except AttributeError as e:
             # This part is responsible for _add_holiday_* syntactic sugar support.
-            add_holiday_prefix = "_add_holiday_"
-            # Raise early if prefix doesn't match to avoid patterns checks.
-            if name[: len(add_holiday_prefix)] != add_holiday_prefix:
+            if (add_holiday_method := _get_add_holiday_method(name)) is None:
                 raise e
 
-            tokens = name.split("_")
-
-            # Handle <month> <day> patterns (e.g., _add_holiday_jun_15()).
-            if len(tokens) == 5:
-                *_, month, day = tokens
-                if month in MONTHS and day in DAYS:
-                    return lambda name: self._add_holiday(
-                        name, date(self._year, MONTHS[month], int(day))
-                    )
-
-            elif len(tokens) == 7:
-                # Handle <last/nth> <weekday> of <month> patterns (e.g.,
-                # _add_holiday_last_mon_of_aug() or _add_holiday_3rd_fri_of_aug()).
-                *_, number, weekday, of, month = tokens
-                if (
-                    of == "of"
-                    and (number == "last" or number[0].isdigit())
-                    and month in MONTHS
-                    and weekday in WEEKDAYS
-                ):
-                    return lambda name: self._add_holiday(
-                        name,
-                        _get_nth_weekday_of_month(
-                            -1 if number == "last" else int(number[0]),
-                            WEEKDAYS[weekday],
-                            MONTHS[month],
-                            self._year,
-                        ),
-                    )
-
-                # Handle <n> days <past/prior> easter patterns (e.g.,
-                # _add_holiday_8_days_past_easter() or
-                # _add_holiday_5_days_prior_easter()).
-                *_, days, unit, delta_direction, easter = tokens
-                if (
-                    unit in {"day", "days"}
-                    and delta_direction in {"past", "prior"}
-                    and easter == "easter"
-                    and len(days) < 3
-                    and days.isdigit()
-                ):
-                    return lambda name: self._add_holiday(
-                        name,
-                        _timedelta(
-                            self._easter_sunday,
-                            +int(days) if delta_direction == "past" else -int(days),
-                        ),
-                    )
-
-            # Handle <n> day(s) <past/prior> <last/<nth> <weekday> of <month> patterns (e.g.,
-            # _add_holiday_1_day_past_1st_fri_of_aug() or
-            # _add_holiday_5_days_prior_last_fri_of_aug()).
-            elif len(tokens) == 10:
-                *_, days, unit, delta_direction, number, weekday, of, month = tokens
-                if (
-                    unit in {"day", "days"}
-                    and delta_direction in {"past", "prior"}
-                    and of == "of"
-                    and len(days) < 3
-                    and days.isdigit()
-                    and (number == "last" or number[0].isdigit())
-                    and month in MONTHS
-                    and weekday in WEEKDAYS
-                ):
-                    return lambda name: self._add_holiday(
-                        name,
-                        _timedelta(
-                            _get_nth_weekday_of_month(
-                                -1 if number == "last" else int(number[0]),
-                                WEEKDAYS[weekday],
-                                MONTHS[month],
-                                self._year,
-                            ),
-                            +int(days) if delta_direction == "past" else -int(days),
-                        ),
-                    )
-
-            # Handle <nth> <weekday> <before/from> <month> <day> patterns (e.g.,
-            # _add_holiday_1st_mon_before_jun_15() or _add_holiday_1st_mon_from_jun_15()).
-            elif len(tokens) == 8:
-                *_, number, weekday, date_direction, month, day = tokens
-                if (
-                    date_direction in {"before", "from"}
-                    and number[0].isdigit()
-                    and month in MONTHS
-                    and weekday in WEEKDAYS
-                    and day in DAYS
-                ):
-                    return lambda name: self._add_holiday(
-                        name,
-                        _get_nth_weekday_from(
-                            -int(number[0]) if date_direction == "before" else +int(number[0]),
-                            WEEKDAYS[weekday],
-                            date(self._year, MONTHS[month], int(day)),
-                        ),
-                    )
-
-            raise e  # No match.
+            # Make the next calls use the normal attribute lookup.
+            setattr(self.__class__, name, add_holiday_method)
+            return add_holiday_method.__get__(self)
 
     def __getitem__(self, key: DateLike) -> Any:
         if isinstance(key, slice):
@@ -578,20 +1033,61 @@ class HolidayBase(dict[date, str]):
             if diff_days < 0 <= step or diff_days >= 0 > step:
                 step = -step
 
-            return [
-                day
-                for delta_days in range(0, diff_days, step)
-                if (day := _timedelta(start, delta_days)) in self
-            ]
+            for year in range(min(start, stop).year, max(start, stop).year + 1):
+                self._expand_year(year)
+
+            sorted_dates = self._get_sorted_dates()
+            if step > 0:
+                days = sorted_dates[
+                    bisect_left(sorted_dates, start) : bisect_left(sorted_dates, stop)
+                ]
+            else:
+                days = sorted_dates[
+                    bisect_right(sorted_dates, stop) : bisect_right(sorted_dates, start)
+                ][::-1]
+
+            if step in {-1, +1}:
+                return days
+
+            return [day for day in days if (day - start).days % step == 0]
 
         return dict.__getitem__(self, self.__keytransform__(key))
 
     def __getstate__(self) -> dict[str, Any]:
         """Return the object's state for serialization."""
         state = self.__dict__.copy()
+        state["_holiday_flags"] = self._holiday_flags.copy()
         state.pop("tr", None)
+        state.pop("_lock", None)
+        state.pop("_populating_years", None)
+        state.pop("_estimated_names", None)
+        state.pop("_hash", None)
+        state.pop("_populate_dispatch", None)
+        state.pop("_special_holidays", None)
+        state.pop("_names_index", None)
+        state.pop("_names_index_size", None)
+        state.pop("_names_lookups", None)
+        state.pop("_years_cache", None)
+        state.pop("_sorted_dates", None)
+        state.pop("_weekend_workdays_version", None)
+        state.pop("_working_days_index", None)
+        state.pop("_workweek_bitmaps", None)
         return state
 
+    def __hash__(self) -> int:  # type: ignore[override]
+        if not self.frozen:
+            raise TypeError(f"unhashable type: '{self.__class__.__name__}'")
+
+        if self._hash is None:
+            self._hash = hash((frozenset(self.years), frozenset(self.items())))
+
+        return self._hash
+
+    def __ior__(self, other: Any) -> "HolidayBase":  # type: ignore[override,misc]
+        self._check_frozen()
+        self.update(other)
+        return self
+
     def __keytransform__(self, key: DateLike) -> date:
         """Convert various date-like formats to `datetime.date`.
 
@@ -610,47 +1106,16 @@ class HolidayBase(dict[date, str]):
             The corresponding `datetime.date` representation.
         """
 
-        dt: date | None = None
-        # Try to catch `date` and `str` type keys first.
+        # Try to catch `date` type keys first.
         # Using type() here to skip date subclasses.
-        # Key is `date`.
         if type(key) is date:
             dt = key
-
-        # Key is `str` instance.
-        elif isinstance(key, str):
-            # key possibly contains a date in YYYY-MM-DD or YYYYMMDD format.
-            if len(key) in {8, 10}:
-                try:
-                    dt = date.fromisoformat(key)
-                except ValueError:
-                    pass
-            if dt is None:
-                try:
-                    dt = parse(key).date()
-                except (OverflowError, ValueError):
-                    raise ValueError(f"Cannot parse date from string '{key}'")
-
-        # Key is `datetime` instance.
-        elif isinstance(key, datetime):
-            dt = key.date()
-
-        # Must go after the `isinstance(key, datetime)` check as datetime is `date` subclass.
-        elif isinstance(key, date):
-            dt = key
-
-        # Key is `float` or `int` instance.
-        elif isinstance(key, (float, int)):
-            dt = datetime.fromtimestamp(key, timezone.utc).date()
-
-        # Key is not supported.
         else:
-            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+            dt = _to_date(key, self.date_formats, self.strict_date_parsing)
 
         # Automatically expand for `expand=True` cases.
         if self.expand and dt.year not in self.years:
-            self.years.add(dt.year)
-            self._populate(dt.year)
+            self._expand_year(dt.year)
 
         return dt
 
@@ -699,26 +1164,48 @@ class HolidayBase(dict[date, str]):
         return "holidays.HolidayBase()"
 
     def __setattr__(self, key: str, value: Any) -> None:
+        if self.frozen and key in {
+            "categories",
+            "expand",
+            "frozen",
+            "language",
+            "observed",
+            "subdiv",
+            "weekend",
+            "weekend_workdays",
+            "years",
+        }:
+            raise FrozenHolidaysError(
+                f"Cannot set `{key}` of frozen `{self.__class__.__name__}` object."
+            )
+
+        if key == "weekend_workdays" and not isinstance(value, _WeekendWorkdays):
+            value = _WeekendWorkdays(value)
+
         dict.__setattr__(self, key, value)
 
+        if key == "categories":
+            self._populate_dispatch = {}
+        elif key == "weekend":
+            self._working_days_index = {}
+            self._workweek_bitmaps = {}
+        elif key == "weekend_workdays":
+            self._working_days_index = {}
+
         if self and key in {"categories", "observed"}:
-            self.clear()
-            for year in self.years:  # Re-populate holidays for each year.
-                self._populate(year)
+            with self._lock:
+                self.clear()
+                for year in self.years:  # Re-populate holidays for each year.
+                    self._populate_year(year)
 
     def __setitem__(self, key: DateLike, value: str) -> None:
-        if key in self:
-            # If there are multiple holidays on the same date
-            # order their names alphabetically.
-            holiday_names = set(self[key].split(HOLIDAY_NAME_DELIMITER))
-            holiday_names.update(value.split(HOLIDAY_NAME_DELIMITER))
-            value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
-
-        dict.__setitem__(self, self.__keytransform__(key), value)
+        self._check_frozen()
+        self._set_holiday(self.__keytransform__(key), value)
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         """Restore the object's state after deserialization."""
         self.__dict__.update(state)
+        self._init_indexes()
         self._init_translation()
 
     def __str__(self) -> str:
@@ -770,6 +1257,25 @@ class HolidayBase(dict[date, str]):
 
         return subdivision_aliases
 
+    def _init_indexes(self) -> None:
+        """Initialize lazily built lookup indexes and the lock guarding their updates."""
+        # Serializes lazy years population and index builds, so the object can be
+        # shared by multiple threads. Re-entrant as population may expand other years.
+        self._lock = RLock()
+        # Years being populated (the year is added to `years` once it's done).
+        self._populating_years: set[int] = set()
+        self._estimated_names = {}
+        self._hash = None
+        self._populate_dispatch = {}
+        self._names_index = None
+        self._names_index_size = 0
+        self._names_lookups = {}
+        self._sorted_dates = None
+        # The `weekend_workdays` version the working days indexes are built for.
+        self._weekend_workdays_version = 0
+        self._working_days_index = {}
+        self._workweek_bitmaps = {}
+
     def _init_translation(self) -> None:
         """Initialize translation function based on language settings."""
         supported_languages = set(self.supported_languages)
@@ -800,6 +1306,231 @@ class HolidayBase(dict[date, str]):
         else:
             self.tr = gettext
 
+    def _add_year(self, year: int) -> None:
+        """Populate holidays for a given year unless it's already populated.
+
+        The year is populated under the object lock and becomes visible in `years`
+        only after its population is complete.
+        """
+        with self._lock:
+            if year in self.years or year in self._populating_years:
+                return None
+
+            current_year = getattr(self, "_year", None)
+            self._populating_years.add(year)
+            try:
+                self._populate_year(year)
+            finally:
+                self._populating_years.discard(year)
+                self.years.add(year)
+                # Restore the scratch year in case of a nested population.
+                if current_year is not None:
+                    self._year = current_year
+
+    def _expand_year(self, year: int) -> None:
+        """Populate holidays for a given year if needed (for `expand=True` cases).
+
+        Already populated years are checked without locking.
+        """
+        if self.expand and year not in self.years:
+            self._add_year(year)
+
+    def _check_frozen(self) -> None:
+        """Raise an error on an attempt to modify a frozen object."""
+        if self.frozen:
+            raise FrozenHolidaysError(f"Cannot modify frozen `{self.__class__.__name__}` object.")
+
+    def _get_dates_array(self, dates: Any) -> tuple[Any, Any, Any, list[int]]:
+        """Convert dates to a NumPy array of days since epoch and populate their years.
+
+        Args:
+            dates:
+                An array-like of dates convertible to `numpy.datetime64[D]`.
+
+        Returns:
+            A tuple of the `numpy` module, the days since epoch array, the valid
+            (not `NaT`) dates mask and a sorted list of the dates unique years.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "NumPy is required for vectorized lookups: `pip install holidays[numpy]`."
+            )
+
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        is_valid = ~np.isnat(dates)
+        years = np.unique(dates[is_valid].astype("datetime64[Y]").astype(np.int64) + 1970)
+        years = years.tolist()
+        for year in years:
+            self._expand_year(year)
+
+        return np, dates.astype(np.int64), is_valid, years
+
+    def _lookup_dates_array(self, dates: Any) -> tuple[Any, Any, Any]:
+        """Look up dates in the sorted holiday dates index.
+
+        Returns:
+            A tuple of the `numpy` module, the holidays mask and the holidays positions
+            in the sorted holiday dates index.
+        """
+        np, days, is_valid, _ = self._get_dates_array(dates)
+        holiday_days = np.array(self._get_sorted_dates(), dtype="datetime64[D]").astype(np.int64)
+        if not holiday_days.size:
+            return np, np.zeros(days.shape, dtype=bool), np.zeros(days.shape, dtype=np.intp)
+
+        positions = np.minimum(np.searchsorted(holiday_days, days), holiday_days.size - 1)
+        return np, is_valid & (holiday_days[positions] == days), positions
+
+    def _get_names_index(self) -> dict[str, list[tuple[int, date]]]:
+        """Return holiday dates along with their positions in the object by holiday names."""
+        # The length check covers changes made via non-overridden dict methods.
+        if (names_index := self._names_index) is None or self._names_index_size != len(self):
+            with self._lock:
+                names_index = {}
+                for position, (dt, name) in enumerate(dict.items(self)):
+                    names_index.setdefault(name, []).append((position, dt))
+                self._names_lookups = {}
+                self._names_index_size = len(self)
+                self._names_index = names_index
+
+        return names_index
+
+    def _get_names_lookup(
+        self, split_multiple_names: bool, lowercase: bool
+    ) -> dict[str, list[str]]:
+        """Return holiday names (names index keys) by single or full names.
+
+        Args:
+            split_multiple_names:
+                Whether to use the single names (split by holiday name delimiter)
+                as keys instead of the full names.
+
+            lowercase:
+                Whether to use lowercased keys.
+
+        Returns:
+            A mapping of (optionally split and lowercased) names to holiday names.
+        """
+        names_index = self._get_names_index()
+        if (names_lookup := self._names_lookups.get((split_multiple_names, lowercase))) is None:
+            names_lookup = {}
+            for holiday_name in names_index:
+                for name in (
+                    holiday_name.split(HOLIDAY_NAME_DELIMITER)
+                    if split_multiple_names
+                    else (holiday_name,)
+                ):
+                    names_lookup.setdefault(name.lower() if lowercase else name, []).append(
+                        holiday_name
+                    )
+            self._names_lookups[(split_multiple_names, lowercase)] = names_lookup
+
+        return names_lookup
+
+    def _get_sorted_dates(self) -> list[date]:
+        """Return the holiday dates sorted in ascending order."""
+        # The length check covers changes made via non-overridden dict methods.
+        if (sorted_dates := self._sorted_dates) is None or len(sorted_dates) != len(self):
+            with self._lock:
+                self._sorted_dates = sorted_dates = sorted(self.keys())
+
+        return sorted_dates
+
+    def _get_working_days_index(self, year: int) -> array:
+        """Return the cumulative working days count index for a given year.
+
+        The year is populated first if needed (for `expand=True` cases).
+        """
+        weekend_workdays = cast("_WeekendWorkdays", self.weekend_workdays)
+        if (version := weekend_workdays.version) != self._weekend_workdays_version:
+            with self._lock:
+                self._working_days_index.clear()
+                self._weekend_workdays_version = version
+
+        if (index := self._working_days_index.get(year)) is None:
+            self._expand_year(year)
+
+            with self._lock:
+                index = array("H", (0,))
+                count = 0
+                bitmap = self._get_workweek_bitmap(year)[1]
+                dt = date(year, 1, 1)
+                for day in range(366 if isleap(year) else 365):
+                    if (
+                        not dict.__contains__(self, dt)
+                        if (bitmap >> day) & 1
+                        else dt in weekend_workdays
+                    ):
+                        count += 1
+                    index.append(count)
+                    dt = _timedelta(dt, +1)
+                self._working_days_index[year] = index
+
+        return index
+
+    def _get_populate_dispatch(
+        self, subdiv: bool = False, observed: bool = False
+    ) -> tuple[tuple[tuple[str, Callable], ...], tuple[tuple[str, _SpecialHolidaysIndex], ...]]:
+        """Get populate methods and special holidays indexes of the requested categories.
+
+        The names are resolved once per entity class, subdivision and categories,
+        the methods and special holidays indexes once per object.
+
+        Args:
+            subdiv:
+                Whether to get subdivision populate methods and mappings.
+
+            observed:
+                Whether to get observed special holidays mappings (no methods).
+
+        Returns:
+            A tuple of bound populate methods and non-empty special holidays indexes,
+            each paired with its category.
+        """
+        key = (subdiv, observed)
+        if (dispatch := self._populate_dispatch.get(key)) is None:
+            method_names, mapping_names = _get_populate_names(
+                self.__class__,
+                self._normalized_subdiv if subdiv else None,
+                tuple(self._sorted_categories),
+                observed,
+            )
+            dispatch = self._populate_dispatch[key] = (
+                tuple(
+                    (category, getattr(self, method_name))
+                    for category, method_name in method_names
+                ),
+                tuple(
+                    (category, self._get_special_holidays_index(mapping_name, mapping))
+                    for category, mapping_name in mapping_names
+                    if (mapping := getattr(self, mapping_name, None))
+                ),
+            )
+
+        return dispatch
+
+    def _get_special_holidays_index(
+        self, mapping_name: str, mapping: dict
+    ) -> _SpecialHolidaysIndex:
+        """Get special holidays per-year index, precompiled one if available.
+
+        Args:
+            mapping_name:
+                The special holidays mapping attribute name.
+
+            mapping:
+                The special holidays mapping.
+
+        Returns:
+            A read-only mapping of years to special and substituted holiday records.
+        """
+        special_holidays = self._special_holidays.get(mapping_name)
+        if special_holidays is not None and special_holidays[0] is mapping:
+            return special_holidays[1]
+
+        return _compile_special_holidays(mapping)
+
     def _is_leap_year(self) -> bool:
         """Returns True if the year is leap. Returns False otherwise."""
         return isleap(self._year)
@@ -815,7 +1546,23 @@ class HolidayBase(dict[date, str]):
         if dt.year != self._year:
             return None
 
-        self[dt] = self.tr(name)
+        holiday_name = self.tr(name)
+        self[dt] = holiday_name
+        self._holiday_flags[(dt, holiday_name)] = self._category_flags
+        return dt
+
+    def _add_estimated_holiday(self, name: str, dt: date) -> date | None:
+        """Add a holiday with an estimated date, labeled with `estimated_label`."""
+        base_name = self.tr(name)
+        estimated_name = self.tr(getattr(self, "estimated_label")) % base_name
+        self._estimated_names[estimated_name] = base_name
+
+        if self._add_holiday(estimated_name, dt) is None:
+            return None
+
+        self._holiday_flags[(dt, estimated_name)] = _get_holiday_flags(
+            self._category_flags.category, estimated=True
+        )
         return dt
 
     def _add_multiday_holiday(
@@ -849,12 +1596,12 @@ class HolidayBase(dict[date, str]):
             if (d := self._add_holiday(holiday_name, _timedelta(start_date, delta)))
         }
 
-    def _add_special_holidays(self, mapping_names, *, observed=False):
+    def _add_special_holidays(self, indexes, *, observed=False):
         """Add special holidays."""
-        for mapping_name in mapping_names:
-            for data in _normalize_tuple(getattr(self, mapping_name, {}).get(self._year, ())):
-                if len(data) == 3:  # Special holidays.
-                    month, day, name = data
+        for category, index in indexes:
+            for record in index.get(self._year, ()):
+                if isinstance(record, _SpecialHoliday):  # Special holidays.
+                    name = record.name
                     if isinstance(name, tuple):  # Composite label (fmt, inner).
                         fmt, inner = name
                         translated_name = self.tr(fmt) % self.tr(inner)
@@ -864,16 +1611,19 @@ class HolidayBase(dict[date, str]):
                             if observed
                             else self.tr(name)
                         )
-                    self._add_holiday(translated_name, month, day)
+                    if self._add_holiday(translated_name, record.dt):
+                        self._holiday_flags[(record.dt, translated_name)] = _get_holiday_flags(
+                            category, observed=observed
+                        )
                 else:  # Substituted holidays.
-                    to_month, to_day, from_month, from_day, *optional = data
-                    from_date = date(optional[0] if optional else self._year, from_month, from_day)
-                    self._add_holiday(
-                        self.tr(self.substituted_label)
-                        % from_date.strftime(self.tr(self.substituted_date_format)),
-                        to_month,
-                        to_day,
+                    from_date = record.from_date
+                    substituted_name = self.tr(self.substituted_label) % from_date.strftime(
+                        self.tr(self.substituted_date_format)
                     )
+                    if self._add_holiday(substituted_name, record.dt):
+                        self._holiday_flags[(record.dt, substituted_name)] = _get_holiday_flags(
+                            category, substituted=True
+                        )
                     # when non-working day is transferred not from weekend, but from
                     # another transferred holiday (observed).
                     if self._is_weekend(from_date):
@@ -898,6 +1648,28 @@ class HolidayBase(dict[date, str]):
     def _get_weekend(self, dt: date) -> set[int]:
         return self.weekend
 
+    def _get_workweek_bitmap(self, year: int) -> tuple[int, int]:
+        """Return the year start date ordinal and the bitmap of the year's non-weekend days.
+
+        The N-th bit of the bitmap is set if the N-th day (zero-based) of the year is not
+        a weekend day. The bitmap is built once per year: either from `weekend` or, if
+        `_get_weekend()` is overridden with date-dependent logic, day by day.
+        """
+        if (cached := self._workweek_bitmaps.get(year)) is None:
+            year_start = date(year, 1, 1)
+            if type(self)._get_weekend is HolidayBase._get_weekend:
+                bitmap = _get_year_workweek_bitmap(year, self.weekend)
+            else:
+                bits = []
+                dt = year_start
+                for _ in range(366 if isleap(year) else 365):
+                    bits.append("0" if dt.weekday() in self._get_weekend(dt) else "1")
+                    dt = _timedelta(dt, +1)
+                bitmap = int("".join(reversed(bits)), 2)
+            cached = self._workweek_bitmaps[year] = (year_start.toordinal(), bitmap)
+
+        return cached
+
     def _is_monday(self, *args) -> bool:
         return self._check_weekday(MON, *args)
 
@@ -933,7 +1705,9 @@ class HolidayBase(dict[date, str]):
         """
         dt = args if len(args) > 1 else args[0]
         dt = dt if isinstance(dt, date) else date(self._year, *dt)
-        return dt.weekday() in self._get_weekend(dt)
+        if (cached := self._workweek_bitmaps.get(dt.year)) is None:
+            cached = self._get_workweek_bitmap(dt.year)
+        return not (cached[1] >> (dt.toordinal() - cached[0])) & 1
 
     def _populate(self, year: int) -> None:
         """This is a private method that populates (generates and adds) holidays
@@ -960,35 +1734,56 @@ class HolidayBase(dict[date, str]):
         self._populate_common_holidays()
         self._populate_subdiv_holidays()
 
+    def _populate_year(self, year: int) -> None:
+        """Populate holidays for a given year, reusing shared cache results if set."""
+        if self._years_cache is None:
+            self._populate(year)
+        else:
+            self._years_cache._populate(self, year)
+
+        # Substituted holidays may affect working days of adjacent years.
+        self._working_days_index.clear()
+
+    def _set_holiday(self, dt: date, value: str) -> None:
+        """Set a holiday for a given date merging it with existing ones (no years expansion)."""
+        if (holiday_name := dict.get(self, dt)) is not None:
+            # If there are multiple holidays on the same date
+            # order their names alphabetically.
+            holiday_names = set(holiday_name.split(HOLIDAY_NAME_DELIMITER))
+            holiday_names.update(value.split(HOLIDAY_NAME_DELIMITER))
+            value = HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names))
+
+        elif (sorted_dates := self._sorted_dates) is not None:
+            insort(sorted_dates, dt)
+
+        dict.__setitem__(self, dt, value)
+        self._names_index = None
+        self._working_days_index.pop(dt.year, None)
+
     def _populate_common_holidays(self):
         """Populate entity common holidays."""
-        for category in self._sorted_categories:
-            if pch_method := getattr(self, f"_populate_{category.lower()}_holidays", None):
-                pch_method()
+        pch_methods, mappings = self._get_populate_dispatch()
+        for category, pch_method in pch_methods:
+            self._category_flags = _get_holiday_flags(category)
+            pch_method()
+        self._category_flags = _get_holiday_flags(self.default_category)
 
         if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{category}_holidays" for category in self._sorted_categories
-            )
+            self._add_special_holidays(mappings)
 
     def _populate_subdiv_holidays(self):
         """Populate entity subdivision holidays."""
         if self.subdiv is None:
             return None
 
-        for category in self._sorted_categories:
-            if asch_method := getattr(
-                self,
-                f"_populate_subdiv_{self._normalized_subdiv}_{category.lower()}_holidays",
-                None,
-            ):
-                asch_method()
+        asch_methods, mappings = self._get_populate_dispatch(subdiv=True)
+        for category, asch_method in asch_methods:
+            self._category_flags = _get_holiday_flags(category)
+            asch_method()
+        self._category_flags = _get_holiday_flags(self.default_category)
 
         if self.has_special_holidays:
-            self._add_special_holidays(
-                f"special_{self._normalized_subdiv}_{category.lower()}_holidays"
-                for category in self._sorted_categories
-            )
+            self._add_special_holidays(mappings)
 
     def append(self, *args: dict[DateLike, str] | list[DateLike] | DateLike) -> None:
         """Alias for [update()][holidays.holiday_base.HolidayBase.update] to mimic list type.
@@ -1003,10 +1798,62 @@ class HolidayBase(dict[date, str]):
         """
         return self.update(*args)
 
+    def clear(self) -> None:
+        """Remove all holidays (populated years are kept).
+
+        Raises:
+            FrozenHolidaysError: if the object is frozen.
+        """
+        self._check_frozen()
+        dict.clear(self)
+        self._holiday_flags.clear()
+        self._names_index = None
+        self._sorted_dates = None
+        self._working_days_index.clear()
+
     def copy(self):
         """Return a copy of the object."""
         return copy.copy(self)
 
+    def freeze(self, years: YearArg | None = None) -> "HolidayBase":
+        """Populate holidays for the given years and make the object read-only.
+
+        A frozen object doesn't expand to other years: dates outside of its `years`
+        are not considered holidays. Holidays and weekend workdays can't be added or
+        removed, and the `categories`, `expand`, `language`, `observed`, `subdiv`,
+        `weekend` and `weekend_workdays` attributes can't be changed: any attempt raises
+        `FrozenHolidaysError`. In return, the object is hashable and can be shared by
+        multiple threads with no locking as all its lookup indexes are built at once.
+
+        Args:
+            years:
+                The year(s) to populate holidays for in addition to already populated ones.
+
+        Returns:
+            The object itself.
+
+        Raises:
+            FrozenHolidaysError: if the object is already frozen and `years` adds new years.
+        """
+        with self._lock:
+            if not self.frozen:
+                for year in _normalize_arguments(int, years):
+                    self._add_year(year)
+                self.expand = False
+                weekend_workdays = _WeekendWorkdays(self.weekend_workdays)
+                weekend_workdays.frozen = True
+                self.weekend_workdays = weekend_workdays
+
+                self._get_sorted_dates()
+                for year in self.years:
+                    self._get_working_days_index(year)
+                self.frozen = True
+
+            elif years is not None and not _normalize_arguments(int, years) <= self.years:
+                self._check_frozen()
+
+        return self
+
     def get(self, key: DateLike, default: str | Any = None) -> str | Any:
         """Retrieve the holiday name(s) for a given date.
 
@@ -1032,6 +1879,39 @@ class HolidayBase(dict[date, str]):
         """
         return dict.get(self, self.__keytransform__(key), default)
 
+    def get_flags(self, key: DateLike) -> dict[str, HolidayFlags]:
+        """Get the flags of the holidays for a given date.
+
+        The flags are recorded while populating holidays, so holidays added to the
+        object afterwards (e.g. via `update()`) have no flags.
+
+        Args:
+            key:
+                The date expressed in one of the following types:
+
+                * `datetime.date`
+                * `datetime.datetime`
+                * `float` or `int` (Unix timestamp)
+                * `str` of any format recognized by `dateutil.parser.parse()`
+
+        Returns:
+            The holiday flags by the holiday names (in `get_list()` order), an empty
+                dictionary if the date is not a holiday.
+
+        Example:
+            >>> from holidays import country_holidays
+            >>> us_holidays = country_holidays('US', years=2021)
+            >>> us_holidays.get_flags('2021-07-05')
+            {'Independence Day (observed)': HolidayFlags(category='public', estimated=False, observed=True, substituted=False)}
+        """  # noqa: E501
+        dt = self.__keytransform__(key)
+        holiday_flags = self._holiday_flags
+        return {
+            name: flags
+            for name in self.get_list(dt)
+            if (flags := holiday_flags.get((dt, name))) is not None
+        }
+
     def get_list(self, key: DateLike) -> list[str]:
         """Retrieve all holiday names for a given date.
 
@@ -1049,6 +1929,35 @@ class HolidayBase(dict[date, str]):
         """
         return [name for name in self.get(key, "").split(HOLIDAY_NAME_DELIMITER) if name]
 
+    def get_names_array(self, dates: Any, default: str | None = None) -> Any:
+        """Retrieve the holiday names for an array of dates.
+
+        This is a vectorized version of [get()][holidays.holiday_base.HolidayBase.get].
+        Requires NumPy to be installed.
+
+        Args:
+            dates:
+                An array-like of dates convertible to `numpy.datetime64[D]`, e.g.
+                a `numpy.ndarray` of `datetime64` values or a list of `datetime.date`.
+
+            default:
+                The value to use for dates that are not holidays.
+
+        Returns:
+            A `numpy.ndarray` of `object` dtype and the same shape as `dates`
+                containing the holiday names or the `default` value.
+        """
+        np, is_holiday, positions = self._lookup_dates_array(dates)
+        names = np.full(is_holiday.shape, default, dtype=object)
+        if is_holiday.any():
+            sorted_dates = self._get_sorted_dates()
+            holiday_names = np.array(
+                [dict.__getitem__(self, dt) for dt in sorted_dates], dtype=object
+            )
+            names[is_holiday] = holiday_names[positions[is_holiday]]
+
+        return names
+
     def get_named(
         self,
         holiday_name: str,
@@ -1080,35 +1989,29 @@ class HolidayBase(dict[date, str]):
         Returns:
             A list of all holiday dates matching the provided holiday name.
         """
-        holiday_name_dates = (
-            ((k, name) for k, v in self.items() for name in v.split(HOLIDAY_NAME_DELIMITER))
-            if split_multiple_names
-            else ((k, v) for k, v in self.items())
-        )
-
-        if lookup == "icontains":
-            holiday_name_lower = holiday_name.lower()
-            return [dt for dt, name in holiday_name_dates if holiday_name_lower in name.lower()]
-        elif lookup == "exact":
-            return [dt for dt, name in holiday_name_dates if holiday_name == name]
-        elif lookup == "contains":
-            return [dt for dt, name in holiday_name_dates if holiday_name in name]
-        elif lookup == "startswith":
-            return [
-                dt for dt, name in holiday_name_dates if holiday_name == name[: len(holiday_name)]
-            ]
-        elif lookup == "iexact":
-            holiday_name_lower = holiday_name.lower()
-            return [dt for dt, name in holiday_name_dates if holiday_name_lower == name.lower()]
-        elif lookup == "istartswith":
-            holiday_name_lower = holiday_name.lower()
-            return [
-                dt
-                for dt, name in holiday_name_dates
-                if holiday_name_lower == name[: len(holiday_name)].lower()
+        names_index = self._get_names_index()
+        if lookup in {"exact", "iexact"}:
+            lowercase = lookup == "iexact"
+            names = self._get_names_lookup(split_multiple_names, lowercase).get(
+                holiday_name.lower() if lowercase else holiday_name, []
+            )
+        else:
+            # Match each distinct name once rather than each date's name.
+            is_matching = _get_name_matcher(holiday_name, lookup)
+            names = [
+                full_name
+                for name, full_names in self._get_names_lookup(
+                    split_multiple_names, lowercase=False
+                ).items()
+                if is_matching(name)
+                for full_name in full_names
             ]
 
-        raise AttributeError(f"Unknown lookup type: {lookup}")
+        if len(names) == 1:
+            return [dt for _, dt in names_index[names[0]]]
+
+        # Keep the dates in the object order.
+        return [dt for _, dt in merge(*(names_index[name] for name in names))]
 
     def get_closest_holiday(
         self,
@@ -1136,15 +2039,9 @@ class HolidayBase(dict[date, str]):
             raise AttributeError(f"Unknown direction: {direction}")
 
         dt = self.__keytransform__(target_date or datetime.now().date())
-        if self.expand:
-            if direction == "forward" and (next_year := dt.year + 1) not in self.years:
-                self.years.add(next_year)
-                self._populate(next_year)
-            elif direction == "backward" and (previous_year := dt.year - 1) not in self.years:
-                self.years.add(previous_year)
-                self._populate(previous_year)
-
-        sorted_dates = sorted(self.keys())
+        self._expand_year(dt.year + 1 if direction == "forward" else dt.year - 1)
+
+        sorted_dates = self._get_sorted_dates()
         position = (
             bisect_right(sorted_dates, dt)
             if direction == "forward"
@@ -1173,14 +2070,7 @@ class HolidayBase(dict[date, str]):
         Returns:
             The calculated working day after shifting by n working days.
         """
-        direction = +1 if n >= 0 else -1
-        dt = self.__keytransform__(key)
-        for _ in range(abs(n) or 1):
-            if n:
-                dt = _timedelta(dt, direction)
-            while not self.is_working_day(dt):
-                dt = _timedelta(dt, direction)
-        return dt
+        return _get_nth_working_day(self._get_working_days_index, self.__keytransform__(key), n)
 
     def get_working_days_count(self, start: DateLike, end: DateLike) -> int:
         """Calculate the number of working days between two dates.
@@ -1198,12 +2088,25 @@ class HolidayBase(dict[date, str]):
         Returns:
             The total count of working days between the given dates.
         """
-        dt1 = self.__keytransform__(start)
-        dt2 = self.__keytransform__(end)
-        if dt1 > dt2:
-            dt1, dt2 = dt2, dt1
-        days = (dt2 - dt1).days + 1
-        return sum(self.is_working_day(_timedelta(dt1, n)) for n in range(days))
+        return _get_working_days_count(
+            self._get_working_days_index, self.__keytransform__(start), self.__keytransform__(end)
+        )
+
+    def is_holiday_array(self, dates: Any) -> Any:
+        """Check which dates of an array are holidays.
+
+        This is a vectorized version of the `in` operator. Requires NumPy to be installed.
+
+        Args:
+            dates:
+                An array-like of dates convertible to `numpy.datetime64[D]`, e.g.
+                a `numpy.ndarray` of `datetime64` values or a list of `datetime.date`.
+
+        Returns:
+            A boolean `numpy.ndarray` of the same shape as `dates`; `NaT` values are
+                never holidays.
+        """
+        return self._lookup_dates_array(dates)[1]
 
     def is_weekend(self, key: DateLike) -> bool:
         """Check if the given date's week day is a weekend day.
@@ -1228,7 +2131,46 @@ class HolidayBase(dict[date, str]):
             True if the date is a working day, False if it is a holiday or weekend.
         """
         dt = self.__keytransform__(key)
-        return dt in self.weekend_workdays if self._is_weekend(dt) else dt not in self
+        return (
+            dt in self.weekend_workdays
+            if self._is_weekend(dt)
+            else not dict.__contains__(cast("dict[Any, Any]", self), dt)
+        )
+
+    def is_working_day_array(self, dates: Any) -> Any:
+        """Check which dates of an array are working days.
+
+        This is a vectorized version of
+        [is_working_day()][holidays.holiday_base.HolidayBase.is_working_day].
+        Requires NumPy to be installed.
+
+        Args:
+            dates:
+                An array-like of dates convertible to `numpy.datetime64[D]`, e.g.
+                a `numpy.ndarray` of `datetime64` values or a list of `datetime.date`.
+
+        Returns:
+            A boolean `numpy.ndarray` of the same shape as `dates`; `NaT` values are
+                never working days.
+        """
+        np, days, is_valid, years = self._get_dates_array(dates)
+        if not years:
+            return np.zeros(days.shape, dtype=bool)
+
+        # Working day flags for every day from the first to the last year.
+        start_year = years[0]
+        years_set = set(years)
+        is_working_day = np.concatenate(
+            [
+                np.diff(np.frombuffer(self._get_working_days_index(year), dtype=np.uint16))
+                if year in years_set
+                else np.zeros(366 if isleap(year) else 365, dtype=np.uint16)
+                for year in range(start_year, years[-1] + 1)
+            ]
+        ).astype(bool)
+        offsets = np.where(is_valid, days - (date(start_year, 1, 1) - date(1970, 1, 1)).days, 0)
+
+        return is_valid & is_working_day[offsets]
 
     def pop(self, key: DateLike, default: str | Any = None) -> str | Any:
         """Remove a holiday for a given date and return its name.
@@ -1255,11 +2197,19 @@ class HolidayBase(dict[date, str]):
 
         Raises:
             KeyError: if date is not a holiday and default is not given.
+
+            FrozenHolidaysError: if the object is frozen.
         """
+        self._check_frozen()
+        dt = self.__keytransform__(key)
+        if (sorted_dates := self._sorted_dates) is not None and dict.__contains__(self, dt):
+            del sorted_dates[bisect_left(sorted_dates, dt)]
+        self._names_index = None
+        self._working_days_index.pop(dt.year, None)
         if default is None:
-            return dict.pop(self, self.__keytransform__(key))
+            return dict.pop(self, dt)
 
-        return dict.pop(self, self.__keytransform__(key), default)
+        return dict.pop(self, dt, default)
 
     def pop_named(self, holiday_name: str, lookup: NameLookup = "icontains") -> list[date]:
         """Remove all holidays matching the given name.
@@ -1287,7 +2237,10 @@ class HolidayBase(dict[date, str]):
 
         Raises:
             KeyError: if date is not a holiday.
+
+            FrozenHolidaysError: if the object is frozen.
         """
+        self._check_frozen()
         use_exact_name = HOLIDAY_NAME_DELIMITER in holiday_name
         if not (
             dts := self.get_named(
@@ -1296,45 +2249,68 @@ class HolidayBase(dict[date, str]):
         ):
             raise KeyError(holiday_name)
 
+        is_matching = _get_name_matcher(holiday_name, lookup)
         popped = []
-        for dt in dts:
-            holiday_names = self[dt].split(HOLIDAY_NAME_DELIMITER)
-            self.pop(dt)
+        # A date is listed once per its matching name.
+        for dt in dict.fromkeys(dts):
+            holiday_names = self.pop(dt).split(HOLIDAY_NAME_DELIMITER)
             popped.append(dt)
 
             # Keep the rest of holidays falling on the same date.
             if use_exact_name:
                 continue
-            if lookup == "icontains":
-                holiday_name_lower = holiday_name.lower()
-                holiday_names = [
-                    name for name in holiday_names if holiday_name_lower not in name.lower()
-                ]
-            elif lookup == "iexact":
-                holiday_name_lower = holiday_name.lower()
-                holiday_names = [
-                    name for name in holiday_names if holiday_name_lower != name.lower()
-                ]
-            elif lookup == "istartswith":
-                holiday_name_lower = holiday_name.lower()
-                holiday_names = [
-                    name
-                    for name in holiday_names
-                    if holiday_name_lower != name[: len(holiday_name)].lower()
-                ]
-            elif lookup == "contains":
-                holiday_names = [name for name in holiday_names if holiday_name not in name]
-            elif lookup == "exact":
-                holiday_names = [name for name in holiday_names if holiday_name != name]
-            else:  # startswith
-                holiday_names = [
-                    name for name in holiday_names if holiday_name != name[: len(holiday_name)]
-                ]
-            if holiday_names:
+            if holiday_names := [name for name in holiday_names if not is_matching(name)]:
                 self[dt] = HOLIDAY_NAME_DELIMITER.join(holiday_names)
 
         return popped
 
+    def popitem(self) -> tuple[date, str]:
+        """Remove the last added holiday and return its date and name.
+
+        Returns:
+            A tuple of the removed holiday date and name.
+
+        Raises:
+            KeyError: if the object is empty.
+
+            FrozenHolidaysError: if the object is frozen.
+        """
+        self._check_frozen()
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+
+        dt = next(reversed(self.keys()))
+        return dt, self.pop(dt)
+
+    def setdefault(self, key: DateLike, default: str = "Holiday") -> str:  # type: ignore[override]
+        """Return the holiday name for a given date, setting it to `default` if missing.
+
+        Args:
+            key:
+                The date expressed in one of the following types:
+
+                * `datetime.date`
+                * `datetime.datetime`
+                * `float` or `int` (Unix timestamp)
+                * `str` of any format recognized by `dateutil.parser.parse()`
+
+            default:
+                The holiday name to set if the date is not a holiday.
+
+        Returns:
+            The holiday name for the date.
+
+        Raises:
+            FrozenHolidaysError: if the object is frozen.
+        """
+        self._check_frozen()
+        dt = self.__keytransform__(key)
+        if (holiday_name := dict.get(self, dt)) is not None:
+            return holiday_name
+
+        self[dt] = default
+        return default
+
     def update(  # type: ignore[override]
         self, *args: dict[DateLike, str] | list[DateLike] | DateLike
     ) -> None:
@@ -1471,6 +2447,349 @@ class HolidaySum(HolidayBase):
         self.supported_languages = (h1_language,) if h1_language else ()
 
     def _populate(self, year):
+        # Also take holidays of the adjacent years the object doesn't hold
+        # (e.g. observed ones) as operands may add them for the requested year.
+        start = date(year if year - 1 in self.years else year - 1, 1, 1)
+        end = date(year + 1 if year + 1 in self.years else year + 2, 1, 1)
+
+        holiday_flags: dict[tuple[date, str], HolidayFlags] = {}
+        operands_holidays = []
         for operand in self.holidays:
-            operand._populate(year)
-            self.update(cast("dict[DateLike, str]", operand))
+            # Frozen operands provide their populated years only.
+            if not operand.frozen:
+                operand._add_year(year)
+
+            sorted_dates = operand._get_sorted_dates()
+            operand_holidays = [
+                (dt, dict.__getitem__(operand, dt))
+                for dt in sorted_dates[
+                    bisect_left(sorted_dates, start) : bisect_left(sorted_dates, end)
+                ]
+            ]
+            operands_holidays.append(operand_holidays)
+
+            # Take flags of the merged holidays only, combining flags of shared ones.
+            operand_flags = operand._holiday_flags
+            for dt, holiday_name in operand_holidays:
+                for name in holiday_name.split(HOLIDAY_NAME_DELIMITER):
+                    if (flags := operand_flags.get(key := (dt, name))) is not None:
+                        holiday_flags[key] = (
+                            _merge_holiday_flags(holiday_flags[key], flags)
+                            if key in holiday_flags
+                            else flags
+                        )
+        self._holiday_flags.update(holiday_flags)
+
+        # Merge the operands holidays ordered by date.
+        for dt, holidays in groupby(merge(*operands_holidays), key=itemgetter(0)):
+            holiday_names = {
+                name
+                for _, holiday_name in holidays
+                for name in holiday_name.split(HOLIDAY_NAME_DELIMITER)
+            }
+            self._set_holiday(dt, HOLIDAY_NAME_DELIMITER.join(sorted(holiday_names)))
+
+
+class CombinedWorkingDays:
+    """Combine working days of multiple holiday collections.
+
+    Unlike [`HolidaySum`][holidays.holiday_base.HolidaySum], which merges holiday names,
+    the combination respects each entity's own weekends and working days moved to
+    weekends. A day is a working day of the combination if it's a working day:
+
+    * for all of the entities (`closed="any"`, closed if any of the entities is closed);
+    * for at least one of the entities (`closed="all"`, closed if all of them are closed).
+
+    Working days of each entity are kept as a bitmap per year, the bitmaps are combined
+    with AND/OR operations and turned into a cumulative working days count index.
+
+    Example:
+
+        >>> from holidays import CombinedWorkingDays, country_holidays, financial_holidays
+        >>> settlement_days = CombinedWorkingDays(
+        ...     country_holidays('US'), country_holidays('GB'), financial_holidays('XNYS')
+        ... )
+        >>> settlement_days.is_working_day('2024-05-27')
+        False
+        >>> settlement_days.get_nth_working_day('2024-05-24', 1)
+        datetime.date(2024, 5, 28)
+    """
+
+    entities: tuple[HolidayBase, ...]
+    """The holiday collections combined."""
+    closed: Literal["all", "any"]
+    """Whether a day is closed if any (`any`) or all (`all`) of the entities are closed."""
+
+    def __init__(self, *entities: HolidayBase, closed: Literal["all", "any"] = "any") -> None:
+        """
+        Args:
+            entities:
+                The [`HolidayBase`][holidays.holiday_base.HolidayBase] objects to combine.
+
+            closed:
+                Either `any` (a working day for all of the entities) or `all`
+                (a working day for at least one of the entities).
+        """
+        if not entities:
+            raise ValueError("At least one holidays object must be provided.")
+
+        if closed not in {"all", "any"}:
+            raise ValueError(f"Unknown closed type: {closed}")
+
+        self.entities = entities
+        self.closed = closed
+        # The entities working days indexes, bitmaps and their combined cumulative
+        # working days count index per year.
+        self._working_days_index: dict[int, tuple[tuple[array, ...], list[int], array]] = {}
+
+    def _get_working_days_index(self, year: int) -> array:
+        """Return the combined cumulative working days count index for a given year."""
+        if (cached := self._working_days_index.get(year)) is not None:
+            cached_indexes, bitmaps, index = cached
+            # Entities rebuild their indexes on changes.
+            entities_indexes = (entity._get_working_days_index(year) for entity in self.entities)
+            if all(map(is_, entities_indexes, cached_indexes)):
+                return index
+        else:
+            cached_indexes, bitmaps = (), []
+
+        indexes = tuple(entity._get_working_days_index(year) for entity in self.entities)
+
+        # Rebuild bitmaps of the entities which indexes have changed only.
+        bitmaps = [
+            bitmaps[idx]
+            if idx < len(cached_indexes) and cached_indexes[idx] is entity_index
+            else _get_working_days_bitmap(entity_index)
+            for idx, entity_index in enumerate(indexes)
+        ]
+        bitmap = reduce(and_ if self.closed == "any" else or_, bitmaps)
+        days = len(indexes[0]) - 1
+        index = array("H", accumulate(map(int, f"{bitmap:0{days}b}"[::-1]), initial=0))
+        self._working_days_index[year] = (indexes, bitmaps, index)
+
+        return index
+
+    def _to_date(self, key: DateLike) -> date:
+        """Convert a date-like object to `datetime.date` (see `HolidayBase.__keytransform__()`)."""
+        if type(key) is date:
+            return key
+
+        entity = self.entities[0]
+        return _to_date(key, entity.date_formats, entity.strict_date_parsing)
+
+    def get_nth_working_day(self, key: DateLike, n: int) -> date:
+        """Find the n-th working day of the combination from a given date.
+
+        Moves forward if n is positive, or backward if n is negative.
+        If n is 0, returns the given date if it is a working day; otherwise the next working day.
+
+        Args:
+            key:
+                The starting date.
+
+            n:
+                The number of working days to move. Positive values move forward,
+                negative values move backward.
+
+        Returns:
+            The calculated working day after shifting by n working days.
+        """
+        return _get_nth_working_day(self._get_working_days_index, self._to_date(key), n)
+
+    def get_working_days_count(self, start: DateLike, end: DateLike) -> int:
+        """Calculate the number of working days of the combination between two dates.
+
+        The date range works in a closed interval fashion [start, end] so both
+        endpoints are included.
+
+        Args:
+            start:
+                The range start date.
+
+            end:
+                The range end date.
+
+        Returns:
+            The total count of working days between the given dates.
+        """
+        return _get_working_days_count(
+            self._get_working_days_index, self._to_date(start), self._to_date(end)
+        )
+
+    def is_working_day(self, key: DateLike) -> bool:
+        """Check if the given date is a working day of the combination.
+
+        Args:
+            key:
+                The date to check.
+
+        Returns:
+            True if the date is a working day, False otherwise.
+        """
+        dt = self._to_date(key)
+        index = self._get_working_days_index(dt.year)
+        day = dt.toordinal() - date(dt.year, 1, 1).toordinal()
+        return index[day + 1] != index[day]
+
+
+class CompactHolidays(Mapping[date, str]):
+    """A read-only, memory efficient snapshot of a holidays object.
+
+    Holiday dates are stored as a sorted array of ordinals, and holiday names as an
+    array of indexes into a table of unique (interned) names. Such an object takes
+    several times less memory than its source, which is handy for keeping holidays of
+    many entities and years in memory at once.
+
+    The object supports the read-only mapping API of its source (date-like keys, `get()`,
+    `get_list()`, `get_named()`, etc). It doesn't expand to other years: dates outside
+    of the source object populated years are not considered holidays.
+
+    Example:
+
+        >>> from holidays import CompactHolidays, country_holidays
+        >>> us_holidays = CompactHolidays(country_holidays('US', years=range(1950, 2051)))
+        >>> us_holidays['2050-07-04']
+        'Independence Day'
+        >>> us_holidays.get_named('Independence Day')[:2]
+        [datetime.date(1950, 7, 4), datetime.date(1951, 7, 4)]
+    """
+
+    names: tuple[str, ...]
+    """Unique holiday names in alphabetical order."""
+    years: frozenset[int]
+    """The years calculated."""
+    date_formats: tuple[str, ...]
+    """Date string formats tried before `dateutil.parser.parse()`."""
+    strict_date_parsing: bool
+    """Whether to accept ISO 8601 and `date_formats` date strings only."""
+
+    def __init__(self, instance: HolidayBase) -> None:
+        """
+        Args:
+            instance:
+                [`HolidayBase`][holidays.holiday_base.HolidayBase] object
+                containing holiday data.
+        """
+        holidays = sorted(dict.items(instance))
+        self.names = tuple(sorted({sys.intern(name) for _, name in holidays}))
+        name_indexes = {name: idx for idx, name in enumerate(self.names)}
+        self.years = frozenset(instance.years)
+        self.date_formats = instance.date_formats
+        self.strict_date_parsing = instance.strict_date_parsing
+
+        self._ordinals = array("i", (dt.toordinal() for dt, _ in holidays))
+        self._name_indexes = array(
+            "H" if len(self.names) <= 0xFFFF else "I",
+            (name_indexes[name] for _, name in holidays),
+        )
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, (date, datetime, float, int, str)):
+            raise TypeError(f"Cannot convert type '{type(key)}' to date.")
+
+        return self._get_position(key) is not None
+
+    def __getitem__(self, key: DateLike) -> str:
+        if (position := self._get_position(key)) is None:
+            raise KeyError(_to_date(key, self.date_formats, self.strict_date_parsing))
+
+        return self.names[self._name_indexes[position]]
+
+    def __iter__(self) -> Iterator[date]:
+        return map(date.fromordinal, self._ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+    def _get_position(self, key: DateLike) -> int | None:
+        """Return the position of a given date in the ordinals array if it's a holiday."""
+        ordinal = _to_date(key, self.date_formats, self.strict_date_parsing).toordinal()
+        ordinals = self._ordinals
+        position = bisect_left(ordinals, ordinal)
+        if position < len(ordinals) and ordinals[position] == ordinal:
+            return position
+
+        return None
+
+    def get(self, key: DateLike, default: str | Any = None) -> str | Any:
+        """Retrieve the holiday name(s) for a given date.
+
+        Args:
+            key:
+                The date expressed in one of the following types:
+
+                * `datetime.date`
+                * `datetime.datetime`
+                * `float` or `int` (Unix timestamp)
+                * `str` of any format recognized by `dateutil.parser.parse()`
+
+            default:
+                The default value to return if no value is found.
+
+        Returns:
+            The holiday name(s) if the date is a holiday, otherwise the provided `default` value.
+        """
+        if (position := self._get_position(key)) is None:
+            return default
+
+        return self.names[self._name_indexes[position]]
+
+    def get_list(self, key: DateLike) -> list[str]:
+        """Retrieve all holiday names for a given date.
+
+        Args:
+            key:
+                The date expressed in one of the following types:
+
+                * `datetime.date`
+                * `datetime.datetime`
+                * `float` or `int` (Unix timestamp)
+                * `str` of any format recognized by `dateutil.parser.parse()`
+
+        Returns:
+            A list of holiday names if the date is a holiday, otherwise an empty list.
+        """
+        return [name for name in self.get(key, "").split(HOLIDAY_NAME_DELIMITER) if name]
+
+    def get_named(
+        self,
+        holiday_name: str,
+        lookup: NameLookup = "icontains",
+        split_multiple_names: bool = True,
+    ) -> list[date]:
+        """Find all holiday dates matching a given name.
+
+        The search by default is case-insensitive and includes partial matches.
+
+        Args:
+            holiday_name:
+                The holiday's name to try to match.
+
+            lookup:
+                The holiday name lookup type (see
+                [get_named()][holidays.holiday_base.HolidayBase.get_named]).
+
+            split_multiple_names:
+                Either use the exact name for each date or split it by holiday
+                name delimiter.
+
+        Returns:
+            A list of all holiday dates matching the provided holiday name.
+        """
+        is_matching = _get_name_matcher(holiday_name, lookup)
+        # Match each unique name once rather than each date's name.
+        matches_count = {}
+        for idx, name in enumerate(self.names):
+            names = name.split(HOLIDAY_NAME_DELIMITER) if split_multiple_names else (name,)
+            if count := sum(1 for name in names if is_matching(name)):
+                matches_count[idx] = count
+
+        return [
+            date.fromordinal(ordinal)
+            for ordinal, idx in zip(self._ordinals, self._name_indexes)
+            if idx in matches_count
+            for _ in range(matches_count[idx])
+        ]
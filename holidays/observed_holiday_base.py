@@ -10,10 +10,11 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+from calendar import isleap
 from datetime import date
 
 from holidays.calendars.gregorian import MON, TUE, WED, THU, FRI, SAT, SUN, _timedelta
-from holidays.holiday_base import DateArg, HolidayBase
+from holidays.holiday_base import DateArg, HolidayBase, _get_holiday_flags
 
 
 class ObservedRule(dict[int, int | None]):
@@ -33,13 +34,26 @@ class ObservedRule(dict[int, int | None]):
         rule=SAT_TO_PREV_FRI + SUN_TO_NEXT_MON
 
     Predefined rules for common patterns are available as module-level constants.
+
+    Each rule is compiled on creation into `offsets`, a 7-slot table of shift
+    offsets indexed by weekday (`0` for no shift), so rules are not meant to be
+    modified in place.
     """
 
-    __slots__ = ()
+    __slots__ = ("offsets",)
+
+    offsets: tuple[int | None, ...]
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.offsets = tuple(self.get(weekday, 0) for weekday in range(7))
 
     def __add__(self, other):
         return ObservedRule(self | other)
 
+    def __reduce__(self):
+        return ObservedRule, (dict(self),)
+
 
 # Observance calculation rules: +7 - next workday, -7 - previous workday.
 # Single days.
@@ -134,8 +148,8 @@ class ObservedHolidayBase(HolidayBase):
     The `observed_label` class attribute controls the name format of observed
     holidays (defaults to `"%s"`). Subclasses may also define
     `observed_label_before` (used when the observed date precedes the actual
-    date) and `observed_estimated_label` (used when the holiday name contains
-    an estimated-date marker).
+    date) and `observed_estimated_label` (used for holidays added with an
+    estimated date).
     """
 
     observed_label = "%s"
@@ -190,13 +204,25 @@ class ObservedHolidayBase(HolidayBase):
             The nearest workday in the step direction, or `dt` itself if none
             is found within the current year.
         """
-        dt_work = _timedelta(dt, delta)
-        while dt_work.year == self._year:
-            if dt_work in self or self._is_weekend(dt_work):  # type: ignore[operator]
-                dt_work = _timedelta(dt_work, delta)
+        year_start, bitmap = self._get_workweek_bitmap(self._year)
+        day = dt.toordinal() - year_start
+        year_days = 366 if isleap(self._year) else 365
+        while True:
+            # Scan the non-weekend days bitmap for the nearest day in the step direction.
+            if delta > 0:
+                next_days = bitmap >> (day + 1) if -1 <= day < year_days else 0
+                if not next_days:
+                    return dt
+                day += (next_days & -next_days).bit_length()
             else:
+                prev_days = bitmap & ((1 << day) - 1) if 0 < day <= year_days else 0
+                if not prev_days:
+                    return dt
+                day = prev_days.bit_length() - 1
+
+            dt_work = date.fromordinal(year_start + day)
+            if not dict.__contains__(self, dt_work):
                 return dt_work
-        return dt
 
     def _get_observed_date(self, dt: date, rule: ObservedRule) -> date | None:
         """Resolve the observed date for a holiday using the given rule.
@@ -219,7 +245,7 @@ class ObservedHolidayBase(HolidayBase):
             The resolved observed date, or `None` if the holiday should be
             removed entirely.
         """
-        delta = rule.get(dt.weekday(), 0)
+        delta = rule.offsets[dt.weekday()]
         if delta:
             return (
                 self._get_next_workday(dt, delta // 7)
@@ -284,10 +310,14 @@ class ObservedHolidayBase(HolidayBase):
         # Convert to date: (m, d) → use self._year; (y, m, d) → use directly.
         dt = dt if isinstance(dt, date) else date(self._year, *dt) if len(dt) == 2 else date(*dt)
 
-        if not (force_observed or (self.observed and self._is_observed(dt))):
+        rule = rule or self._observed_rule
+        # Most holidays aren't shifted by the rule, check it first.
+        if rule.offsets[dt.weekday()] == 0 or not (
+            force_observed or (self.observed and self._is_observed(dt))
+        ):
             return False, dt
 
-        dt_observed = self._get_observed_date(dt, rule or self._observed_rule)
+        dt_observed = self._get_observed_date(dt, rule)
         if dt_observed == dt:
             return False, dt
 
@@ -296,31 +326,37 @@ class ObservedHolidayBase(HolidayBase):
             self.pop(dt)
             return False, None
 
-        if show_observed_label:
-            estimated_label = self.tr(getattr(self, "estimated_label", ""))
-            observed_label = self.tr(
+        observed_label = (
+            self.tr(
                 getattr(
                     self,
                     "observed_label_before" if dt_observed < dt else "observed_label",
                     self.observed_label,
                 )
             )
+            if show_observed_label
+            else None
+        )
 
-            estimated_label_text = estimated_label.strip("%s ()（）")
+        holiday_flags = self._holiday_flags
+        for name in (name,) if name else self.get_list(dt):
+            holiday_name = self.tr(name)
+            base_name = self._estimated_names.get(holiday_name)
+            if observed_label is None:
+                observed_name = name
             # Use observed_estimated_label instead of observed_label for estimated dates.
-            for name in (name,) if name else self.get_list(dt):
-                holiday_name = self.tr(name)
-                observed_estimated_label = None
-                if estimated_label_text and estimated_label_text in holiday_name:
-                    holiday_name = holiday_name.replace(f"({estimated_label_text})", "").strip()
-                    observed_estimated_label = self.tr(getattr(self, "observed_estimated_label"))
-
-                super()._add_holiday(
-                    (observed_estimated_label or observed_label) % holiday_name, dt_observed
+            elif base_name is not None:
+                observed_name = self.tr(getattr(self, "observed_estimated_label")) % base_name
+            else:
+                observed_name = observed_label % holiday_name
+
+            if super()._add_holiday(observed_name, dt_observed):
+                flags = holiday_flags.get((dt, holiday_name))
+                holiday_flags[(dt_observed, self.tr(observed_name))] = _get_holiday_flags(
+                    (flags or self._category_flags).category,
+                    estimated=base_name is not None,
+                    observed=True,
                 )
-        else:
-            for name in (name,) if name else self.get_list(dt):
-                super()._add_holiday(name, dt_observed)
 
         return True, dt_observed
 
@@ -400,8 +436,16 @@ class ObservedHolidayBase(HolidayBase):
                 a date). If `False` (default), a single combined observed entry
                 is produced per date.
         """
+        # Dates the rule doesn't shift are skipped upfront unless observed holidays
+        # are added in an entity specific way.
+        offsets = None
+        if type(self)._add_observed is ObservedHolidayBase._add_observed:
+            if not self.observed:
+                return None
+            offsets = self._observed_rule.offsets
+
         for dt in sorted(dts):
-            if not self._is_observed(dt):
+            if (offsets and offsets[dt.weekday()] == 0) or not self._is_observed(dt):
                 continue
             if multiple:
                 for name in self.get_list(dt):
@@ -416,10 +460,7 @@ class ObservedHolidayBase(HolidayBase):
         if not self.observed or not self.has_special_holidays:
             return None
 
-        self._add_special_holidays(
-            (f"special_{category}_holidays_observed" for category in self._sorted_categories),
-            observed=True,
-        )
+        self._add_special_holidays(self._get_populate_dispatch(observed=True)[1], observed=True)
 
     def _populate_subdiv_holidays(self):
         """Populate entity subdivision holidays."""
@@ -429,9 +470,5 @@ class ObservedHolidayBase(HolidayBase):
             return None
 
         self._add_special_holidays(
-            (
-                f"special_{self._normalized_subdiv}_{category}_holidays_observed"
-                for category in self._sorted_categories
-            ),
-            observed=True,
+            self._get_populate_dispatch(subdiv=True, observed=True)[1], observed=True
         )
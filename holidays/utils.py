@@ -14,6 +14,7 @@ __all__ = (
     "country_holidays",
     "CountryHoliday",
     "financial_holidays",
+    "HolidaysCache",
     "list_localized_countries",
     "list_localized_financial",
     "list_long_breaks",
@@ -22,15 +23,182 @@ __all__ = (
 )
 
 import warnings
+from collections import OrderedDict
 from collections.abc import Iterable
 from datetime import date
 from functools import cache
+from threading import Lock
+from typing import Any, NamedTuple, cast
 
 from holidays.calendars.gregorian import _timedelta
-from holidays.holiday_base import CategoryArg, HolidayBase
+from holidays.helpers import _normalize_arguments
+from holidays.holiday_base import CategoryArg, DateLike, HolidayBase, HolidayFlags
 from holidays.registry import EntityLoader
 
 
+class HolidaysCacheInfo(NamedTuple):
+    """[`HolidaysCache`][holidays.utils.HolidaysCache] statistics."""
+
+    hits: int
+    """The number of years served from the cache."""
+    misses: int
+    """The number of years computed and stored in the cache."""
+    maxsize: int
+    """The maximum number of years kept in the cache."""
+    currsize: int
+    """The current number of years kept in the cache."""
+
+
+class HolidaysCache:
+    """Process-wide LRU cache of computed holidays years.
+
+    Each year is computed once per configuration key, i.e. entity class, subdivision,
+    categories, observed, expand and language combination, and is shared by all
+    objects created with the same cache. Objects attached to the cache copy already
+    computed years instead of running the entity population logic again, so changes made
+    to an object never leak into the cache or other objects.
+
+    The least recently used years are evicted once `maxsize` is exceeded.
+
+    Example usage:
+
+        >>> from holidays import HolidaysCache, country_holidays
+        >>> holidays_cache = HolidaysCache(maxsize=4096)
+        >>> us_ca_holidays = country_holidays('US', subdiv='CA', cache=holidays_cache)
+        >>> assert '2024-12-25' in us_ca_holidays
+        >>> us_ca_holidays = country_holidays('US', subdiv='CA', cache=holidays_cache)
+        >>> assert '2024-12-25' in us_ca_holidays
+        >>> holidays_cache.cache_info()
+        HolidaysCacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Args:
+            maxsize:
+                The maximum number of years (per configuration key) to keep.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache maxsize must be a positive integer.")
+
+        self.maxsize = maxsize
+        self._hits = 0
+        self._lock = Lock()
+        self._misses = 0
+        self._years: OrderedDict[
+            tuple[Any, ...],
+            tuple[
+                dict[date, str],
+                dict[tuple[date, str], HolidayFlags],
+                frozenset[date],
+                frozenset[date],
+            ],
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._years)
+
+    @staticmethod
+    def _get_key(instance: HolidayBase, year: int) -> tuple[Any, ...]:
+        return (
+            type(instance),
+            instance.subdiv,
+            frozenset(instance.categories),
+            instance.observed,
+            instance.expand,
+            instance.language,
+            year,
+        )
+
+    def _populate(self, instance: HolidayBase, year: int) -> None:
+        """Populate holidays for a given year using the cached results.
+
+        Args:
+            instance:
+                The object to populate.
+
+            year:
+                The year to populate with holidays.
+        """
+        key = self._get_key(instance, year)
+        with self._lock:
+            if (cached_year := self._years.get(key)) is not None:
+                self._years.move_to_end(key)
+                self._hits += 1
+
+        if cached_year is None:
+            # Compute the year outside the lock using a standalone object.
+            entity = type(instance)(
+                categories=instance.categories,
+                expand=instance.expand,
+                language=instance.language,
+                observed=instance.observed,
+                subdiv=instance.subdiv,
+            )
+            initial_weekend_workdays = frozenset(entity.weekend_workdays)
+            entity.years.add(year)
+            entity._populate_year(year)
+            cached_year = (
+                {dt: name for dt, name in entity.items() if dt.year == year},
+                {
+                    key: flags
+                    for key, flags in entity._holiday_flags.items()
+                    if key[0].year == year
+                },
+                frozenset(entity.weekend_workdays),
+                # Weekend workdays removed by the population, e.g. via `clear()`.
+                initial_weekend_workdays.difference(entity.weekend_workdays),
+            )
+            with self._lock:
+                self._misses += 1
+                self._years[key] = cached_year
+                while len(self._years) > self.maxsize:
+                    self._years.popitem(last=False)
+
+        holidays, holiday_flags, weekend_workdays, removed_weekend_workdays = cached_year
+        if instance.keys().isdisjoint(holidays):
+            dict.update(instance, holidays)
+        else:
+            instance.update(cast("dict[DateLike, str]", holidays))  # Merge existing names.
+        instance._holiday_flags.update(holiday_flags)
+        # Replace the constructor's weekend workdays with the populated ones while keeping
+        # those added by the previously populated years.
+        instance.weekend_workdays.difference_update(removed_weekend_workdays)
+        instance.weekend_workdays.update(weekend_workdays)
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._years.clear()
+
+    def cache_info(self) -> HolidaysCacheInfo:
+        """Get the cache statistics.
+
+        Returns:
+            A [`HolidaysCacheInfo`][holidays.utils.HolidaysCacheInfo] named tuple.
+        """
+        with self._lock:
+            return HolidaysCacheInfo(self._hits, self._misses, self.maxsize, len(self._years))
+
+
+def _create_entity(
+    entity: Any, years: int | Iterable[int] | None, cache: HolidaysCache | None, **kwargs
+) -> HolidayBase:
+    """Create an entity object, optionally attached to the shared years cache."""
+    if cache is None:
+        return entity(years=years, **kwargs)
+
+    instance = entity(**kwargs)
+    instance._years_cache = cache
+    for year in _normalize_arguments(int, years):
+        instance.years.add(year)
+        instance._populate_year(year)
+
+    return instance
+
+
 def country_holidays(
     country: str,
     subdiv: str | None = None,
@@ -41,6 +209,7 @@ def country_holidays(
     state: str | None = None,
     language: str | None = None,
     categories: CategoryArg | None = None,
+    cache: HolidaysCache | None = None,
 ) -> HolidayBase:
     """Return a new dictionary-like [`HolidayBase`][holidays.holiday_base.HolidayBase] object.
 
@@ -107,6 +276,10 @@ def country_holidays(
         categories:
             Requested holiday categories.
 
+        cache:
+            An optional [`HolidaysCache`][holidays.utils.HolidaysCache] object to share
+            computed years with other objects of the same configuration.
+
     Returns:
         A [`HolidayBase`][holidays.holiday_base.HolidayBase] object matching the `country`.
 
@@ -216,8 +389,10 @@ def country_holidays(
     import holidays
 
     try:
-        return getattr(holidays, country)(
-            years=years,
+        return _create_entity(
+            getattr(holidays, country),
+            years,
+            cache,
             subdiv=subdiv,
             expand=expand,
             observed=observed,
@@ -238,6 +413,7 @@ def financial_holidays(
     observed: bool = True,
     language: str | None = None,
     categories: CategoryArg | None = None,
+    cache: HolidaysCache | None = None,
 ) -> HolidayBase:
     """Return a new dictionary-like [`HolidayBase`][holidays.holiday_base.HolidayBase] object.
 
@@ -298,6 +474,10 @@ def financial_holidays(
         categories:
             Requested holiday categories.
 
+        cache:
+            An optional [`HolidaysCache`][holidays.utils.HolidaysCache] object to share
+            computed years with other objects of the same configuration.
+
     Returns:
         A [`HolidayBase`][holidays.holiday_base.HolidayBase] object matching the `market`.
 
@@ -312,8 +492,10 @@ def financial_holidays(
     import holidays
 
     try:
-        return getattr(holidays, market)(
-            years=years,
+        return _create_entity(
+            getattr(holidays, market),
+            years,
+            cache,
             subdiv=subdiv,
             expand=expand,
             observed=observed,
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see CONTRIBUTORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path.cwd()))  # Make holidays visible.
+from holidays.registry import COUNTRIES, FINANCIAL
+
+# Runs in a fresh interpreter: prints import time, traced memory and loaded holidays modules.
+MEASURE_CODE = """
+import sys
+import tracemalloc
+from importlib import import_module
+from time import perf_counter
+
+module_name, trace_memory = sys.argv[1], sys.argv[2] == "1"
+if trace_memory:
+    tracemalloc.start()
+start_time = perf_counter()
+import_module(module_name)
+print(
+    perf_counter() - start_time,
+    tracemalloc.get_traced_memory()[0],
+    sum(name.partition(".")[0] == "holidays" for name in sys.modules),
+)
+"""
+
+
+class ImportBenchmark:
+    """Measures import time and memory of supported entities modules."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        entities_group = arg_parser.add_mutually_exclusive_group()
+        entities_group.add_argument(
+            "-c",
+            "--country",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Country codes to benchmark",
+            type=str,
+        )
+        entities_group.add_argument(
+            "-m",
+            "--market",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Market codes to benchmark",
+            type=str,
+        )
+        arg_parser.add_argument(
+            "-r",
+            "--repeat",
+            default=5,
+            help="Number of measurements to take the best of (default: 5)",
+            type=int,
+        )
+        arg_parser.add_argument(
+            "-t",
+            "--top",
+            default=10,
+            help="Number of the slowest entities to show (default: 10)",
+            type=int,
+        )
+        self.args = arg_parser.parse_args()
+
+    @staticmethod
+    def run_import(module_name: str, *, trace_memory: bool = False) -> tuple[float, int, int]:
+        """Import a module in a new interpreter and return its measurements."""
+        output = subprocess.run(
+            (sys.executable, "-c", MEASURE_CODE, module_name, str(int(trace_memory))),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+
+        return float(output[0]), int(output[1]), int(output[2])
+
+    def measure(self, module_name: str) -> tuple[float, int, int]:
+        """Return the best import time, memory and loaded holidays modules count."""
+        best_time = min(self.run_import(module_name)[0] for _ in range(self.args.repeat))
+        _, memory, modules_count = self.run_import(module_name, trace_memory=True)
+
+        return best_time, memory, modules_count
+
+    def run(self) -> None:
+        """Runs import benchmark."""
+        modules = {}
+        if not self.args.market:
+            for module, entities in COUNTRIES.items():
+                if not self.args.country or set(self.args.country).intersection(entities):
+                    modules[entities[1]] = f"holidays.countries.{module}"
+        if not self.args.country:
+            for module, entities in FINANCIAL.items():
+                if not self.args.market or set(self.args.market).intersection(entities):
+                    modules[entities[1]] = f"holidays.financial.{module}"
+
+        # Compile bytecode first so that only the import itself is measured.
+        for module_name in ("holidays", *modules.values()):
+            self.run_import(module_name)
+
+        holidays_time, holidays_memory, holidays_modules = self.measure("holidays")
+        print(
+            f"[TIMER] import holidays: {holidays_time * 1000:.2f} ms, "
+            f"{holidays_memory / 2**20:.2f} MiB, {holidays_modules} modules"
+        )
+
+        timings = {code: self.measure(module_name) for code, module_name in modules.items()}
+        print(
+            f"[TIMER] {len(timings)} entities, mean import: "
+            f"{sum(timing[0] for timing in timings.values()) / len(timings) * 1000:.2f} ms"
+        )
+        for code, (timing, memory, modules_count) in sorted(
+            timings.items(), key=lambda item: -item[1][0]
+        )[: self.args.top]:
+            print(
+                f"    {code:<6} {timing * 1000:8.2f} ms {memory / 2**20:8.2f} MiB "
+                f"{modules_count:5} modules"
+            )
+
+
+if __name__ == "__main__":
+    ImportBenchmark().run()
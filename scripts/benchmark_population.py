@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see CONTRIBUTORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import argparse
+import sys
+import warnings
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path.cwd()))  # Make holidays visible.
+from holidays import (
+    country_holidays,
+    financial_holidays,
+    list_supported_countries,
+    list_supported_financial,
+)
+
+
+class PopulationBenchmark:
+    """Measures holidays population time of supported entities."""
+
+    def __init__(self) -> None:
+        arg_parser = argparse.ArgumentParser()
+        entities_group = arg_parser.add_mutually_exclusive_group()
+        entities_group.add_argument(
+            "-c",
+            "--country",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Country codes to benchmark",
+            type=str,
+        )
+        entities_group.add_argument(
+            "-m",
+            "--market",
+            action="extend",
+            nargs="+",
+            default=[],
+            help="Market codes to benchmark",
+            type=str,
+        )
+        arg_parser.add_argument(
+            "-r",
+            "--repeat",
+            default=5,
+            help="Number of measurements to take the best of (default: 5)",
+            type=int,
+        )
+        arg_parser.add_argument(
+            "-t",
+            "--top",
+            default=10,
+            help="Number of the slowest entities to show (default: 10)",
+            type=int,
+        )
+        arg_parser.add_argument(
+            "-y",
+            "--years",
+            default=(1950, 2050),
+            help="First and last year to populate (default: 1950 2050)",
+            nargs=2,
+            type=int,
+        )
+        self.args = arg_parser.parse_args()
+        self.years = range(self.args.years[0], self.args.years[1] + 1)
+
+    def measure(self, entity_holidays, code: str, subdiv: str | None = None) -> float:
+        """Return the best population time of an entity subdivision (all categories)."""
+        best_time = float("inf")
+        for _ in range(self.args.repeat):
+            start_time = perf_counter()
+            entity_holidays(
+                code,
+                subdiv=subdiv,
+                years=self.years,
+                categories=entity_holidays(code).supported_categories,
+            )
+            best_time = min(best_time, perf_counter() - start_time)
+
+        return best_time
+
+    def run(self) -> None:
+        """Runs population benchmark."""
+        warnings.simplefilter("ignore")
+
+        entities = []
+        if not self.args.market:
+            supported_countries = list_supported_countries(include_aliases=False)
+            for country_code in self.args.country or supported_countries:
+                entities.append((country_holidays, country_code))
+        if not self.args.country:
+            supported_markets = list_supported_financial(include_aliases=False)
+            for market_code in self.args.market or supported_markets:
+                entities.append((financial_holidays, market_code))
+
+        timings = {}
+        for entity_holidays, code in entities:
+            for subdiv in (None, *entity_holidays(code).subdivisions):
+                timings[(code, subdiv)] = self.measure(entity_holidays, code, subdiv)
+
+        print(
+            f"[TIMER] {len(timings)} entities/subdivisions, years {self.years.start}-"
+            f"{self.years.stop - 1}: {sum(timings.values()):.2f} seconds"
+        )
+        for (code, subdiv), timing in sorted(timings.items(), key=lambda item: -item[1])[
+            : self.args.top
+        ]:
+            print(f"    {code:<6} {subdiv or '':<12} {timing * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    PopulationBenchmark().run()
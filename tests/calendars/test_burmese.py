@@ -10,7 +10,9 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import gc
 import unittest
+import weakref
 from datetime import date
 
 from holidays.calendars.burmese import _BurmeseLunisolar
@@ -25,6 +27,19 @@ class TestBurmeseCalendar(unittest.TestCase):
         self.assertEqual(self.calendar.thingyan_dates(1938), (None, None))
         self.assertEqual(self.calendar.thingyan_dates(2101), (None, None))
 
+    def test_start_date(self):
+        self.assertEqual(self.calendar._get_start_date(1939), date(1939, 3, 20))
+        self.assertEqual(self.calendar._get_start_date(2025), date(2025, 3, 29))
+        self.assertIsNone(self.calendar._get_start_date(1938))
+        self.assertIsNone(self.calendar._get_start_date(2101))
+
+        calendar = _BurmeseLunisolar()
+        self.assertEqual(calendar._get_start_date(2025), self.calendar._get_start_date(2025))
+        calendar_ref = weakref.ref(calendar)
+        del calendar
+        gc.collect()
+        self.assertIsNone(calendar_ref())
+
     def test_jdn_to_gregorian(self):
         for jdn, ymd in (
             (2451544, (1999, 12, 31)),
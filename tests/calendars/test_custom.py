@@ -0,0 +1,73 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see CONTRIBUTORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import operator
+import unittest
+from datetime import date
+
+from holidays.calendars.chinese import (
+    KOREAN_CALENDAR,
+    LUNAR_NEW_YEAR,
+    _ChineseLunisolar,
+    _CustomChineseHolidays,
+)
+from holidays.calendars.custom import _get_holiday_dates
+from holidays.calendars.gregorian import JAN, FEB, DEC
+from holidays.calendars.hindu import GURU_GOBIND_SINGH_JAYANTI, _HinduLunisolar
+
+
+class CustomChineseHolidays(_CustomChineseHolidays):
+    LUNAR_NEW_YEAR_DATES = {
+        2020: (JAN, 26),
+        2021: (),
+    }
+
+    LUNAR_NEW_YEAR_DATES_CONFIRMED_YEARS = (2020, 2030)
+
+
+class TestHolidayDates(unittest.TestCase):
+    def test_layers(self):
+        holiday_dates = _get_holiday_dates(CustomChineseHolidays, LUNAR_NEW_YEAR)
+        for year, holiday_date in (
+            (1930, (date(1930, JAN, 30), True)),
+            (2020, (date(2020, JAN, 26), False)),
+            (2021, (None, False)),
+            (2022, (date(2022, FEB, 1), False)),
+            (2031, (date(2031, JAN, 23), True)),
+            (1800, (None, True)),
+            (2200, (None, True)),
+        ):
+            self.assertEqual(holiday_date, holiday_dates.get_date(year), year)
+
+        self.assertEqual(
+            _get_holiday_dates(_ChineseLunisolar, LUNAR_NEW_YEAR, KOREAN_CALENDAR).get_date(1986),
+            _ChineseLunisolar(calendar=KOREAN_CALENDAR).lunar_new_year_date(1986),
+        )
+
+    def test_multiple_dates(self):
+        holiday_dates = _get_holiday_dates(_HinduLunisolar, GURU_GOBIND_SINGH_JAYANTI)
+        self.assertEqual(
+            holiday_dates.get_dates(2017),
+            ((date(2017, JAN, 5), True), (date(2017, DEC, 25), True)),
+        )
+        self.assertEqual(holiday_dates.get_date(2017), (None, True))
+        self.assertEqual(holiday_dates.get_dates(2200), ())
+        self.assertRaises(TypeError, operator.setitem, holiday_dates.multiple_dates, 2017, ())
+
+    def test_cache(self):
+        holiday_dates = _get_holiday_dates(CustomChineseHolidays, LUNAR_NEW_YEAR)
+        self.assertIs(holiday_dates, _get_holiday_dates(CustomChineseHolidays, LUNAR_NEW_YEAR))
+        self.assertIsNot(holiday_dates, _get_holiday_dates(_ChineseLunisolar, LUNAR_NEW_YEAR))
+
+        empty_dates = _get_holiday_dates(CustomChineseHolidays, "UNKNOWN")
+        self.assertEqual(empty_dates.get_date(2020), (None, True))
+        self.assertEqual(empty_dates.get_dates(2020), ())
@@ -0,0 +1,227 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see CONTRIBUTORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import unittest
+from datetime import date
+
+from holidays.calendars.gregorian import (
+    JAN,
+    MAR,
+    APR,
+    MAY,
+    JUN,
+    AUG,
+    SEP,
+    OCT,
+    DEC,
+    SUN,
+    WED,
+    FRI,
+    _timedelta,
+)
+from holidays.calendars.hebrew import (
+    HANUKKAH,
+    HEBREW_YEAR_OFFSET,
+    INDEPENDENCE_DAY,
+    LAG_BAOMER,
+    PASSOVER,
+    PURIM,
+    ROSH_HASHANAH,
+    SHAVUOT,
+    SUKKOT,
+    TISHA_BAV,
+    YOM_KIPPUR,
+    _get_new_year,
+    _HebrewLunisolar,
+)
+
+
+class TestHebrewCalendar(unittest.TestCase):
+    # Holiday days of the year in 1947-2100 from the former `_HebrewLunisolar` dates tables.
+    # fmt: off
+    HOLIDAY_DAYS_OF_YEAR = {
+        HANUKKAH: (
+            342, 362, 350, 338, 358, 348, 336, 354, 344, 334, 352, 341, 360, 349,  # 1947-1960.
+            337, 356, 345, 335, 353, 342, 361, 351, 339, 357, 347, 336, 354, 343,  # 1961-1974.
+            333, 352, 339, 359, 349, 338, 355, 345, 335, 354, 342, 361, 350, 339,  # 1975-1988.
+            357, 346, 336, 355, 343, 332, 352, 341, 358, 348, 338, 357, 344, 334,  # 1989-2002.
+            354, 343, 360, 350, 339, 357, 346, 336, 355, 344, 332, 351, 341, 360,  # 2003-2016.
+            347, 337, 357, 346, 333, 353, 342, 361, 349, 339, 359, 348, 336, 355,  # 2017-2030.
+            344, 333, 351, 341, 360, 349, 337, 356, 346, 335, 352, 342, 361, 350,  # 2031-2044.
+            338, 358, 347, 335, 354, 344, 333, 351, 340, 360, 349, 338, 356, 345,  # 2045-2058.
+            334, 353, 342, 361, 350, 339, 357, 347, 336, 354, 343, 332, 351, 340,  # 2059-2072.
+            359, 348, 336, 356, 345, 334, 352, 342, 361, 350, 339, 358, 346, 335,  # 2073-2086.
+            354, 343, 332, 351, 340, 359, 348, 337, 355, 345, 334, 353, 341, 361,  # 2087-2100.
+        ),
+        INDEPENDENCE_DAY: (
+            115, 135, 124, 112, 131, 121, 110, 128, 117, 107, 126, 115, 133, 123,  # 1947-1960.
+            111, 129, 119, 108, 127, 115, 135, 124, 113, 131, 120, 110, 127, 117,  # 1961-1974.
+            106, 126, 113, 132, 122, 112, 129, 118, 108, 128, 116, 134, 124, 113,  # 1975-1988.
+            130, 120, 109, 129, 116, 106, 125, 115, 132, 121, 111, 131, 118, 107,  # 1989-2002.
+            127, 117, 134, 123, 113, 131, 119, 109, 129, 118, 105, 125, 114, 134,  # 2003-2016.
+            121, 110, 130, 120, 107, 126, 116, 134, 123, 112, 132, 122, 110, 128,  # 2017-2030.
+            118, 107, 124, 114, 134, 123, 110, 130, 119, 109, 126, 115, 135, 123,  # 2031-2044.
+            112, 131, 121, 109, 127, 117, 107, 125, 113, 133, 123, 112, 129, 119,  # 2045-2058.
+            108, 126, 115, 135, 124, 112, 131, 120, 110, 128, 116, 106, 124, 114,  # 2059-2072.
+            132, 122, 110, 129, 118, 108, 126, 115, 134, 124, 113, 131, 120, 109,  # 2073-2086.
+            127, 117, 105, 125, 113, 133, 121, 111, 129, 118, 107, 127, 115, 134,  # 2087-2100.
+        ),
+        LAG_BAOMER: (
+            128, 148, 137, 125, 144, 134, 123, 141, 130, 120, 139, 128, 146, 136,  # 1947-1960.
+            124, 142, 132, 121, 140, 128, 148, 137, 126, 144, 133, 123, 140, 130,  # 1961-1974.
+            119, 139, 126, 145, 135, 125, 142, 131, 121, 141, 129, 147, 137, 126,  # 1975-1988.
+            143, 133, 122, 142, 129, 119, 138, 128, 145, 134, 124, 144, 131, 120,  # 1989-2002.
+            140, 130, 147, 136, 126, 144, 132, 122, 142, 131, 118, 138, 127, 147,  # 2003-2016.
+            134, 123, 143, 133, 120, 139, 129, 147, 136, 125, 145, 135, 123, 141,  # 2017-2030.
+            131, 120, 137, 127, 147, 136, 123, 143, 132, 122, 139, 128, 148, 136,  # 2031-2044.
+            125, 144, 134, 122, 140, 130, 120, 138, 126, 146, 136, 125, 142, 132,  # 2045-2058.
+            121, 139, 128, 148, 137, 125, 144, 133, 123, 141, 129, 119, 137, 127,  # 2059-2072.
+            145, 135, 123, 142, 131, 121, 139, 128, 147, 137, 126, 144, 133, 122,  # 2073-2086.
+            140, 130, 118, 138, 126, 146, 134, 124, 142, 131, 120, 140, 128, 147,  # 2087-2100.
+        ),
+        PASSOVER: (
+             95, 115, 104,  92, 111, 101,  90, 108,  97,  87, 106,  95, 113, 103,  # 1947-1960.
+             91, 109,  99,  88, 107,  95, 115, 104,  93, 111, 100,  90, 107,  97,  # 1961-1974.
+             86, 106,  93, 112, 102,  92, 109,  98,  88, 108,  96, 114, 104,  93,  # 1975-1988.
+            110, 100,  89, 109,  96,  86, 105,  95, 112, 101,  91, 111,  98,  87,  # 1989-2002.
+            107,  97, 114, 103,  93, 111,  99,  89, 109,  98,  85, 105,  94, 114,  # 2003-2016.
+            101,  90, 110, 100,  87, 106,  96, 114, 103,  92, 112, 102,  90, 108,  # 2017-2030.
+             98,  87, 104,  94, 114, 103,  90, 110,  99,  89, 106,  95, 115, 103,  # 2031-2044.
+             92, 111, 101,  89, 107,  97,  87, 105,  93, 113, 103,  92, 109,  99,  # 2045-2058.
+             88, 106,  95, 115, 104,  92, 111, 100,  90, 108,  96,  86, 104,  94,  # 2059-2072.
+            112, 102,  90, 109,  98,  88, 106,  95, 114, 104,  93, 111, 100,  89,  # 2073-2086.
+            107,  97,  85, 105,  93, 113, 101,  91, 109,  98,  87, 107,  95, 114,  # 2087-2100.
+        ),
+        PURIM: (
+             65,  85,  74,  62,  81,  71,  60,  78,  67,  57,  76,  65,  83,  73,  # 1947-1960.
+             61,  79,  69,  58,  77,  65,  85,  74,  63,  81,  70,  60,  77,  67,  # 1961-1974.
+             56,  76,  63,  82,  72,  62,  79,  68,  58,  78,  66,  84,  74,  63,  # 1975-1988.
+             80,  70,  59,  79,  66,  56,  75,  65,  82,  71,  61,  81,  68,  57,  # 1989-2002.
+             77,  67,  84,  73,  63,  81,  69,  59,  79,  68,  55,  75,  64,  84,  # 2003-2016.
+             71,  60,  80,  70,  57,  76,  66,  84,  73,  62,  82,  72,  60,  78,  # 2017-2030.
+             68,  57,  74,  64,  84,  73,  60,  80,  69,  59,  76,  65,  85,  73,  # 2031-2044.
+             62,  81,  71,  59,  77,  67,  57,  75,  63,  83,  73,  62,  79,  69,  # 2045-2058.
+             58,  76,  65,  85,  74,  62,  81,  70,  60,  78,  66,  56,  74,  64,  # 2059-2072.
+             82,  72,  60,  79,  68,  58,  76,  65,  84,  74,  63,  81,  70,  59,  # 2073-2086.
+             77,  67,  55,  75,  63,  83,  71,  61,  79,  68,  57,  77,  65,  84,  # 2087-2100.
+        ),
+        ROSH_HASHANAH: (
+            258, 278, 267, 255, 274, 264, 253, 271, 260, 250, 269, 258, 276, 266,  # 1947-1960.
+            254, 272, 262, 251, 270, 258, 278, 267, 256, 274, 263, 253, 270, 260,  # 1961-1974.
+            249, 269, 256, 275, 265, 255, 272, 261, 251, 271, 259, 277, 267, 256,  # 1975-1988.
+            273, 263, 252, 272, 259, 249, 268, 258, 275, 264, 254, 274, 261, 250,  # 1989-2002.
+            270, 260, 277, 266, 256, 274, 262, 252, 272, 261, 248, 268, 257, 277,  # 2003-2016.
+            264, 253, 273, 263, 250, 269, 259, 277, 266, 255, 275, 265, 253, 271,  # 2017-2030.
+            261, 250, 267, 257, 277, 266, 253, 273, 262, 252, 269, 258, 278, 266,  # 2031-2044.
+            255, 274, 264, 252, 270, 260, 250, 268, 256, 276, 266, 255, 272, 262,  # 2045-2058.
+            251, 269, 258, 278, 267, 255, 274, 263, 253, 271, 259, 249, 267, 257,  # 2059-2072.
+            275, 265, 253, 272, 261, 251, 269, 258, 277, 267, 256, 274, 263, 252,  # 2073-2086.
+            270, 260, 248, 268, 256, 276, 264, 254, 272, 261, 250, 270, 258, 277,  # 2087-2100.
+        ),
+        SHAVUOT: (
+            145, 165, 154, 142, 161, 151, 140, 158, 147, 137, 156, 145, 163, 153,  # 1947-1960.
+            141, 159, 149, 138, 157, 145, 165, 154, 143, 161, 150, 140, 157, 147,  # 1961-1974.
+            136, 156, 143, 162, 152, 142, 159, 148, 138, 158, 146, 164, 154, 143,  # 1975-1988.
+            160, 150, 139, 159, 146, 136, 155, 145, 162, 151, 141, 161, 148, 137,  # 1989-2002.
+            157, 147, 164, 153, 143, 161, 149, 139, 159, 148, 135, 155, 144, 164,  # 2003-2016.
+            151, 140, 160, 150, 137, 156, 146, 164, 153, 142, 162, 152, 140, 158,  # 2017-2030.
+            148, 137, 154, 144, 164, 153, 140, 160, 149, 139, 156, 145, 165, 153,  # 2031-2044.
+            142, 161, 151, 139, 157, 147, 137, 155, 143, 163, 153, 142, 159, 149,  # 2045-2058.
+            138, 156, 145, 165, 154, 142, 161, 150, 140, 158, 146, 136, 154, 144,  # 2059-2072.
+            162, 152, 140, 159, 148, 138, 156, 145, 164, 154, 143, 161, 150, 139,  # 2073-2086.
+            157, 147, 135, 155, 143, 163, 151, 141, 159, 148, 137, 157, 145, 164,  # 2087-2100.
+        ),
+        SUKKOT: (
+            272, 292, 281, 269, 288, 278, 267, 285, 274, 264, 283, 272, 290, 280,  # 1947-1960.
+            268, 286, 276, 265, 284, 272, 292, 281, 270, 288, 277, 267, 284, 274,  # 1961-1974.
+            263, 283, 270, 289, 279, 269, 286, 275, 265, 285, 273, 291, 281, 270,  # 1975-1988.
+            287, 277, 266, 286, 273, 263, 282, 272, 289, 278, 268, 288, 275, 264,  # 1989-2002.
+            284, 274, 291, 280, 270, 288, 276, 266, 286, 275, 262, 282, 271, 291,  # 2003-2016.
+            278, 267, 287, 277, 264, 283, 273, 291, 280, 269, 289, 279, 267, 285,  # 2017-2030.
+            275, 264, 281, 271, 291, 280, 267, 287, 276, 266, 283, 272, 292, 280,  # 2031-2044.
+            269, 288, 278, 266, 284, 274, 264, 282, 270, 290, 280, 269, 286, 276,  # 2045-2058.
+            265, 283, 272, 292, 281, 269, 288, 277, 267, 285, 273, 263, 281, 271,  # 2059-2072.
+            289, 279, 267, 286, 275, 265, 283, 272, 291, 281, 270, 288, 277, 266,  # 2073-2086.
+            284, 274, 262, 282, 270, 290, 278, 268, 286, 275, 264, 284, 272, 291,  # 2087-2100.
+        ),
+        TISHA_BAV: (
+            207, 227, 216, 204, 223, 213, 202, 220, 209, 199, 218, 207, 225, 215,  # 1947-1960.
+            203, 221, 211, 200, 219, 207, 227, 216, 205, 223, 212, 202, 219, 209,  # 1961-1974.
+            198, 218, 205, 224, 214, 204, 221, 210, 200, 220, 208, 226, 216, 205,  # 1975-1988.
+            222, 212, 201, 221, 208, 198, 217, 207, 224, 213, 203, 223, 210, 199,  # 1989-2002.
+            219, 209, 226, 215, 205, 223, 211, 201, 221, 210, 197, 217, 206, 226,  # 2003-2016.
+            213, 202, 222, 212, 199, 218, 208, 226, 215, 204, 224, 214, 202, 220,  # 2017-2030.
+            210, 199, 216, 206, 226, 215, 202, 222, 211, 201, 218, 207, 227, 215,  # 2031-2044.
+            204, 223, 213, 201, 219, 209, 199, 217, 205, 225, 215, 204, 221, 211,  # 2045-2058.
+            200, 218, 207, 227, 216, 204, 223, 212, 202, 220, 208, 198, 216, 206,  # 2059-2072.
+            224, 214, 202, 221, 210, 200, 218, 207, 226, 216, 205, 223, 212, 201,  # 2073-2086.
+            219, 209, 197, 217, 205, 225, 213, 203, 221, 210, 199, 219, 207, 226,  # 2087-2100.
+        ),
+        YOM_KIPPUR: (
+            267, 287, 276, 264, 283, 273, 262, 280, 269, 259, 278, 267, 285, 275,  # 1947-1960.
+            263, 281, 271, 260, 279, 267, 287, 276, 265, 283, 272, 262, 279, 269,  # 1961-1974.
+            258, 278, 265, 284, 274, 264, 281, 270, 260, 280, 268, 286, 276, 265,  # 1975-1988.
+            282, 272, 261, 281, 268, 258, 277, 267, 284, 273, 263, 283, 270, 259,  # 1989-2002.
+            279, 269, 286, 275, 265, 283, 271, 261, 281, 270, 257, 277, 266, 286,  # 2003-2016.
+            273, 262, 282, 272, 259, 278, 268, 286, 275, 264, 284, 274, 262, 280,  # 2017-2030.
+            270, 259, 276, 266, 286, 275, 262, 282, 271, 261, 278, 267, 287, 275,  # 2031-2044.
+            264, 283, 273, 261, 279, 269, 259, 277, 265, 285, 275, 264, 281, 271,  # 2045-2058.
+            260, 278, 267, 287, 276, 264, 283, 272, 262, 280, 268, 258, 276, 266,  # 2059-2072.
+            284, 274, 262, 281, 270, 260, 278, 267, 286, 276, 265, 283, 272, 261,  # 2073-2086.
+            279, 269, 257, 277, 265, 285, 273, 263, 281, 270, 259, 279, 267, 286,  # 2087-2100.
+        ),
+    }
+    # fmt: on
+
+    def setUp(self):
+        super().setUp()
+        self.calendar = _HebrewLunisolar()
+
+    def test_holiday_dates(self):
+        for method, dt in (
+            (self.calendar.purim_date, date(2024, MAR, 24)),
+            (self.calendar.passover_date, date(2024, APR, 23)),
+            (self.calendar.israel_independence_date, date(2024, MAY, 13)),
+            (self.calendar.lag_baomer_date, date(2024, MAY, 26)),
+            (self.calendar.shavuot_date, date(2024, JUN, 12)),
+            (self.calendar.tisha_bav_date, date(2024, AUG, 13)),
+            (self.calendar.rosh_hashanah_date, date(2024, OCT, 3)),
+            (self.calendar.yom_kippur_date, date(2024, OCT, 12)),
+            (self.calendar.sukkot_date, date(2024, OCT, 17)),
+        ):
+            self.assertEqual(method(2024), dt, method.__name__)
+
+        self.assertEqual(
+            self.calendar.hanukkah_date(2024), {date(2023, DEC, 8), date(2024, DEC, 26)}
+        )
+
+    def test_year_bounds(self):
+        self.assertEqual(self.calendar.rosh_hashanah_date(1900), date(1900, SEP, 24))
+        self.assertEqual(self.calendar.passover_date(2101), date(2101, APR, 14))
+        self.assertEqual(
+            self.calendar.hanukkah_date(3032), {date(3032, JAN, 1), date(3032, DEC, 19)}
+        )
+
+    def test_new_year(self):
+        for year in range(1900 + HEBREW_YEAR_OFFSET, 2200 + HEBREW_YEAR_OFFSET):
+            new_year = _get_new_year(year)
+            self.assertIn(_get_new_year(year + 1) - new_year, {353, 354, 355, 383, 384, 385})
+            self.assertNotIn(date.fromordinal(new_year).weekday(), {SUN, WED, FRI}, year)
+
+    def test_former_table_dates(self):
+        for holiday, days_of_year in self.HOLIDAY_DAYS_OF_YEAR.items():
+            for year, day_of_year in enumerate(days_of_year, start=1947):
+                self.assertEqual(
+                    self.calendar._get_holiday(holiday, year),
+                    _timedelta(date(year, JAN, 1), day_of_year - 1),
+                    f"{holiday} {year}",
+                )
@@ -0,0 +1,77 @@
+#  holidays
+#  --------
+#  A fast, efficient Python library for generating country, province and state
+#  specific sets of holidays on the fly. It aims to make determining whether a
+#  specific date is a holiday as fast and flexible as possible.
+#
+#  Authors: Vacanza Team and individual contributors (see CONTRIBUTORS file)
+#           dr-prodigy <dr.prodigy.github@gmail.com> (c) 2017-2023
+#           ryanss <ryanssdev@icloud.com> (c) 2014-2017
+#  Website: https://github.com/vacanza/holidays
+#  License: MIT (see LICENSE file)
+
+import operator
+import unittest
+from datetime import date
+
+from holidays.calendars.gregorian import JAN, APR, MAY, DEC
+from holidays.calendars.islamic import (
+    EID_AL_FITR,
+    JUMUATUL_WIDA,
+    _CustomIslamicHolidays,
+    _get_holiday_dates,
+    _IslamicLunar,
+)
+
+
+class CustomIslamicHolidays(_CustomIslamicHolidays):
+    EID_AL_FITR_DATES = {
+        2023: (APR, 22),
+    }
+
+    EID_AL_FITR_DATES_CONFIRMED_YEARS = (2024, 2024)
+
+
+class TestIslamicCalendar(unittest.TestCase):
+    def test_get_holiday(self):
+        calendar = _IslamicLunar()
+        self.assertEqual(
+            tuple(calendar.eid_al_fitr_dates(2024)),
+            ((date(2023, APR, 21), True), (date(2024, APR, 10), True)),
+        )
+        self.assertEqual(
+            tuple(calendar.eid_al_adha_dates(2007)),
+            (
+                (date(2006, JAN, 10), True),
+                (date(2006, DEC, 31), True),
+                (date(2007, DEC, 20), True),
+            ),
+        )
+        self.assertEqual(tuple(calendar.eid_al_fitr_dates(1900)), ())
+
+    def test_get_holiday_custom_calendar(self):
+        calendar = CustomIslamicHolidays(calendar_delta_days=+1)
+        for year, dates in (
+            (2022, ((date(2021, MAY, 14), True), (date(2022, MAY, 3), True))),
+            (2023, ((date(2022, MAY, 3), True), (date(2023, APR, 22), False))),
+            (2024, ((date(2023, APR, 22), False), (date(2024, APR, 11), False))),
+        ):
+            self.assertEqual(tuple(calendar.eid_al_fitr_dates(year)), dates, year)
+
+        self.assertEqual(
+            tuple(calendar._get_holiday(EID_AL_FITR, 2022, use_delta=False)),
+            ((date(2021, MAY, 13), True), (date(2022, MAY, 2), True)),
+        )
+        self.assertEqual(
+            tuple(calendar.jumuatul_wida_dates(2024)),
+            tuple(_IslamicLunar().jumuatul_wida_dates(2024)),
+        )
+
+    def test_holiday_dates_cache(self):
+        dates = _get_holiday_dates(CustomIslamicHolidays, EID_AL_FITR, 1)
+        self.assertIs(dates, _get_holiday_dates(CustomIslamicHolidays, EID_AL_FITR, 1))
+        self.assertIsNot(dates, _get_holiday_dates(CustomIslamicHolidays, EID_AL_FITR, 0))
+        self.assertIsNot(dates, _get_holiday_dates(_IslamicLunar, EID_AL_FITR, 1))
+        self.assertIsNot(dates, _get_holiday_dates(CustomIslamicHolidays, JUMUATUL_WIDA, 1))
+        self.assertRaises(TypeError, operator.setitem, dates, 2024, ())
+        self.assertEqual(dates[2024], ((date(2023, APR, 22), False), (date(2024, APR, 11), False)))
@@ -10,7 +10,9 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import gc
 import unittest
+import weakref
 from datetime import date
 
 from holidays import calendars
@@ -317,6 +319,22 @@ class TestThaiLunisolarCalendar(unittest.TestCase):
             result = self.calendar.buddhist_sabbath_dates(year)
             self.assertEqual(result, expected_dates)
 
+        self.assertEqual(self.calendar.buddhist_sabbath_dates(self.calendar.START_YEAR - 1), set())
+        self.assertEqual(self.calendar.buddhist_sabbath_dates(self.calendar.END_YEAR + 1), set())
+
+    def test_calendar_caches(self):
+        calendar = calendars._ThaiLunisolar(KHMER_CALENDAR)
+        self.assertIs(
+            calendar.buddhist_sabbath_dates(2024), self.calendar.buddhist_sabbath_dates(2024)
+        )
+        self.assertIsInstance(calendar.buddhist_sabbath_dates(2024), frozenset)
+        self.assertEqual(calendar._get_start_date(2024), self.calendar._get_start_date(2024))
+
+        calendar_ref = weakref.ref(calendar)
+        del calendar
+        gc.collect()
+        self.assertIsNone(calendar_ref())
+
     def test_khao_phansa_date(self):
         # THAI_CALENDAR
         khao_phansa_year_date = {
@@ -804,6 +804,20 @@ class TestNewYorkStockExchange(CommonFinancialTests, TestCase):
             ("2025-12-24", "Christmas Eve (markets close at 1:00pm)"),
         )
 
+    def test_categories_reassignment(self):
+        # Half-day ranges skip public holidays, so categories can't be merged independently.
+        years = range(1960, 1971)
+        nyse = NewYorkStockExchange(years=years)
+        nyse.categories = set(nyse.supported_categories)
+        self.assertEqual(
+            nyse, NewYorkStockExchange(categories=nyse.supported_categories, years=years)
+        )
+        self.assertEqual(nyse[date(1968, 2, 22)], "Washington's Birthday")
+        self.assertEqual(nyse[date(1969, 11, 27)], "Thanksgiving Day")
+
+        nyse.categories = {HALF_DAY}
+        self.assertEqual(nyse, NewYorkStockExchange(categories=HALF_DAY, years=years))
+
     def test_l10n_default(self):
         self.assertLocalizedHolidays(
             ("2024-01-01", "New Year's Day"),
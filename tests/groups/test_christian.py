@@ -10,9 +10,15 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+from datetime import timedelta
 from unittest import TestCase
 
+from dateutil.easter import EASTER_ORTHODOX, EASTER_WESTERN, easter
+
+from holidays.calendars.gregorian import GREGORIAN_CALENDAR
+from holidays.calendars.julian import JULIAN_CALENDAR
 from holidays.groups import ChristianHolidays
+from holidays.groups.christian import _get_easter_date
 from holidays.holiday_base import HolidayBase
 
 
@@ -35,3 +41,32 @@ class TestChristianHolidays(TestCase):
         test_holidays._add_christmas_day_three("Third day")
         self.assertIn("2022-12-27", test_holidays)
         self.assertEqual(1, len(test_holidays))
+
+    def test_easter_dates(self):
+        for method in (EASTER_ORTHODOX, EASTER_WESTERN):
+            for year in range(1901, 2101):
+                easter_sunday = easter(year, method=method)
+                self.assertEqual(_get_easter_date(year, method), easter_sunday)
+                for days in (-48, -2, +1, +39, +60):
+                    self.assertEqual(
+                        _get_easter_date(year, method, days),
+                        easter_sunday + timedelta(days=days),
+                    )
+
+    def test_easter_calendars(self):
+        class TestHolidays(HolidayBase, ChristianHolidays):
+            def __init__(self, *args, **kwargs):
+                ChristianHolidays.__init__(self, JULIAN_CALENDAR)
+                super().__init__(*args, **kwargs)
+
+        test_holidays = TestHolidays()
+        test_holidays._populate(2024)
+        self.assertEqual(test_holidays._easter_sunday.isoformat(), "2024-05-05")
+        self.assertEqual(test_holidays._add_good_friday("Good Friday").isoformat(), "2024-05-03")
+        self.assertEqual(
+            test_holidays._add_easter_monday("Easter Monday", GREGORIAN_CALENDAR).isoformat(),
+            "2024-04-01",
+        )
+        self.assertRaises(
+            ValueError, lambda: test_holidays._add_easter_sunday("Easter", "INVALID_CALENDAR")
+        )
@@ -12,10 +12,33 @@
 
 from unittest import TestCase
 
-from holidays.helpers import _normalize_arguments, _normalize_tuple
+from holidays.calendars import thai
+from holidays.calendars.hebrew import _HebrewLunisolar
+from holidays.helpers import (
+    _get_lazy_package_attributes,
+    _normalize_arguments,
+    _normalize_tuple,
+)
 
 
 class TestHelpers(TestCase):
+    def test_get_lazy_package_attributes(self):
+        getattr_, dir_, all_ = _get_lazy_package_attributes(
+            "holidays.calendars",
+            {
+                "hebrew": ("_HebrewLunisolar",),
+                "thai": ("_ThaiLunisolar", "KHMER_CALENDAR", "THAI_CALENDAR"),
+            },
+        )
+        self.assertEqual(all_, ("KHMER_CALENDAR", "THAI_CALENDAR"))
+        self.assertIs(getattr_("_HebrewLunisolar"), _HebrewLunisolar)
+        self.assertEqual(getattr_("KHMER_CALENDAR"), thai.KHMER_CALENDAR)
+        self.assertIs(getattr_("thai"), thai)
+        self.assertIn("_HebrewLunisolar", dir_())
+        self.assertIn("hebrew", dir_())
+        self.assertRaises(AttributeError, getattr_, "hindu")
+        self.assertRaises(AttributeError, getattr_, "_HinduLunisolar")
+
     def test_normalize_arguments(self):
         empty_set = set()
         input_expected_pairs = (
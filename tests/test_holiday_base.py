@@ -10,17 +10,26 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import operator
 import pickle
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from datetime import timedelta as td
 
-from holidays.calendars.gregorian import JAN, FEB, OCT, DEC, MON, TUE, SAT, SUN
+from holidays.calendars.gregorian import JAN, FEB, OCT, DEC, MON, TUE, THU, FRI, SAT, SUN
 from holidays.constants import HOLIDAY_NAME_DELIMITER, OPTIONAL, PUBLIC, SCHOOL
 from holidays.countries import UA, US
 from holidays.groups.christian import ChristianHolidays
 from holidays.groups.custom import StaticHolidays
-from holidays.holiday_base import HolidayBase
+from holidays.helpers import _compile_special_holidays, _SpecialHoliday, _SubstitutedHoliday
+from holidays.holiday_base import (
+    CombinedWorkingDays,
+    CompactHolidays,
+    FrozenHolidaysError,
+    HolidayBase,
+    HolidayFlags,
+)
 
 
 class EntityStubStaticHolidays:
@@ -136,6 +145,23 @@ class CountryStub6(EntityStub, StaticHolidays):
         self._add_holiday_oct_12("Columbus Day")
 
 
+class CountryStub7(HolidayBase):
+    country = "CS7"
+
+    def _populate(self, year: int) -> None:
+        super()._populate(year)
+        if year % 2 == 0:
+            self._add_holiday_may_1("Custom May 1st Holiday")
+        # Depends on the next year holidays.
+        elif date(year + 1, 5, 1) in self:
+            self._add_holiday_dec_31("Custom December 31st Holiday")
+
+
+class CountryStub8(CountryStub3):
+    country = "CS8"
+    weekend = {FRI, SAT}
+
+
 class MarketStub1(EntityStub):
     market = "MS1"
 
@@ -293,6 +319,204 @@ class TestCategories(unittest.TestCase):
                 for dt in categories[category]:
                     self.assertIn(dt, ccc)
 
+    def test_populate_dispatch(self):
+        ccc = TestCategories.CustomCategoryClass(
+            years=2024, categories={"CC", "CC_2"}, subdiv="SD_1"
+        )
+        self.assertTupleEqual(
+            ccc._get_populate_dispatch(),
+            ((("CC", ccc._populate_cc_holidays), ("CC_2", ccc._populate_cc_2_holidays)), ()),
+        )
+        self.assertTupleEqual(
+            ccc._get_populate_dispatch(subdiv=True),
+            ((("CC", ccc._populate_subdiv_sd_1_cc_holidays),), ()),
+        )
+
+        ccc.categories = {"CC_1"}
+        self.assertTupleEqual(
+            ccc._get_populate_dispatch(subdiv=True),
+            ((("CC_1", ccc._populate_subdiv_sd_1_cc_1_holidays),), ()),
+        )
+
+        hb = CountryStub1(years=2024, categories={PUBLIC, SCHOOL})
+        self.assertTupleEqual(
+            hb._get_populate_dispatch(),
+            (
+                (),
+                (
+                    (
+                        PUBLIC,
+                        _compile_special_holidays(
+                            EntityStubStaticHolidays.special_public_holidays
+                        ),
+                    ),
+                ),
+            ),
+        )
+        self.assertTupleEqual(hb._get_populate_dispatch(observed=True), ((), ()))
+
+    def test_reassignment(self):
+        ccc_cls = TestCategories.CustomCategoryClass
+        ccc = ccc_cls(years={2023, 2024}, categories="CC", subdiv="SD_1")
+        for categories in ({"CC", "CC_1"}, {"CC_2"}, {"CC", "CC_1"}, {"CC", "CC_1", "CC_2"}):
+            ccc.categories = categories
+            self.assertDictEqual(
+                ccc, ccc_cls(years={2023, 2024}, categories=categories, subdiv="SD_1")
+            )
+
+        ccc.observed = False
+        self.assertDictEqual(
+            ccc,
+            ccc_cls(years={2023, 2024}, categories=ccc.categories, observed=False, subdiv="SD_1"),
+        )
+
+        hb = CountryStub1(years=2024, categories=SCHOOL)
+        hb.categories = {PUBLIC, SCHOOL}
+        self.assertDictEqual(hb, CountryStub1(years=2024, categories={PUBLIC, SCHOOL}))
+        self.assertIn(date(2024, 2, 24), hb.weekend_workdays)
+        self.assertTrue(hb.is_working_day("2024-02-24"))
+
+    def test_reassignment_interdependent_categories(self):
+        class InterdependentCategoriesClass(TestCategories.CustomCategoryClass):
+            def _populate_cc_2_holidays(self):
+                if date(self._year, 5, 15) in self:
+                    self._add_holiday_may_17("CC2 Holiday")
+
+        icc = InterdependentCategoriesClass(years=2024, categories={"CC_1", "CC_2"})
+        self.assertNotIn("2024-05-17", icc)
+
+        icc.categories = {"CC", "CC_1", "CC_2"}
+        self.assertIn("2024-05-17", icc)
+
+
+class TestCombinedWorkingDays(unittest.TestCase):
+    def setUp(self):
+        self.hb_1 = CountryStub6()
+        self.hb_2 = CountryStub8()
+        self.all_open = CombinedWorkingDays(self.hb_1, self.hb_2)
+        self.any_open = CombinedWorkingDays(self.hb_1, self.hb_2, closed="all")
+
+    def test_args(self):
+        self.assertRaises(ValueError, lambda: CombinedWorkingDays())
+        self.assertRaises(ValueError, lambda: CombinedWorkingDays(self.hb_1, closed="none"))
+
+    def test_changes(self):
+        self.assertTrue(self.all_open.is_working_day("2024-02-20"))
+        self.hb_2["2024-02-20"] = "Custom Holiday"
+        self.assertFalse(self.all_open.is_working_day("2024-02-20"))
+        self.assertTrue(self.any_open.is_working_day("2024-02-20"))
+        self.hb_2.pop("2024-02-20")
+        self.assertTrue(self.all_open.is_working_day("2024-02-20"))
+
+        self.assertEqual(self.all_open.get_working_days_count("2024-02-24", "2024-02-25"), 0)
+        self.hb_1.weekend_workdays.add(date(2024, 2, 25))
+        self.hb_2.weekend_workdays.add(date(2024, 2, 25))
+        self.assertEqual(self.all_open.get_working_days_count("2024-02-24", "2024-02-25"), 1)
+
+    def test_get_nth_working_day(self):
+        self.assertEqual(self.all_open.get_nth_working_day("2024-02-22", +1), date(2024, 2, 26))
+        self.assertEqual(self.any_open.get_nth_working_day("2024-02-22", +1), date(2024, 2, 23))
+        self.assertEqual(self.all_open.get_nth_working_day("2024-04-30", +1), date(2024, 5, 6))
+        self.assertEqual(self.any_open.get_nth_working_day("2024-04-30", +1), date(2024, 5, 3))
+        self.assertEqual(self.all_open.get_nth_working_day("2024-05-06", -1), date(2024, 4, 30))
+        self.assertEqual(self.all_open.get_nth_working_day("2024-12-31", +1), date(2025, 1, 2))
+        self.assertEqual(self.any_open.get_nth_working_day("2024-12-31", +1), date(2025, 1, 1))
+
+    def test_get_working_days_count(self):
+        self.assertEqual(self.all_open.get_working_days_count("2024-02-19", "2024-02-25"), 3)
+        self.assertEqual(self.any_open.get_working_days_count("2024-02-19", "2024-02-25"), 7)
+
+        dt = date(2023, 1, 1)
+        all_open_count = any_open_count = 0
+        while dt <= date(2025, 12, 31):
+            all_open_count += self.hb_1.is_working_day(dt) and self.hb_2.is_working_day(dt)
+            any_open_count += self.hb_1.is_working_day(dt) or self.hb_2.is_working_day(dt)
+            dt += td(days=1)
+        self.assertEqual(
+            self.all_open.get_working_days_count("2023-01-01", "2025-12-31"), all_open_count
+        )
+        self.assertEqual(
+            self.any_open.get_working_days_count("2025-12-31", "2023-01-01"), any_open_count
+        )
+
+    def test_is_working_day(self):
+        for dt, all_open, any_open in (
+            ("2024-02-19", False, True),
+            ("2024-02-23", False, True),
+            ("2024-02-24", False, True),
+            ("2024-02-25", False, True),
+            ("2024-02-26", True, True),
+            ("2024-05-01", False, False),
+            (date(2024, 5, 3), False, True),
+        ):
+            self.assertEqual(self.all_open.is_working_day(dt), all_open, dt)
+            self.assertEqual(self.any_open.is_working_day(dt), any_open, dt)
+
+
+class TestCompactHolidays(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub3(years=range(2020, 2023))
+        self.hb["2021-05-02"] = "Custom May 1st Holiday"
+        self.compact_holidays = CompactHolidays(self.hb)
+
+    def test_contains(self):
+        for dt in ("2020-05-01", date(2021, 5, 2), datetime(2022, 5, 2, 10), "05/01/2022"):
+            self.assertIn(dt, self.compact_holidays)
+        for dt in ("2020-01-01", "2021-05-03", "2019-05-01", "2023-05-01"):
+            self.assertNotIn(dt, self.compact_holidays)
+        self.assertRaises(TypeError, lambda: [] in self.compact_holidays)
+
+    def test_get(self):
+        self.assertEqual(self.compact_holidays["2020-05-01"], "Custom May 1st Holiday")
+        self.assertEqual(
+            self.compact_holidays["2021-05-02"], "Custom May 1st Holiday; Custom May 2nd Holiday"
+        )
+        self.assertRaises(KeyError, lambda: self.compact_holidays["2023-05-01"])
+        self.assertEqual(self.compact_holidays.get("2022-05-02"), "Custom May 2nd Holiday")
+        self.assertIsNone(self.compact_holidays.get("2022-05-03"))
+        self.assertEqual(self.compact_holidays.get("2022-05-03", "Not a holiday"), "Not a holiday")
+        self.assertEqual(
+            self.compact_holidays.get_list("2021-05-02"),
+            ["Custom May 1st Holiday", "Custom May 2nd Holiday"],
+        )
+        self.assertEqual(self.compact_holidays.get_list("2021-05-03"), [])
+
+    def test_get_named(self):
+        for lookup in ("contains", "exact", "startswith", "icontains", "iexact", "istartswith"):
+            for name in ("custom may 1st holiday", "Custom May 2nd Holiday", "Custom", "Holiday"):
+                for split_multiple_names in (True, False):
+                    self.assertEqual(
+                        self.compact_holidays.get_named(name, lookup, split_multiple_names),
+                        sorted(self.hb.get_named(name, lookup, split_multiple_names)),
+                    )
+        self.assertRaises(
+            AttributeError, lambda: self.compact_holidays.get_named("Holiday", "unknown")
+        )
+
+    def test_mapping(self):
+        self.assertEqual(self.compact_holidays, self.hb)
+        self.assertEqual(len(self.compact_holidays), 6)
+        self.assertEqual(list(self.compact_holidays), sorted(self.hb))
+        self.assertEqual(
+            self.compact_holidays.names,
+            (
+                "Custom May 1st Holiday",
+                "Custom May 1st Holiday; Custom May 2nd Holiday",
+                "Custom May 2nd Holiday",
+            ),
+        )
+        self.assertEqual(self.compact_holidays.years, {2020, 2021, 2022})
+        self.assertEqual(
+            repr(CompactHolidays(CountryStub3(years=2020))),
+            "CompactHolidays({datetime.date(2020, 5, 1): 'Custom May 1st Holiday', "
+            "datetime.date(2020, 5, 2): 'Custom May 2nd Holiday'})",
+        )
+
+    def test_pickle(self):
+        compact_holidays = pickle.loads(pickle.dumps(self.compact_holidays))
+        self.assertEqual(compact_holidays, self.compact_holidays)
+        self.assertEqual(compact_holidays.names, self.compact_holidays.names)
+
 
 class TestDeprecationWarnings(unittest.TestCase):
     def test_prov_deprecation(self):
@@ -380,6 +604,159 @@ class TestEqualityInequality(unittest.TestCase):
         self.assertFalse(hb_3 != hb_3)
 
 
+class TestFreeze(unittest.TestCase):
+    def setUp(self):
+        self.hb = CountryStub3(years=2020).freeze(years=(2021, 2022))
+
+    def test_expand(self):
+        self.assertTrue(self.hb.frozen)
+        self.assertFalse(self.hb.expand)
+        self.assertEqual(self.hb.years, {2020, 2021, 2022})
+        self.assertIn("2021-05-01", self.hb)
+        self.assertNotIn("2023-05-01", self.hb)
+        self.assertIsNone(self.hb.get("2019-05-02"))
+        self.assertEqual(self.hb.get_working_days_count("2022-12-30", "2023-01-02"), 2)
+        self.assertEqual(self.hb.years, {2020, 2021, 2022})
+        self.assertEqual(self.hb.freeze(2021), self.hb)
+
+    def test_hash(self):
+        self.assertEqual(hash(self.hb), hash(CountryStub3(years=range(2020, 2023)).freeze()))
+        self.assertNotEqual(hash(self.hb), hash(CountryStub3(years=2020).freeze()))
+        self.assertEqual(len({self.hb: 1, self.hb.copy(): 2}), 1)
+        self.assertRaises(TypeError, lambda: hash(CountryStub3()))
+
+    def test_modify(self):
+        self.assertTrue(issubclass(FrozenHolidaysError, AttributeError))
+        self.assertTrue(issubclass(FrozenHolidaysError, TypeError))
+
+        for modify in (
+            lambda: operator.setitem(self.hb, "2020-01-01", "Holiday"),
+            lambda: self.hb.update({"2020-01-01": "Holiday"}),
+            lambda: self.hb.append("2020-01-01"),
+            lambda: self.hb.pop("2020-05-01"),
+            lambda: self.hb.pop_named("May"),
+            lambda: self.hb.freeze(2023),
+            lambda: operator.delitem(self.hb, "2020-05-01"),
+            lambda: operator.ior(self.hb, {"2020-01-01": "Holiday"}),
+            self.hb.clear,
+            self.hb.popitem,
+            lambda: self.hb.setdefault("2020-01-01"),
+            lambda: self.hb.weekend_workdays.add(date(2020, 1, 4)),
+            self.hb.weekend_workdays.clear,
+            lambda: setattr(self.hb, "categories", {PUBLIC}),
+            lambda: setattr(self.hb, "expand", True),
+            lambda: setattr(self.hb, "frozen", False),
+            lambda: setattr(self.hb, "language", "fr"),
+            lambda: setattr(self.hb, "observed", False),
+            lambda: setattr(self.hb, "subdiv", "Subdiv 1"),
+            lambda: setattr(self.hb, "weekend", {FRI, SAT}),
+            lambda: setattr(self.hb, "weekend_workdays", {date(2020, 1, 4)}),
+            lambda: setattr(self.hb, "years", {2020}),
+        ):
+            self.assertRaises(FrozenHolidaysError, modify)
+        self.assertEqual(len(self.hb), 6)
+        self.assertEqual(self.hb.years, {2020, 2021, 2022})
+        self.assertEqual(self.hb.weekend_workdays, set())
+        self.assertEqual(hash(self.hb), hash(CountryStub3(years=range(2020, 2023)).freeze()))
+
+        # Weekend workdays of the original object aren't frozen.
+        hb = CountryStub3(years=2020)
+        weekend_workdays = hb.weekend_workdays
+        hb.freeze()
+        weekend_workdays.add(date(2020, 1, 4))
+        self.assertNotIn(date(2020, 1, 4), hb.weekend_workdays)
+
+    def test_pickle(self):
+        hb = pickle.loads(pickle.dumps(self.hb))
+        self.assertTrue(hb.frozen)
+        self.assertEqual(hb, self.hb)
+        self.assertEqual(hash(hb), hash(self.hb))
+        self.assertRaises(FrozenHolidaysError, lambda: hb.pop("2020-05-01"))
+        self.assertRaises(FrozenHolidaysError, lambda: hb.weekend_workdays.add(date(2020, 1, 4)))
+
+    def test_sum(self):
+        hb = self.hb + CountryStub2()
+        self.assertIn("2023-03-01", hb)
+        self.assertNotIn("2023-05-01", hb)
+        self.assertIn("2022-05-01", hb)
+        self.assertEqual(self.hb.years, {2020, 2021, 2022})
+
+
+class TestGetFlags(unittest.TestCase):
+    def test_categories(self):
+        hb = TestCategories.CustomCategoryClass(
+            years=2024, categories={"CC", "CC_1"}, subdiv="SD_1"
+        )
+        self.assertEqual(hb.get_flags("2024-05-15"), {"CC Holiday": HolidayFlags("CC")})
+        self.assertEqual(hb.get_flags("2024-05-16"), {"CC1 Holiday": HolidayFlags("CC_1")})
+        self.assertEqual(
+            hb.get_flags("2024-07-01"),
+            {"SD_1 CC Holiday": HolidayFlags("CC"), "SD_1 CC_1 Holiday": HolidayFlags("CC_1")},
+        )
+        self.assertEqual(hb.get_flags("2024-07-02"), {})
+
+    def test_changes(self):
+        hb = CountryStub1(years=2024)
+        hb["2024-01-01"] = "Custom Holiday"
+        hb["2024-01-02"] = "Custom Holiday"
+        self.assertEqual(hb.get_flags("2024-01-01"), {"New Year's Day": HolidayFlags(PUBLIC)})
+        self.assertEqual(hb.get_flags("2024-01-02"), {})
+
+        hb_copy = hb.copy()
+        hb_copy.clear()
+        self.assertEqual(hb_copy.get_flags("2024-01-01"), {})
+        self.assertEqual(
+            pickle.loads(pickle.dumps(hb)).get_flags("2024-01-01"),
+            {"New Year's Day": HolidayFlags(PUBLIC)},
+        )
+
+        hb.pop("2024-01-01")
+        self.assertEqual(hb.get_flags("2024-01-01"), {})
+
+    def test_filter(self):
+        us = US(years=2021, categories=(PUBLIC, "unofficial"))
+        self.assertSetEqual(
+            {dt for dt in us if any(flags.observed for flags in us.get_flags(dt).values())},
+            {date(2021, 6, 18), date(2021, 7, 5), date(2021, 12, 24), date(2021, 12, 31)},
+        )
+        self.assertSetEqual(
+            {
+                dt
+                for dt in us
+                if any(flags.category == "unofficial" for flags in us.get_flags(dt).values())
+            },
+            set(US(years=2021, categories="unofficial")),
+        )
+
+    def test_special_holidays(self):
+        hb = CountryStub1(years=(2222, 2024))
+        self.assertEqual(hb.get_flags("2222-02-02"), {"Test holiday": HolidayFlags(PUBLIC)})
+        self.assertEqual(
+            hb.get_flags("2024-02-19"), {"From 24/02/2024": HolidayFlags(PUBLIC, substituted=True)}
+        )
+
+    def test_sum(self):
+        hb = CountryStub1(years=2024) + TestCategories.CustomCategoryClass(
+            years=2024, categories="CC_1"
+        )
+        self.assertEqual(hb.get_flags("2024-01-01"), {"New Year's Day": HolidayFlags(PUBLIC)})
+        self.assertEqual(hb.get_flags("2024-05-16"), {"CC1 Holiday": HolidayFlags("CC_1")})
+
+        hb_1 = CountryStub1(years=2024)
+        hb_2 = CountryStub1(years=2024)
+        hb_2._holiday_flags[(date(2024, 1, 1), "New Year's Day")] = HolidayFlags(
+            "CC", estimated=True
+        )
+        for hb in (hb_1 + hb_2, hb_2 + hb_1):
+            self.assertEqual(hb.get_flags("2024-01-01"), {"New Year's Day": HolidayFlags(PUBLIC)})
+
+        # Only flags of the merged years are taken from the operands.
+        hb = hb_1 + hb_2
+        self.assertIn("2030-01-01", hb_1)
+        self.assertIn("2025-01-01", hb)
+        self.assertSetEqual({dt.year for dt, _ in hb._holiday_flags}, {2024, 2025})
+
+
 class TestGetList(unittest.TestCase):
     def test_get_list_multiple_countries(self):
         hb_country_1 = CountryStub1(years=2021)
@@ -417,6 +794,28 @@ class TestGetList(unittest.TestCase):
 
 
 class TestGetNamed(unittest.TestCase):
+    def test_changes(self):
+        hb = CountryStub1(years=2022)
+        self.assertListEqual(hb.get_named("Independence Day", lookup="exact"), [date(2022, 7, 4)])
+        self.assertListEqual(hb.get_named("Custom Holiday", lookup="iexact"), [])
+
+        hb["2022-07-05"] = "Independence Day"
+        hb["2022-07-04"] = "Custom Holiday"
+        self.assertListEqual(
+            hb.get_named("Independence Day", lookup="exact"), [date(2022, 7, 4), date(2022, 7, 5)]
+        )
+        self.assertListEqual(hb.get_named("custom holiday", lookup="iexact"), [date(2022, 7, 4)])
+
+        hb.pop("2022-07-04")
+        self.assertListEqual(hb.get_named("Independence Day", lookup="exact"), [date(2022, 7, 5)])
+        self.assertListEqual(hb.get_named("custom holiday", lookup="iexact"), [])
+
+        dict.__setitem__(hb, date(2022, 7, 6), "Independence Day")
+        self.assertListEqual(
+            hb.get_named("independence", lookup="istartswith"),
+            [date(2022, 7, 5), date(2022, 7, 6)],
+        )
+
     def test_contains(self):
         hb = CountryStub1(years=2022)
         for name in ("New", "Year"):
@@ -692,6 +1091,22 @@ class TestHolidaySum(unittest.TestCase):
         self.assertIn("2015-01-01", hb_combined)
         self.assertListEqual(hb_combined.market, ["MS1", "MS2"])
 
+    def test_add_populated_years(self):
+        hb_1 = CountryStub2(years=2022)
+        hb_1.pop("2022-03-01")
+        hb_2 = CountryStub3()
+        hb_combined = hb_1 + hb_2
+
+        # Populated years of operands are not re-populated.
+        self.assertNotIn("2022-03-01", hb_combined)
+        self.assertIn("2022-05-01", hb_combined)
+        self.assertSetEqual(hb_2.years, {2022})
+
+        self.assertIn("2023-03-01", hb_combined)
+        self.assertIn("2023-05-01", hb_combined)
+        self.assertSetEqual(hb_1.years, {2022, 2023})
+        self.assertSetEqual(hb_2.years, {2022, 2023})
+
     def test_args(self):
         self.hb_1 = CountryStub1(years=2014, subdiv="Subdiv 1")
         self.hb_2 = CountryStub2(years=2015, subdiv="Subdiv-3")
@@ -760,6 +1175,25 @@ class TestIsWeekend(unittest.TestCase):
         for dt in (date(2022, 10, 3), date(2022, 10, 4), "2022-10-03", "2022-10-04"):
             self.assertFalse(self.hb.is_weekend(dt))
 
+    def test_is_weekend_date_dependent(self):
+        class WeekendChangeStub(HolidayBase):
+            def _get_weekend(self, dt):
+                return {FRI, SAT} if dt >= date(2022, 9, 1) else {THU, FRI}
+
+        hb = WeekendChangeStub()
+        for year in (2021, 2022, 2024):
+            dt = date(year, 1, 1)
+            while dt.year == year:
+                self.assertEqual(hb.is_weekend(dt), dt.weekday() in hb._get_weekend(dt), dt)
+                self.assertEqual(hb.is_working_day(dt), not hb.is_weekend(dt), dt)
+                dt += td(days=1)
+        self.assertEqual(set(hb._workweek_bitmaps), {2021, 2022, 2024})
+
+        self.hb.weekend = {FRI, SAT}
+        self.assertTrue(self.hb.is_weekend("2022-09-02"))
+        self.assertFalse(self.hb.is_weekend("2022-09-04"))
+        self.assertEqual(set(self.hb._workweek_bitmaps), {2022})
+
 
 class TestKeyTransforms(unittest.TestCase):
     def setUp(self):
@@ -813,6 +1247,51 @@ class TestKeyTransforms(unittest.TestCase):
         self.assertNotIn("2014-03-01", self.hb)
         self.assertEqual(self.hb.pop("01/03/2014"), "Fake Holiday")
 
+    def test_expand_nested(self):
+        hb = CountryStub7()
+        self.assertIn("2009-12-31", hb)
+        self.assertIn("2010-05-01", hb)
+        self.assertEqual(hb.years, {2009, 2010})
+
+    def test_expand_threads(self):
+        years = range(1950, 2050)
+        expected = US(years=years)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(5):
+                hb = US()
+                list(executor.map(lambda year: date(year, 7, 4) in hb, [*years, *years]))
+                self.assertEqual(hb.years, set(years))
+                self.assertEqual(dict(hb), dict(expected))
+
+    def test_string_date_formats(self):
+        for key in ("01/01/2014", "1/1/2014", "01-01-2014", "1.1.2014", "2014/1/1", "2014.01.01"):
+            self.assertIn(key, self.hb)
+            self.assertEqual(self.hb[key], "New Year's Day")
+
+        # Day first dates are handled by `dateutil`.
+        self.assertIn("25/12/2014", self.hb)
+        self.assertIn("25 December 2014", self.hb)
+        self.assertRaises(ValueError, lambda: "2014.13.01" in self.hb)
+
+        self.hb.date_formats = ("%d|%m|%Y",)
+        self.assertIn("25|12|2014", self.hb)
+        self.assertIn("12/25/2014", self.hb)
+
+    def test_string_strict(self):
+        self.hb.strict_date_parsing = True
+        self.assertIn("2014-01-01", self.hb)
+        self.assertIn("20140101", self.hb)
+        self.assertIn("01/01/2014", self.hb)
+        self.assertRaises(ValueError, lambda: "25/12/2014" in self.hb)
+        self.assertRaises(ValueError, lambda: "25 December 2014" in self.hb)
+        # Non-ASCII digits.
+        self.assertRaises(
+            ValueError, lambda: "\u0660\u0661/\u0660\u0661/\u0662\u0660\u0661\u0664" in self.hb
+        )
+        self.assertRaises(
+            ValueError, lambda: "\uff10\uff11/\uff10\uff11/\uff12\uff10\uff11\uff14" in self.hb
+        )
+
     def test_timestamp(self):
         self.assertIn(1388552400, self.hb)
         self.assertEqual(self.hb[1388552400], "New Year's Day")
@@ -898,6 +1377,16 @@ class TestPopNamed(unittest.TestCase):
         # 0 holiday names.
         self.assertNotIn(dt, self.hb)
 
+    def test_multiple_matching_names(self):
+        dt = date(2022, 2, 22)
+        self.hb[dt] = "Holiday Name 1"
+        self.hb[dt] = "Holiday Name 2"
+        self.hb[dt] = "Other Holiday"
+        self.assertEqual(self.hb.get_named("Holiday Name"), [dt, dt])
+
+        self.assertEqual(self.hb.pop_named("Holiday Name"), [dt])
+        self.assertEqual(self.hb[dt], "Other Holiday")
+
     def test_partial(self):
         self.assertIn("2014-01-01", self.hb)
         for dt in self.hb.pop_named("N"):
@@ -1056,6 +1545,23 @@ class TestSpecialHolidays(unittest.TestCase):
         self.assertIn("3333-02-02", self.hb)
         self.assertSetEqual(self.hb.years, {1111, 2222, 3333})
 
+    def test_special_holidays_index(self):
+        mapping, index = self.hb._special_holidays["special_public_holidays"]
+        self.assertIs(mapping, EntityStubStaticHolidays.special_public_holidays)
+        # Precompiled once per static holidays class.
+        self.assertIs(CountryStub1()._special_holidays["special_public_holidays"][1], index)
+        self.assertRaises(TypeError, lambda: operator.setitem(index, 1111, ()))
+
+        self.assertNotIn(4444, index)
+        self.assertTupleEqual(index[1111], (_SpecialHoliday(date(1111, 1, 1), "Test holiday"),))
+        self.assertTupleEqual(
+            index[1991],
+            (
+                _SubstitutedHoliday(date(1991, 1, 7), date(1991, 1, 12)),
+                _SubstitutedHoliday(date(1991, 1, 8), date(1991, 1, 13)),
+            ),
+        )
+
 
 class TestStandardMethods(unittest.TestCase):
     def setUp(self):
@@ -1093,6 +1599,14 @@ class TestStandardMethods(unittest.TestCase):
         self.assertEqual(bool(self.hb), True)
         self.assertNotEqual(len(self.hb), 0)
 
+    def test_clear(self):
+        self.assertIn("2014-01-01", self.hb)
+        self.hb.clear()
+        self.assertEqual(len(self.hb), 0)
+        self.assertEqual(self.hb.years, {2014})
+        self.assertListEqual(self.hb["2014-01-01":"2014-12-31"], [])
+        self.assertNotIn("2014-01-01", self.hb)
+
     def test_contains(self):
         self.assertIn("2014-01-01", self.hb)
         self.assertNotIn("2014-01-03", self.hb)
@@ -1109,6 +1623,12 @@ class TestStandardMethods(unittest.TestCase):
         self.assertNotEqual(hb, hb_xx)
         self.assertNotEqual(hb.copy(), hb_xx.copy())
 
+    def test_delitem(self):
+        del self.hb["2014-01-01"]
+        self.assertNotIn("2014-01-01", self.hb)
+        self.assertListEqual(self.hb["2014-01-01":"2014-01-31"], [])
+        self.assertRaises(KeyError, operator.delitem, self.hb, "2014-01-01")
+
     def test_get(self):
         self.assertEqual(self.hb.get("2014-01-01"), "New Year's Day")
         self.assertIsNone(self.hb.get("2014-01-03"))
@@ -1145,6 +1665,23 @@ class TestStandardMethods(unittest.TestCase):
         )
         self.assertRaises(AttributeError, lambda: self.hb._add_holiday_1st_sat_from_fe_10(name))
 
+    def test_getattr_cache(self):
+        class CountryStub(HolidayBase):
+            def _populate(self, year: int) -> None:
+                super()._populate(year)
+                self._add_holiday_last_mon_of_may("Test")
+
+        self.assertNotIn("_add_holiday_last_mon_of_may", CountryStub.__dict__)
+        hb_2023 = CountryStub(years=2023)
+        self.assertIn("_add_holiday_last_mon_of_may", CountryStub.__dict__)
+        hb_2024 = CountryStub(years=2024)
+        self.assertListEqual(list(hb_2023), [date(2023, 5, 29)])
+        self.assertListEqual(list(hb_2024), [date(2024, 5, 27)])
+
+        self.assertNotIn("_add_holiday_nam_12", HolidayBase.__dict__)
+        self.assertRaises(AttributeError, lambda: hb_2024._add_holiday_nam_12("Test"))
+        self.assertNotIn("_add_holiday_nam_12", CountryStub.__dict__)
+
     def test_getitem(self):
         self.assertEqual(self.hb["2014-01-01"], "New Year's Day")
         self.assertEqual(self.hb.get("2014-01-01"), "New Year's Day")
@@ -1182,6 +1719,44 @@ class TestStandardMethods(unittest.TestCase):
         self.assertRaises(ValueError, lambda: self.hb["2014-01-01":"2014-01-02":0])
         self.assertRaises(ValueError, lambda: self.hb["2014-01-01" : "2014-01-02" : td(hours=12)])
 
+    def test_getitem_slice_changes(self):
+        self.assertListEqual(
+            self.hb["2013-12-24":"2014-01-02"], [date(2013, 12, 25), date(2014, 1, 1)]
+        )
+
+        self.hb["2013-12-31"] = "Custom Holiday"
+        self.hb.pop("2013-12-25")
+        self.assertListEqual(
+            self.hb["2013-12-24":"2014-01-02"], [date(2013, 12, 31), date(2014, 1, 1)]
+        )
+
+        dict.clear(self.hb)
+        self.assertListEqual(self.hb["2013-12-24":"2014-01-02"], [])
+
+        hb = CountryStub3()
+        self.assertListEqual(
+            hb["2010-05-02":"2013-05-01"],
+            [date(2010, 5, 2), date(2011, 5, 1), date(2011, 5, 2), date(2012, 5, 1)]
+            + [date(2012, 5, 2)],
+        )
+        self.assertEqual(hb.years, {2010, 2011, 2012, 2013})
+
+    def test_ior(self):
+        hb = self.hb
+        hb |= {"2014-01-03": "Custom Holiday"}
+        self.assertIs(hb, self.hb)
+        self.assertEqual(self.hb["2014-01-03"], "Custom Holiday")
+        self.assertListEqual(self.hb.get_named("Custom"), [date(2014, 1, 3)])
+
+    def test_popitem(self):
+        self.hb["2014-01-03"] = "Custom Holiday"
+        self.assertEqual(self.hb.popitem(), (date(2014, 1, 3), "Custom Holiday"))
+        self.assertNotIn("2014-01-03", self.hb)
+        self.assertListEqual(self.hb.get_named("Custom"), [])
+
+        self.hb.clear()
+        self.assertRaises(KeyError, self.hb.popitem)
+
     def test_radd(self):
         self.assertRaises(TypeError, lambda: 1 + CountryStub1())
 
@@ -1196,6 +1771,15 @@ class TestStandardMethods(unittest.TestCase):
         self.hb["2014-01-04"] = "Custom Holiday; Another Custom Holiday"
         self.assertEqual(self.hb["2014-01-04"], "Another Custom Holiday; Custom Holiday")
 
+    def test_setdefault(self):
+        self.assertEqual(self.hb.setdefault("2014-01-01", "Custom Holiday"), "New Year's Day")
+        self.assertEqual(self.hb.setdefault("2014-01-03", "Custom Holiday"), "Custom Holiday")
+        self.assertEqual(self.hb.setdefault(date(2014, 1, 4)), "Holiday")
+        self.assertListEqual(
+            self.hb["2014-01-01":"2014-01-05"],
+            [date(2014, 1, 1), date(2014, 1, 3), date(2014, 1, 4)],
+        )
+
     def test_update(self):
         self.hb.update(
             {
@@ -1358,6 +1942,32 @@ class TestWorkdays(unittest.TestCase):
         self.assertEqual(self.hb.get_nth_working_day("2024-07-27", 1), date(2024, 7, 29))
         self.assertEqual(self.hb.get_nth_working_day("2024-07-29", 0), date(2024, 7, 29))
 
+    def test_get_nth_working_day_changes(self):
+        self.assertEqual(self.hb.get_nth_working_day("2024-04-29", +2), date(2024, 5, 3))
+        self.assertEqual(self.hb.get_nth_working_day("2024-05-06", -2), date(2024, 4, 30))
+
+        del self.hb["2024-05-02"]
+        self.assertEqual(self.hb.get_nth_working_day("2024-04-29", +2), date(2024, 5, 2))
+
+        self.hb["2024-04-30"] = "Custom holiday"
+        self.assertEqual(self.hb.get_nth_working_day("2024-04-29", +2), date(2024, 5, 3))
+
+        self.hb.weekend_workdays.add(date(2024, 5, 5))
+        self.assertEqual(self.hb.get_nth_working_day("2024-05-03", +1), date(2024, 5, 5))
+        self.assertEqual(self.hb.get_nth_working_day("2024-05-06", -2), date(2024, 5, 3))
+
+        self.hb.clear()
+        self.assertEqual(self.hb.get_nth_working_day("2024-04-29", +2), date(2024, 5, 1))
+
+    def test_get_nth_working_day_across_years(self):
+        hb = CountryStub3()
+        self.assertEqual(hb.get_nth_working_day("2020-12-30", +250), date(2021, 12, 15))
+        self.assertEqual(hb.get_nth_working_day("2020-01-02", -250), date(2019, 1, 15))
+        self.assertEqual(hb.get_nth_working_day("2020-12-31", +1), date(2021, 1, 1))
+        self.assertEqual(hb.get_nth_working_day("2021-01-01", -1), date(2020, 12, 31))
+        self.assertEqual(hb.get_nth_working_day("2022-01-01", 0), date(2022, 1, 3))
+        self.assertEqual(hb.years, {2019, 2020, 2021, 2022})
+
     def test_get_working_days_count(self):
         self.assertEqual(self.hb.get_working_days_count("2024-01-03", "2024-01-23"), 15)
         self.assertEqual(self.hb.get_working_days_count("2024-01-23", "2024-01-03"), 15)
@@ -1373,6 +1983,53 @@ class TestWorkdays(unittest.TestCase):
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-05"), 3)
         self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 4)
 
+    def test_get_working_days_count_across_years(self):
+        hb = CountryStub6()
+        self.assertEqual(hb.get_working_days_count("2023-12-29", "2024-01-02"), 2)
+        self.assertEqual(hb.get_working_days_count("2022-01-01", "2024-12-31"), 760)
+        self.assertEqual(hb.years, {2022, 2023, 2024})
+
+        hb = CountryStub3()
+        self.assertEqual(hb.get_working_days_count("2010-01-01", "2014-12-31"), 1297)
+        self.assertEqual(hb.years, {2010, 2011, 2012, 2013, 2014})
+
+        hb = CountryStub6(expand=False)
+        self.assertEqual(hb.get_working_days_count("2023-12-29", "2024-01-02"), 3)
+        self.assertEqual(hb.years, set())
+
+    def test_get_working_days_count_changes(self):
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 4)
+
+        self.hb["2024-04-30"] = "Custom holiday"
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 3)
+
+        self.hb.pop("2024-05-02")
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 4)
+
+        hb = pickle.loads(pickle.dumps(self.hb))
+        self.assertEqual(hb.get_working_days_count("2024-04-29", "2024-05-06"), 4)
+
+        del self.hb["2024-05-01"]
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 5)
+
+        self.hb.weekend_workdays.add(date(2024, 5, 4))
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 6)
+
+        self.hb.weekend_workdays.discard(date(2024, 5, 4))
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 5)
+
+        self.hb.weekend_workdays = {date(2024, 5, 5)}
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 6)
+
+        self.hb |= {"2024-05-03": "Custom holiday"}
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 5)
+
+        self.hb.setdefault("2024-05-06")
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 4)
+
+        self.hb.clear()
+        self.assertEqual(self.hb.get_working_days_count("2024-04-29", "2024-05-06"), 7)
+
 
 class TestClosestHoliday(unittest.TestCase):
     def setUp(self):
@@ -1505,6 +2162,28 @@ class TestClosestHoliday(unittest.TestCase):
         self.assertEqual(us.years, {2024})
         self.assertEqual(set(us.keys()), keys_before)
 
+    def test_get_closest_holiday_changes(self):
+        hb = CountryStub3(years=2024)
+        self.assertEqual(
+            hb.get_closest_holiday("2024-01-01"), (date(2024, 5, 1), "Custom May 1st Holiday")
+        )
+
+        hb["2024-03-01"] = "Custom March 1st Holiday"
+        self.assertEqual(
+            hb.get_closest_holiday("2024-01-01"), (date(2024, 3, 1), "Custom March 1st Holiday")
+        )
+
+        hb.pop("2024-03-01")
+        hb.pop("2024-05-01")
+        self.assertEqual(
+            hb.get_closest_holiday("2024-01-01"), (date(2024, 5, 2), "Custom May 2nd Holiday")
+        )
+
+        hb.categories = {PUBLIC}
+        self.assertEqual(
+            hb.get_closest_holiday("2024-01-01"), (date(2024, 5, 1), "Custom May 1st Holiday")
+        )
+
     def test_get_closest_holiday_invalid_direction(self):
         self.assertRaises(
             AttributeError, lambda: HolidayBase().get_closest_holiday(direction="invalid")
@@ -10,6 +10,8 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import subprocess
+import sys
 from unittest import TestCase
 
 import holidays
@@ -23,6 +25,46 @@ class TestHolidaysImports(TestCase):
         for name in ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN", "WEEKEND"):
             self.assertImport(name)
 
+    def test_entity_lazy_imports(self):
+        modules = subprocess.run(
+            (
+                sys.executable,
+                "-c",
+                "import sys, holidays.countries.saudi_arabia; print(*sys.modules)",
+            ),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        self.assertIn("holidays.calendars.islamic", modules)
+        for name in (
+            "holidays.calendars.hindu",
+            "holidays.countries.united_states",
+            "holidays.financial.ny_stock_exchange",
+            "holidays.groups.christian",
+        ):
+            self.assertNotIn(name, modules)
+
+    def test_entity_submodule_attributes(self):
+        # Submodules aren't imported with their packages, but remain package attributes.
+        missing_modules = subprocess.run(
+            (
+                sys.executable,
+                "-c",
+                "import holidays.calendars, holidays.countries, holidays.financial, "
+                "holidays.groups, pkgutil; print(*(f'{package.__name__}.{module.name}' "
+                "for package in (holidays.calendars, holidays.countries, holidays.financial, "
+                "holidays.groups) for module in pkgutil.iter_modules(package.__path__) "
+                "if module.name not in dir(package) "
+                "or getattr(package, module.name).__name__ != f'{package.__name__}.{module.name}'"
+                "))",
+            ),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        self.assertListEqual(missing_modules, [])
+
     def test_holidays_base(self):
         for name in ("DateLike", "HolidayBase", "HolidaySum"):
             self.assertImport(name)
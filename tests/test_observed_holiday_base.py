@@ -10,11 +10,19 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import pickle
 from datetime import date
 from unittest import TestCase
 
-from holidays.calendars.gregorian import MON, SUN
-from holidays.observed_holiday_base import ObservedHolidayBase, ObservedRule
+from holidays.calendars.gregorian import MON, SAT, SUN
+from holidays.constants import PUBLIC
+from holidays.holiday_base import HolidayFlags
+from holidays.observed_holiday_base import (
+    ObservedHolidayBase,
+    ObservedRule,
+    SAT_SUN_TO_NEXT_WORKDAY,
+    TUE_TO_NONE,
+)
 
 
 class TestObservedHolidayBase(TestCase):
@@ -28,6 +36,94 @@ class TestObservedHolidayBase(TestCase):
         self.ohb.observed_label = "%s (Observed Label)"
         self.ohb._populate(2024)
 
+    def test_observed_rule_offsets(self):
+        rule = SAT_SUN_TO_NEXT_WORKDAY + TUE_TO_NONE + self.MON_TO_TUE
+        self.assertEqual(rule.offsets, (+1, None, 0, 0, 0, +7, +7))
+        self.assertEqual(ObservedRule().offsets, (0,) * 7)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled_rule = pickle.loads(pickle.dumps(rule, protocol))
+            self.assertIsInstance(unpickled_rule, ObservedRule)
+            self.assertEqual(unpickled_rule, rule)
+            self.assertEqual(unpickled_rule.offsets, rule.offsets)
+
+    def test_populate_observed(self):
+        self.ohb._observed_rule = SAT_SUN_TO_NEXT_WORKDAY + TUE_TO_NONE
+        dts = {
+            self.ohb._add_holiday("Holiday 1", date(2024, 5, 11)),
+            self.ohb._add_holiday("Holiday 2", self.SUNDAY),
+            self.ohb._add_holiday("Holiday 3", date(2024, 5, 15)),
+            self.ohb._add_holiday("Holiday 4", date(2024, 5, 21)),
+        }
+        self.ohb._populate_observed(dts)
+        self.assertEqual(
+            dict(self.ohb),
+            {
+                date(2024, 5, 11): "Holiday 1",
+                date(2024, 5, 12): "Holiday 2",
+                date(2024, 5, 13): "Holiday 1 (Observed Label)",
+                date(2024, 5, 14): "Holiday 2 (Observed Label)",
+                date(2024, 5, 15): "Holiday 3",
+            },
+        )
+
+        self.ohb.observed = False
+        self.ohb._populate_observed({self.ohb._add_holiday("Holiday 5", date(2024, 5, 25))})
+        self.assertNotIn(date(2024, 5, 27), self.ohb)
+
+    def test_observed_estimated_label(self):
+        self.ohb.estimated_label = "%s (estimated)"
+        self.ohb.observed_estimated_label = "%s (observed, estimated)"
+        self.ohb._observed_rule = SAT_SUN_TO_NEXT_WORKDAY
+        self.ohb._add_estimated_holiday("Holiday 1", date(2024, 5, 11))
+        self.ohb._add_holiday("Holiday 2 (estimated)", self.SUNDAY)
+        self.assertEqual(self.ohb._estimated_names, {"Holiday 1 (estimated)": "Holiday 1"})
+
+        self.ohb._populate_observed({date(2024, 5, 11), self.SUNDAY})
+        self.assertEqual(
+            dict(self.ohb),
+            {
+                date(2024, 5, 11): "Holiday 1 (estimated)",
+                date(2024, 5, 12): "Holiday 2 (estimated)",
+                date(2024, 5, 13): "Holiday 1 (observed, estimated)",
+                date(2024, 5, 14): "Holiday 2 (estimated) (Observed Label)",
+            },
+        )
+        self.assertEqual(
+            self.ohb.get_flags("2024-05-11"),
+            {"Holiday 1 (estimated)": HolidayFlags(PUBLIC, estimated=True)},
+        )
+        self.assertEqual(
+            self.ohb.get_flags("2024-05-13"),
+            {
+                "Holiday 1 (observed, estimated)": HolidayFlags(
+                    PUBLIC, estimated=True, observed=True
+                )
+            },
+        )
+        self.assertEqual(
+            self.ohb.get_flags("2024-05-14"),
+            {"Holiday 2 (estimated) (Observed Label)": HolidayFlags(PUBLIC, observed=True)},
+        )
+
+    def test_get_next_workday(self):
+        self.ohb._add_holiday("Test Holiday", date(2024, 5, 13))
+        self.ohb._add_holiday("Test Holiday", date(2024, 12, 31))
+        for dt, delta, expected in (
+            (self.SUNDAY, +1, date(2024, 5, 14)),
+            (self.SUNDAY, -1, date(2024, 5, 10)),
+            (date(2024, 5, 14), -1, date(2024, 5, 10)),
+            (date(2023, 12, 31), +1, date(2024, 1, 1)),
+            (date(2025, 1, 1), -1, date(2024, 12, 30)),
+            (date(2024, 12, 30), +1, date(2024, 12, 30)),
+            (date(2024, 1, 1), -1, date(2024, 1, 1)),
+            (date(2023, 12, 30), +1, date(2023, 12, 30)),
+            (date(2025, 1, 2), -1, date(2025, 1, 2)),
+        ):
+            self.assertEqual(self.ohb._get_next_workday(dt, delta), expected, dt)
+
+        self.ohb.weekend = {SAT}
+        self.assertEqual(self.ohb._get_next_workday(date(2024, 5, 10), +1), self.SUNDAY)
+
     def test_get_observed_date(self):
         self.assertIsNone(self.ohb._get_observed_date(self.SUNDAY, rule=self.SUN_TO_NONE))
 
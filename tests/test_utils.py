@@ -10,6 +10,7 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
+import pickle
 import unittest
 import warnings
 from collections import defaultdict
@@ -28,6 +29,7 @@ from holidays.utils import (
     country_holidays,
     CountryHoliday,
     financial_holidays,
+    HolidaysCache,
     list_localized_countries,
     list_localized_financial,
     list_long_breaks,
@@ -102,6 +104,114 @@ class TestFinancialHolidays(unittest.TestCase):
             financial_holidays("XNYS", subdiv="XXXX")
 
 
+class TestHolidaysCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = HolidaysCache(maxsize=10)
+
+    def test_cache_clear(self):
+        country_holidays("US", years=2024, cache=self.cache)
+        self.cache.cache_clear()
+        self.assertEqual(self.cache.cache_info(), (0, 0, 10, 0))
+
+    def test_cache_info(self):
+        country_holidays("US", years=(2023, 2024), cache=self.cache)
+        self.assertEqual(self.cache.cache_info(), (0, 2, 10, 2))
+
+        country_holidays("US", years=2024, cache=self.cache)
+        self.assertEqual(self.cache.cache_info(), (1, 2, 10, 2))
+
+        # Different configuration keys.
+        country_holidays("US", subdiv="CA", years=2024, cache=self.cache)
+        country_holidays("US", years=2024, observed=False, cache=self.cache)
+        country_holidays("US", years=2024, categories="unofficial", cache=self.cache)
+        financial_holidays("XNYS", years=2024, cache=self.cache)
+        self.assertEqual(self.cache.cache_info(), (1, 6, 10, 6))
+        self.assertEqual(len(self.cache), 6)
+
+    def test_eviction(self):
+        country_holidays("US", years=range(2000, 2010), cache=self.cache)
+        country_holidays("US", years=2000, cache=self.cache)  # Most recently used now.
+        country_holidays("US", years=2010, cache=self.cache)
+        self.assertEqual(self.cache.cache_info(), (1, 11, 10, 10))
+
+        country_holidays("US", years=2000, cache=self.cache)
+        self.assertEqual(self.cache.cache_info(), (2, 11, 10, 10))
+        country_holidays("US", years=2001, cache=self.cache)
+        self.assertEqual(self.cache.cache_info(), (2, 12, 10, 10))
+
+    def test_invalid_maxsize(self):
+        self.assertRaises(ValueError, lambda: HolidaysCache(maxsize=0))
+
+    def test_isolation(self):
+        h1 = country_holidays("US", years=2024, cache=self.cache)
+        h1["2024-12-25"] = "Custom holiday"
+        h1["2024-12-26"] = "Custom holiday"
+        h2 = country_holidays("US", years=2024, cache=self.cache)
+        self.assertEqual(h2["2024-12-25"], "Christmas Day")
+        self.assertNotIn("2024-12-26", h2)
+
+    def test_lazy_expansion(self):
+        h = country_holidays("US", cache=self.cache)
+        self.assertIn("2024-12-25", h)
+        self.assertIn("2025-01-01", h)
+        self.assertEqual(h.years, {2024, 2025})
+        self.assertEqual(self.cache.cache_info(), (0, 2, 10, 2))
+
+        h = financial_holidays("XNYS", cache=self.cache)
+        self.assertNotIn("2024-12-26", h)
+        self.assertEqual(self.cache.cache_info(), (0, 3, 10, 3))
+
+    def test_merge_existing_names(self):
+        h = country_holidays("US", expand=False, cache=self.cache)
+        h["2024-12-25"] = "Custom holiday"
+        h.years.add(2024)
+        h._populate_year(2024)
+        self.assertEqual(h["2024-12-25"], "Christmas Day; Custom holiday")
+
+    def test_pickle(self):
+        h = country_holidays("US", years=2024, cache=self.cache)
+        h_restored = pickle.loads(pickle.dumps(h))
+        self.assertEqual(h, h_restored)
+        self.assertIsNone(h_restored._years_cache)
+
+    def test_same_holidays(self):
+        cache = HolidaysCache()
+        for code, kwargs in (
+            ("DE", {"subdiv": "BY"}),
+            ("GB", {"subdiv": "SCT"}),
+            ("RU", {}),
+            ("UA", {"language": "en_US"}),
+            ("US", {"categories": ("government", "unofficial")}),
+        ):
+            with self.subTest(country=code):
+                years = range(1990, 2031)
+                h = country_holidays(code, years=years, **kwargs)
+                for _ in range(2):
+                    h_cached = country_holidays(code, years=years, cache=cache, **kwargs)
+                    self.assertEqual(h, h_cached)
+                    self.assertEqual(h.weekend_workdays, h_cached.weekend_workdays)
+                    self.assertEqual(h._holiday_flags, h_cached._holiday_flags)
+
+    def test_same_working_days(self):
+        cache = HolidaysCache()
+        for entity_func, entities in (
+            (country_holidays, list_supported_countries()),
+            (financial_holidays, list_supported_financial()),
+        ):
+            for code in entities:
+                with self.subTest(entity=code):
+                    h = entity_func(code, years=2021)
+                    h_cached = entity_func(code, years=2021, cache=cache)
+                    self.assertEqual(h.weekend_workdays, h_cached.weekend_workdays)
+                    for dt in sorted(h.weekend_workdays | {date(2011, 12, 31)}):
+                        self.assertEqual(h.is_working_day(dt), h_cached.is_working_day(dt))
+                    self.assertEqual(
+                        h.get_working_days_count("2010-01-01", "2022-12-31"),
+                        h_cached.get_working_days_count("2010-01-01", "2022-12-31"),
+                    )
+                    self.assertEqual(h.weekend_workdays, h_cached.weekend_workdays)
+
+
 class TestAllInSameYear(unittest.TestCase):
     """Ensure only holidays in the year(s) requested are returned."""
 
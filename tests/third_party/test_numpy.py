@@ -10,13 +10,16 @@
 #  Website: https://github.com/vacanza/holidays
 #  License: MIT (see LICENSE file)
 
-from unittest import TestCase
+import sys
+from datetime import date
+from unittest import TestCase, mock
 
 import numpy as np
 
 from holidays.countries.cambodia import Cambodia
 from holidays.countries.thailand import Thailand
 from holidays.countries.ukraine import Ukraine
+from holidays.countries.united_states import UnitedStates
 
 
 class TestNumpy(TestCase):
@@ -31,3 +34,54 @@ class TestNumpy(TestCase):
 
             # Test iterable.
             self.assertEqual(cls(years=np.arange(*years)).years, years_range)
+
+
+class TestVectorizedLookups(TestCase):
+    def setUp(self):
+        self.dates = np.arange("2023-12-20", "2024-01-10", dtype="datetime64[D]")
+        self.us = UnitedStates()
+
+    def test_get_names_array(self):
+        names = self.us.get_names_array(self.dates)
+        self.assertEqual(names.dtype, object)
+        self.assertEqual(
+            names.tolist(), [self.us.get(dt) for dt in self.dates.astype(date).tolist()]
+        )
+        self.assertEqual(
+            self.us.get_names_array(["2024-01-01", "NaT", "2024-01-02"], default="").tolist(),
+            ["New Year's Day", "", ""],
+        )
+        self.assertEqual(
+            UnitedStates(expand=False).get_names_array(self.dates).tolist(), [None] * 21
+        )
+
+    def test_is_holiday_array(self):
+        self.assertEqual(
+            self.us.is_holiday_array(self.dates).tolist(),
+            [dt in self.us for dt in self.dates.astype(date).tolist()],
+        )
+        self.assertEqual(
+            self.us.is_holiday_array([date(2024, 1, 1), None, date(2024, 1, 2)]).tolist(),
+            [True, False, False],
+        )
+        self.assertEqual(self.us.years, {2023, 2024})
+
+        us = UnitedStates(expand=False)
+        self.assertFalse(us.is_holiday_array(self.dates).any())
+        self.assertEqual(us.years, set())
+
+    def test_is_working_day_array(self):
+        dates = np.concatenate(
+            (self.dates, np.array(["2020-07-03", "NaT"], dtype="datetime64[D]"))
+        )
+        self.assertEqual(
+            self.us.is_working_day_array(dates.reshape(23, 1)).ravel().tolist(),
+            [self.us.is_working_day(dt) for dt in dates[:-1].astype(date).tolist()] + [False],
+        )
+        self.assertEqual(self.us.years, {2020, 2023, 2024})
+        self.assertEqual(self.us.is_working_day_array([]).tolist(), [])
+
+    def test_numpy_not_installed(self):
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaisesRegex(ImportError, r"pip install holidays\[numpy\]"):
+                self.us.is_holiday_array(self.dates)